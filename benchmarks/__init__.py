@@ -0,0 +1,5 @@
+"""Benchmarks for pyimgui_utils module
+
+Run a benchmark from the root folder, e.g.
+    python -m benchmarks.startup_time
+"""
@@ -0,0 +1,106 @@
+"""Shape rendering benchmark
+
+Measure the time to draw N squares per frame:
+- with examples.utils.draw_square, one glBegin/glEnd per square, against
+  ShapeBatch.render_gl, with the batch rebuilt on each frame or cached.
+  Requires a display, run with the pygame backend.
+- with one add_rect_filled per square against ShapeBatch.render_draw_list,
+  on the imgui background draw list. Run with the headless backend.
+
+    python -m benchmarks.shapes [frames]
+"""
+import sys
+import time
+from typing import Callable, Dict
+
+import imgui
+import numpy as np
+
+from examples.utils import draw_square
+from pyimgui_utils.backends import get_backend
+from pyimgui_utils.shapes import ShapeBatch
+
+_COUNTS = (100, 1_000, 10_000)
+
+
+def _time_frames(backend, frames: int, draw: Callable[[], None], finish: Callable[[], None]) -> float:
+    """Mean time of draw per frame in milliseconds."""
+    elapsed = 0.
+    for _ in range(frames):
+        backend.process_inputs()
+        imgui.new_frame()
+        start = time.perf_counter()
+        draw()
+        finish()
+        elapsed += time.perf_counter() - start
+        imgui.render()
+        backend.render()
+    return elapsed / frames * 1000
+
+
+def bench_gl(count: int, frames: int) -> Dict[str, float]:
+    import OpenGL.GL as gl
+
+    positions = np.random.uniform(-1., 1., (count, 2))
+    colors = np.random.rand(count, 3)
+    # draw_square draws squares of 0.4, in normalized device coordinates
+    batch = ShapeBatch()
+    batch.add_squares(positions, .4, colors)
+
+    def immediate() -> None:
+        for position, color in zip(positions, colors):
+            draw_square(position, color)
+
+    def rebuilt() -> None:
+        batch.clear()
+        batch.add_squares(positions, .4, colors)
+        batch.render_gl()
+
+    with get_backend("pygame") as backend:
+        return {
+            "draw_square": _time_frames(backend, frames, immediate, gl.glFinish),
+            "ShapeBatch rebuilt": _time_frames(backend, frames, rebuilt, gl.glFinish),
+            "ShapeBatch cached": _time_frames(backend, frames, batch.render_gl, gl.glFinish),
+        }
+
+
+def bench_draw_list(count: int, frames: int) -> Dict[str, float]:
+    positions = np.random.uniform(0., 800., (count, 2))
+    batch = ShapeBatch()
+    batch.add_squares(positions, 4., (1., 0., 0.))
+    color = 0xFF0000FF  # Opaque red, packed as by imgui.get_color_u32_rgba
+    rects = [(x - 2., y - 2., x + 2., y + 2.) for x, y in positions.tolist()]
+
+    def add_rect_filled() -> None:
+        draw_list = imgui.get_background_draw_list()
+        for x0, y0, x1, y1 in rects:
+            draw_list.add_rect_filled(x0, y0, x1, y1, color)
+
+    with get_backend("headless") as backend:
+        return {
+            "add_rect_filled": _time_frames(backend, frames, add_rect_filled, lambda: None),
+            "ShapeBatch": _time_frames(backend, frames, batch.render_draw_list, lambda: None),
+        }
+
+
+def _print(title: str, count: int, times: Dict[str, float]) -> None:
+    print(f"{title} {count:>6} squares: "
+          + ", ".join(f"{name} {value:7.2f} ms" for name, value in times.items()))
+
+
+def main():
+    frames = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+    for count in _COUNTS:
+        _print("draw list", count, bench_draw_list(count, frames))
+
+    for count in _COUNTS:
+        try:
+            times = bench_gl(count, frames)
+        except Exception as error:
+            print(f"OpenGL benchmark skipped: {error}")
+            return
+        _print("OpenGL   ", count, times)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""Shared memory bridge benchmark
+
+Measure the throughput of state updates sent by a simulation process to the
+UI process, through a pipe (pickled arrays and raw bytes) and through a
+SharedArray. Times include the start of the simulation process.
+
+Pipes deliver every update, the UI reading a SharedArray only sees the
+latest consistent state: the measures are the updates written per second
+by the simulation and the consistent reads per second done by the UI.
+
+    python -m benchmarks.shared_memory [updates]
+"""
+import multiprocessing
+import sys
+import time
+
+import numpy as np
+
+from pyimgui_utils.shared import SharedArray
+
+_SIZES = (8, 1_000, 100_000)
+
+
+def _send_pickled(conn, size: int, updates: int) -> None:
+    state = np.zeros(size)
+    for step in range(updates):
+        state[0] = step
+        conn.send(state)
+    conn.close()
+
+
+def _send_bytes(conn, size: int, updates: int) -> None:
+    state = np.zeros(size)
+    for step in range(updates):
+        state[0] = step
+        conn.send_bytes(state.tobytes())
+    conn.close()
+
+
+def _write_shared(name: str, size: int, updates: int) -> None:
+    shared = SharedArray(size, name=name, create=False)
+    state = np.zeros(size)
+    for step in range(updates):
+        state[0] = step
+        with shared.write() as values:
+            np.copyto(values, state)
+    shared.close()
+
+
+def bench_pipe(size: int, updates: int, raw: bool) -> float:
+    """Updates received per second through a pipe."""
+    receiver, sender = multiprocessing.Pipe(duplex=False)
+    process = multiprocessing.Process(target=_send_bytes if raw else _send_pickled,
+                                      args=(sender, size, updates))
+    start = time.perf_counter()
+    process.start()
+    for _ in range(updates):
+        if raw:
+            state = np.frombuffer(receiver.recv_bytes())
+        else:
+            state = receiver.recv()
+    elapsed = time.perf_counter() - start
+    process.join()
+    assert state[0] == updates - 1
+    return updates / elapsed
+
+
+def bench_shared(size: int, updates: int) -> tuple:
+    """Updates written and consistent reads per second through a SharedArray."""
+    with SharedArray(size) as state:
+        process = multiprocessing.Process(target=_write_shared,
+                                          args=(state.name, size, updates))
+        out = np.empty(size)
+        reads = 0
+        start = time.perf_counter()
+        process.start()
+        while state.sequence < 2 * updates:
+            state.read(out)
+            reads += 1
+        elapsed = time.perf_counter() - start
+        process.join()
+        assert state.read(out)[0] == updates - 1
+    return updates / elapsed, reads / elapsed
+
+
+def main():
+    updates = int(sys.argv[1]) if len(sys.argv) > 1 else 2_000
+    for size in _SIZES:
+        pickled = bench_pipe(size, updates, raw=False)
+        raw = bench_pipe(size, updates, raw=True)
+        written, read = bench_shared(size, updates)
+        print(f"{size:>7} values: "
+              f"pipe (pickle) {pickled:>9.0f} updates/s, "
+              f"pipe (bytes) {raw:>9.0f} updates/s, "
+              f"shared memory {written:>9.0f} updates/s ({read:.0f} reads/s)")
+
+
+if __name__ == "__main__":
+    main()
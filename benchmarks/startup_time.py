@@ -0,0 +1,72 @@
+"""Startup time benchmark
+
+Measure, for each backend, the time from the import of pyimgui_utils to the
+first rendered frame. Each measure runs in a fresh interpreter so that no
+module is already imported.
+
+    python -m benchmarks.startup_time [backend ...]
+"""
+import json
+import subprocess
+import sys
+from typing import Dict
+
+from pyimgui_utils.backends import available_backends
+
+_MEASURE = """
+import json, sys, time
+start = time.perf_counter()
+import pyimgui_utils
+from pyimgui_utils.backends import get_backend
+import_time = time.perf_counter() - start
+
+backend = get_backend({backend!r})
+backend_import_time = time.perf_counter() - start
+
+with backend:
+    setup_time = time.perf_counter() - start
+    runner = backend.runner(draw=lambda: None)
+    backend.background_functions.append(runner.stop)
+    runner.run()
+    first_frame_time = time.perf_counter() - start
+
+print(json.dumps({{
+    "import": import_time,
+    "backend import": backend_import_time,
+    "setup": setup_time,
+    "first frame": first_frame_time,
+    "heavy modules": [name for name in ("OpenGL", "pygame", "glfw", "numpy")
+                      if name in sys.modules],
+}}))
+"""
+
+
+def measure(backend: str) -> Dict:
+    """Measure startup times of backend in a new interpreter.
+
+    :param backend: Backend name
+    :return: Cumulative times in seconds since the import started
+    """
+    result = subprocess.run([sys.executable, "-c", _MEASURE.format(backend=backend)],
+                            capture_output=True, text=True)
+    if result.returncode != 0:
+        return {"error": result.stderr.strip().splitlines()[-1]}
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def main():
+    backends = sys.argv[1:] if len(sys.argv) > 1 else available_backends()
+    for backend in backends:
+        times = measure(backend)
+        if "error" in times:
+            print(f"{backend:>10}: failed ({times['error']})")
+            continue
+
+        print(f"{backend:>10}: "
+              + ", ".join(f"{step} {times[step] * 1000:.1f} ms"
+                          for step in ("import", "backend import", "setup", "first frame"))
+              + f", loaded {times['heavy modules']}")
+
+
+if __name__ == "__main__":
+    main()
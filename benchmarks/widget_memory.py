@@ -0,0 +1,85 @@
+"""Widget memory benchmark
+
+Measure the memory allocated per widget, for many widgets created with the
+same style as generated UIs do. Pass a git revision to compare with it, the
+revision is extracted in a temporary folder and measured in its own
+interpreter.
+
+    python -m benchmarks.widget_memory [revision]
+"""
+import json
+import subprocess
+import sys
+import tempfile
+from typing import Dict, Optional
+
+_COUNT = 10_000
+
+_MEASURE = """
+import gc, json, tracemalloc
+from pyimgui_utils import Button, DragButtons, MenuBar, MenuItem, NodeTree
+
+def noop():
+    pass
+
+factories = {{
+    "Button": lambda: Button("", btn_callback=noop,
+                             btn_color=(0.5, 0.0, 0.0),
+                             btn_color_hovered=(0.7, 0.0, 0.0),
+                             btn_color_active=(0.9, 0.0, 0.0),
+                             width=12, height=12),
+    "DragButtons": lambda: DragButtons(drag_min=0., drag_max=1.),
+    "NodeTree": lambda: NodeTree(),
+    "MenuItem": lambda: MenuItem(name="Item", action=noop, shortcut="Ctrl+O"),
+    "MenuBar": lambda: MenuBar(name="Menu"),
+}}
+
+result = {{}}
+tracemalloc.start()
+for name, factory in factories.items():
+    factory()  # Create shared objects, e.g. interned styles, beforehand
+    widgets = [None] * {count}
+    gc.collect()
+    start = tracemalloc.get_traced_memory()[0]
+    for index in range({count}):
+        widgets[index] = factory()
+    result[name] = (tracemalloc.get_traced_memory()[0] - start) / {count}
+    del widgets
+print(json.dumps(result))
+"""
+
+
+def measure(path: Optional[str] = None) -> Dict[str, float]:
+    """Bytes allocated per widget.
+
+    :param path: Folder containing pyimgui_utils, the current one if None
+    :return: Widget class names mapped to their size in bytes
+    """
+    result = subprocess.run([sys.executable, "-c", _MEASURE.format(count=_COUNT)],
+                            capture_output=True, text=True, cwd=path)
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.strip().splitlines()[-1])
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def measure_revision(revision: str) -> Dict[str, float]:
+    """Bytes allocated per widget by the code of a git revision."""
+    with tempfile.TemporaryDirectory() as path:
+        archive = subprocess.run(["git", "archive", revision, "pyimgui_utils"],
+                                 capture_output=True, check=True)
+        subprocess.run(["tar", "-x", "-C", path], input=archive.stdout, check=True)
+        return measure(path)
+
+
+def main():
+    current = measure()
+    before = measure_revision(sys.argv[1]) if len(sys.argv) > 1 else None
+    for name, size in current.items():
+        line = f"{name:>12}: {size:7.0f} bytes"
+        if before is not None and name in before:
+            line += f" ({sys.argv[1]}: {before[name]:7.0f} bytes, {size - before[name]:+.0f})"
+        print(line)
+
+
+if __name__ == "__main__":
+    main()
@@ -10,12 +10,10 @@ from abc import abstractmethod, ABC
 from dataclasses import dataclass
 from typing import Callable, Optional
 
-import OpenGL.GL as gl
 import imgui
-import pygame
 
-from examples.utils import setup_imgui_context
 from pyimgui_utils import BasicWindow
+from pyimgui_utils.backends import get_backend
 
 
 # ------------------------------------------------------------------------------
@@ -178,17 +176,7 @@ def main():
     wnds = [DummyWindow(name=f"Window {i}")
             for i in range(5)]
 
-    impl = setup_imgui_context()
-
-    should_stop_flag = False
-    while not should_stop_flag:
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                should_stop_flag = True
-            impl.process_event(event)
-        impl.process_inputs()
-        imgui.new_frame()
-
+    def draw() -> None:
         for wnd in wnds:
             is_wnd_focus = (wnd.get_id() == app_state.focus_window_id)
             if is_wnd_focus:
@@ -199,16 +187,10 @@ def main():
             if is_wnd_focus:
                 pop_focus_style()
 
-        gl.glClearColor(0.1, 0.2, 0.2, 1)
-        gl.glClear(gl.GL_COLOR_BUFFER_BIT)
-
         update_focus_state_end_loop()
-        imgui.render()
-        impl.render(imgui.get_draw_data())
-
-        pygame.display.flip()
 
-    impl.shutdown()
+    with get_backend("pygame") as backend:
+        backend.runner(draw=draw).run()
 
 
 if __name__ == "__main__":
@@ -3,13 +3,16 @@
 Just a window with the same digit layout them old phones.
 
 The purpose is to present a use-case where it can be
+
+The call button callback is a coroutine: the frame loop keeps running while
+the call is in progress and the button is held until it finishes.
 """
-import OpenGL.GL as gl
+import asyncio
+
 import imgui
-import pygame
 
-from examples.utils import setup_imgui_context
-from pyimgui_utils import BasicWindow, Button
+from pyimgui_utils import AsyncRunner, BasicWindow, Button
+from pyimgui_utils.backends import get_backend
 
 
 class DigitWindow(BasicWindow):
@@ -22,7 +25,8 @@ class DigitWindow(BasicWindow):
 
         It uses list comprehensions to creates the lines of buttons.
         The call button uses the hold feature of Button to display a different
-        color when you can't perform a call (no number typed).
+        color when you can't perform a call (no number typed) or while a call
+        is in progress.
         """
         flags = imgui.WINDOW_ALWAYS_AUTO_RESIZE
         super().__init__(
@@ -51,7 +55,8 @@ class DigitWindow(BasicWindow):
             btn_callback=self._call,
             btn_color=(0.0, 1.0, 0.0),  # Green
             hold_btn_color=(0.2, 0.2, 0.2),  # Grey, because you can't call
-            hold_condition=lambda: len(self.typed_input) == 0
+            hold_condition=lambda: len(self.typed_input) == 0,
+            hold_while_pending=True
         )
 
     def _type_char(self, char: str):
@@ -62,11 +67,15 @@ class DigitWindow(BasicWindow):
         """
         self.typed_input += char
 
-    def _call(self):
+    async def _call(self):
         """Mock a call
 
-        Reset the typed_input attribute of this window,
+        Wait as if a remote peer was dialed, then reset the typed_input
+        attribute of this window.
         """
+        if len(self.typed_input) == 0:
+            return
+        await asyncio.sleep(2.0)
         self.typed_input = ""
 
     def draw_content(self, *args, **kwargs) -> None:
@@ -78,30 +87,13 @@ class DigitWindow(BasicWindow):
 
 
 def main():
-    impl = setup_imgui_context()
     digit_window = DigitWindow()
 
-    should_stop_flag = False
-    while not should_stop_flag:
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                should_stop_flag = True
-            impl.process_event(event)
-        impl.process_inputs()
-
-        imgui.new_frame()
-
-        digit_window.draw()
-
-        gl.glClearColor(0.1, 0.2, 0.2, 1)
-        gl.glClear(gl.GL_COLOR_BUFFER_BIT)
-
-        imgui.render()
-        impl.render(imgui.get_draw_data())
-
-        pygame.display.flip()
-
-    impl.shutdown()
+    with get_backend("pygame") as backend:
+        runner = AsyncRunner(draw=digit_window.draw,
+                             process_inputs=backend.process_inputs,
+                             render=backend.render)
+        runner.run()
 
 
 if __name__ == "__main__":
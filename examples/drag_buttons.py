@@ -1,12 +1,11 @@
 from typing import Callable, List, Tuple
 
-import OpenGL.GL as gl
 import imgui
-import pygame
 from typing_extensions import override
 
-from examples.utils import draw_square, setup_imgui_context
 from pyimgui_utils import BasicWindow, DragButtons
+from pyimgui_utils.backends import get_backend
+from pyimgui_utils.shapes import ShapeBatch
 
 
 class SquarePositionWindow(BasicWindow):
@@ -50,8 +49,6 @@ class SquarePositionWindow(BasicWindow):
 
 
 def main():
-    impl = setup_imgui_context()
-
     square_position_1 = [0., 0.]
     square_position_2 = [0., 0.]
     square_position_3 = [0., 0.]
@@ -75,16 +72,7 @@ def main():
     # Create the SquarePositionWindow
     square_position_window = SquarePositionWindow()
 
-    should_stop_flag = False
-    while not should_stop_flag:
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                should_stop_flag = True
-            impl.process_event(event)
-        impl.process_inputs()
-
-        imgui.new_frame()
-
+    def draw() -> None:
         # Draw the window with position and setters as parameters
         square_position_window.draw(
             pos_setters=[
@@ -95,19 +83,26 @@ def main():
             format_table=format_table
         )
 
-        gl.glClearColor(0.3, 0.1, 0.1, 1)
-        gl.glClear(gl.GL_COLOR_BUFFER_BIT)
+    # Squares are batched and drawn in a single OpenGL call
+    batch = ShapeBatch()
 
-        draw_square(square_position_1, (1, 0, 0))
-        draw_square(square_position_2, (0, 1, 0))
-        draw_square(square_position_3, (0, 0, 1))
+    def draw_squares() -> None:
+        batch.clear()
+        batch.add_squares([square_position_1, square_position_2, square_position_3],
+                          .4, [(1, 0, 0), (0, 1, 0), (0, 0, 1)])
+        batch.render_gl()
 
-        imgui.render()
-        impl.render(imgui.get_draw_data())
+    with get_backend("pygame", clear_color=(0.3, 0.1, 0.1, 1)) as backend:
+        # Squares are drawn behind imgui windows
+        backend.background_functions.append(draw_squares)
 
-        pygame.display.flip()
+        # Only redraw when inputs are received
+        runner = backend.runner(draw=draw)
+        runner.run()
 
-    impl.shutdown()
+    print(f"{runner.stats.frames} frames rendered at {runner.stats.fps:.1f} "
+          f"fps, {runner.stats.frames_saved} frames saved, "
+          f"CPU usage {runner.stats.cpu_usage:.0%}")
 
 
 if __name__ == "__main__":
@@ -7,20 +7,22 @@ The dummy only contains text. The top bar contains the window title and 3
 buttons. The red one close the window. The 2 other only print their color.
 
 There is a menu bar that allow user to show to dummy window if it has been
-closed.
+closed. The menu item can also be triggered with its Ctrl+O shortcut or from
+the command palette (Ctrl+P).
 
 To spice things up, the buttons mock the style of the 'fruit trade' ones.
 """
 from typing import Callable
 
-import OpenGL.GL as gl
 import imgui
 import pygame
 from imgui import Vec2
 
-from examples.utils import setup_imgui_context
-from pyimgui_utils import BasicWindow, Button
+from pyimgui_utils import BasicWindow, Button, CommandPalette
+from pyimgui_utils.backends import get_backend
 from pyimgui_utils.interface import DrawableIT
+from pyimgui_utils.reactive import Computed, Observable
+from pyimgui_utils.style import Theme
 from pyimgui_utils.window import (WindowStack, WindowStackOrientation, MenuBar,
                                   MenuItem, MenuBarWindow)
 
@@ -84,25 +86,11 @@ class TopBarWindow(BasicWindow):
         # Adjust style
         # The purpose is to have 3 little round buttons.
         button_size = 12
-        self.before_begin_functions.append(
-            lambda: imgui.push_style_var(
-                imgui.STYLE_WINDOW_BORDERSIZE, 0.0
-            )
-        )   # Remove top bar border
-        self.before_begin_functions.append(
-            lambda: imgui.push_style_var(
-                imgui.STYLE_ITEM_SPACING, (5.0, 0.0)
-            )
-        )  # Reduce spacing between buttons
-        self.before_begin_functions.append(
-            lambda: imgui.push_style_var(
-                imgui.STYLE_FRAME_ROUNDING,
-                button_size / 2
-            )
-        )  # Make buttons round
-        self.after_end_functions.append(
-            lambda: imgui.pop_style_var(3)
-        )
+        self.add_theme(Theme(style_vars={
+            imgui.STYLE_WINDOW_BORDERSIZE: 0.0,  # Remove top bar border
+            imgui.STYLE_ITEM_SPACING: (5.0, 0.0),  # Reduce spacing between buttons
+            imgui.STYLE_FRAME_ROUNDING: button_size / 2,  # Make buttons round
+        }))
 
         # Define 3 buttons
         self.red_btn = Button("",
@@ -188,60 +176,52 @@ class DummyWindowWithTopBar(DrawableIT):
 
 
 def main():
-    impl = setup_imgui_context()
-
-    # Define a flag to track dummy window status
-    dummy_window_opened_flag = True
-
-    # Create the menu bar
-    open_dummy_window = MenuItem(name="Open dummy window")
-    open_dummy_window.enabled = not dummy_window_opened_flag
-
-    def show_dummy_window():
-        """Show the window and disable the menu item entry"""
-        nonlocal dummy_window_opened_flag
-        dummy_window_opened_flag = True
-        open_dummy_window.enabled = False
-
-    def hide_dummy_window():
-        """Hide the window and enable the menu item entry"""
-        nonlocal dummy_window_opened_flag
-        dummy_window_opened_flag = False
-        open_dummy_window.enabled = True
-
-    open_dummy_window.action = show_dummy_window
+    # The menu item is enabled while the dummy window is closed
+    dummy_window_opened = Observable(True)
+    open_dummy_window = MenuItem(
+        name="Open dummy window",
+        action=lambda: dummy_window_opened.set(True),
+        shortcut="Ctrl+O",
+        enabled=Computed(lambda: not dummy_window_opened.value)
+    )
 
     menu_bar = MenuBar(name="View", menu_items=[open_dummy_window])
     menu_bar_window = MenuBarWindow(menu_bars=[menu_bar])
 
+    # The command palette searches every menu item of the menu bar window
+    command_palette = CommandPalette(menu_bar_window=menu_bar_window)
+    menu_bar_window.add_menu_bar(
+        MenuBar(name="Tools",
+                menu_items=[MenuItem(name="Command palette",
+                                     action=command_palette.open,
+                                     shortcut="Ctrl+P")])
+    )
+
     # Instantiate the dummy window with top bar
     dummy_window_with_top_bar = DummyWindowWithTopBar(
-        close_function=hide_dummy_window
+        close_function=lambda: dummy_window_opened.set(False)
     )
 
-    should_stop_flag = False
-    while not should_stop_flag:
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                should_stop_flag = True
-            impl.process_event(event)
-        impl.process_inputs()
+    def on_event(event: pygame.event.Event) -> None:
+        if event.type == pygame.KEYDOWN:
+            # Menu shortcuts work even if the menu is closed
+            menu_bar_window.dispatch_shortcut(
+                pygame.key.name(event.key),
+                ctrl=bool(event.mod & pygame.KMOD_CTRL),
+                shift=bool(event.mod & pygame.KMOD_SHIFT),
+                alt=bool(event.mod & pygame.KMOD_ALT),
+                super_=bool(event.mod & pygame.KMOD_META)
+            )
 
-        imgui.new_frame()
+    def draw() -> None:
         menu_bar_window.draw()
-        if dummy_window_opened_flag:
-            # The dummy should be drawn as its flag is set to true
+        command_palette.draw()
+        if dummy_window_opened.value:
             dummy_window_with_top_bar.draw()
 
-        gl.glClearColor(0.1, 0.2, 0.2, 1)
-        gl.glClear(gl.GL_COLOR_BUFFER_BIT)
-
-        imgui.render()
-        impl.render(imgui.get_draw_data())
-
-        pygame.display.flip()
-
-    impl.shutdown()
+    with get_backend("pygame") as backend:
+        backend.event_handlers.append(on_event)
+        backend.runner(draw=draw).run()
 
 
 if __name__ == "__main__":
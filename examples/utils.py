@@ -1,31 +1,7 @@
-from typing import Any, Tuple
+from typing import Tuple
 
 import OpenGL.GL as gl
-import imgui
 import numpy as np
-import pygame
-from imgui.integrations.glfw import GlfwRenderer
-from imgui.integrations.pygame import PygameRenderer
-
-
-def setup_imgui_context() -> [GlfwRenderer, Any, Any]:
-    """Set up an imgui context with pygame.
-
-    Strongly inspired from pygame integration example of pyimgui repo.
-    https://github.com/pyimgui/pyimgui/blob/master/doc/examples/integrations_pygame.py
-    """
-    pygame.init()
-    size = 800, 600
-
-    pygame.display.set_mode(size, pygame.DOUBLEBUF | pygame.OPENGL | pygame.RESIZABLE)
-
-    imgui.create_context()
-    impl = PygameRenderer()
-
-    io = imgui.get_io()
-    io.display_size = size
-    io.ini_file_name = None
-    return impl
 
 
 def draw_square(position, color: Tuple[int, int, int] = None):
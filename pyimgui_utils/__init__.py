@@ -5,5 +5,16 @@ ImGui elements (windows, buttons, node trees ...).
 """
 
 from .window import (ImGuiWindowAbstract, BasicWindow,
-                     MenuBar, MenuItem, MenuBarWindow)
+                     MenuBar, MenuItem, MenuBarWindow, MenuProvider)
 from .component import DragButtons, NodeTree, Button
+from .palette import Command, CommandPalette
+from .runner import AsyncRunner, FrameRunner
+from .scheduler import FrameScheduler, Job
+from .callback import CallbackDispatcher, DispatchMode
+from .channel import StateChannel
+from .reactive import Observable, Computed
+from .style import Theme, StyleStack
+from .log import LogWindow
+from .tooltip import TooltipProvider
+from .selector import VirtualCombo, VirtualListBox
+from .filetree import FileTree
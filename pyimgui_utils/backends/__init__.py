@@ -0,0 +1,43 @@
+"""Rendering backends
+
+A backend creates the window, the imgui context and the renderer. Backends
+are imported only when selected, so an application does not pay the import
+time of OpenGL, pygame or GLFW when it does not use them.
+
+e.g.
+    with get_backend("pygame", title="My app") as backend:
+        backend.runner(draw=my_window.draw).run()
+"""
+import importlib
+from typing import Dict, Tuple
+
+from pyimgui_utils.backends.base import Backend
+
+# Backend name -> (module, class name)
+_BACKENDS: Dict[str, Tuple[str, str]] = {
+    "pygame": ("pyimgui_utils.backends.pygame_backend", "PygameBackend"),
+    "glfw": ("pyimgui_utils.backends.glfw_backend", "GlfwBackend"),
+    "headless": ("pyimgui_utils.backends.headless_backend", "HeadlessBackend"),
+}
+
+
+def available_backends() -> Tuple[str, ...]:
+    """Names accepted by get_backend."""
+    return tuple(_BACKENDS)
+
+
+def get_backend(name: str, *args, **kwargs) -> Backend:
+    """Import and instantiate a backend.
+
+    :param name: One of available_backends()
+    :param args: Positional arguments of the backend constructor
+    :param kwargs: Keyword arguments of the backend constructor
+    :return: The backend, not set up yet
+    """
+    if name not in _BACKENDS:
+        raise ValueError(f"Unknown backend '{name}', "
+                         f"expected one of {available_backends()}!")
+
+    module_name, class_name = _BACKENDS[name]
+    backend_cls = getattr(importlib.import_module(module_name), class_name)
+    return backend_cls(*args, **kwargs)
@@ -0,0 +1,108 @@
+import time
+from abc import ABC, abstractmethod
+from typing import Callable, List, Optional, Tuple
+
+from pyimgui_utils.runner import FrameRunner
+
+
+class Backend(ABC):
+    """Window, imgui context and renderer of an application.
+
+    Use it as a context manager to safely set up and shut down the backend.
+    Functions in background_functions are called after the frame buffer is
+    cleared and before imgui draw data is rendered, e.g. to draw OpenGL
+    content behind imgui windows.
+    """
+
+    def __init__(self,
+                 width: int = 800,
+                 height: int = 600,
+                 title: str = "pyimgui_utils",
+                 clear_color: Tuple[float, float, float, float] = (0.1, 0.2, 0.2, 1.)):
+        """
+        :param width: Width of the window
+        :param height: Height of the window
+        :param title: Title of the window
+        :param clear_color: Background RGBA color
+        """
+        self.width = width
+        self.height = height
+        self.title = title
+        self.clear_color = clear_color
+        self.background_functions: List[Callable[[], None]] = []
+
+    def __enter__(self) -> "Backend":
+        self.setup()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.shutdown()
+
+    @abstractmethod
+    def setup(self) -> None:
+        """Create the window, the imgui context and the renderer."""
+        pass
+
+    @abstractmethod
+    def process_inputs(self) -> bool:
+        """Feed window events to imgui.
+
+        :return: False if the window should close, True otherwise
+        """
+        pass
+
+    @abstractmethod
+    def render(self) -> None:
+        """Render imgui draw data, call after imgui.render."""
+        pass
+
+    @abstractmethod
+    def shutdown(self) -> None:
+        """Release the renderer, the imgui context and the window."""
+        pass
+
+    def wait_events(self, timeout: Optional[float]) -> bool:
+        """Block until an event arrives or timeout seconds elapsed.
+
+        The default implementation cannot detect events and never idles.
+
+        :param timeout: Maximum waiting time in seconds, None to wait forever
+        :return: True if an event arrived
+        """
+        return True
+
+    def wake(self) -> None:
+        """Interrupt wait_events from any thread."""
+        pass
+
+    def runner(self, draw: Callable[[], None], **kwargs) -> FrameRunner:
+        """Create a FrameRunner driven by this backend.
+
+        :param draw: Function drawing widgets
+        :param kwargs: Other FrameRunner arguments
+        """
+        return FrameRunner(draw=draw,
+                           process_inputs=self.process_inputs,
+                           render=self.render,
+                           wait_events=self.wait_events,
+                           wake=self.wake,
+                           **kwargs)
+
+    def _render_background(self) -> None:
+        for func in self.background_functions:
+            func()
+
+
+def _wait_with_timeout(wait: Callable[[], None],
+                       wait_timeout: Callable[[float], None],
+                       timeout: Optional[float]) -> bool:
+    """Call a backend wait function that does not tell whether an event
+    arrived, guess it from the elapsed time.
+    """
+    if timeout is None:
+        wait()
+        return True
+
+    start = time.perf_counter()
+    wait_timeout(timeout)
+    return time.perf_counter() - start < timeout * 0.95
@@ -0,0 +1,79 @@
+from typing import Optional
+
+import OpenGL.GL as gl
+import glfw
+import imgui
+from imgui.integrations.glfw import GlfwRenderer
+from typing_extensions import override
+
+from pyimgui_utils.backends.base import Backend, _wait_with_timeout
+
+
+class GlfwBackend(Backend):
+    """GLFW window with an OpenGL 3.3 core profile context.
+
+    Strongly inspired from the tests in pyimgui repo.
+    Repo link: https://github.com/pyimgui/pyimgui/
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.impl: Optional[GlfwRenderer] = None
+        self.window = None
+        self.context = None
+
+    @override
+    def setup(self) -> None:
+        if not glfw.init():
+            raise RuntimeError("Could not initialize OpenGL context")
+
+        # OS X supports only forward-compatible core profiles from 3.2
+        glfw.window_hint(glfw.CONTEXT_VERSION_MAJOR, 3)
+        glfw.window_hint(glfw.CONTEXT_VERSION_MINOR, 3)
+        glfw.window_hint(glfw.OPENGL_PROFILE, glfw.OPENGL_CORE_PROFILE)
+        glfw.window_hint(glfw.OPENGL_FORWARD_COMPAT, gl.GL_TRUE)
+
+        self.window = glfw.create_window(self.width, self.height, self.title,
+                                         None, None)
+        if not self.window:
+            glfw.terminate()
+            raise RuntimeError("Could not initialize Window")
+
+        glfw.make_context_current(self.window)
+
+        self.context = imgui.create_context()
+        self.impl = GlfwRenderer(self.window)
+        self.impl.io.ini_file_name = None
+
+    @override
+    def process_inputs(self) -> bool:
+        glfw.poll_events()
+        self.impl.process_inputs()
+        return not glfw.window_should_close(self.window)
+
+    @override
+    def render(self) -> None:
+        gl.glClearColor(*self.clear_color)
+        gl.glClear(gl.GL_COLOR_BUFFER_BIT)
+        self._render_background()
+        self.impl.render(imgui.get_draw_data())
+        glfw.swap_buffers(self.window)
+
+    @override
+    def shutdown(self) -> None:
+        if self.impl is not None:
+            self.impl.shutdown()
+            self.impl = None
+        glfw.terminate()
+        if self.context is not None:
+            imgui.destroy_context(self.context)
+            self.context = None
+
+    @override
+    def wait_events(self, timeout: Optional[float]) -> bool:
+        return _wait_with_timeout(glfw.wait_events, glfw.wait_events_timeout,
+                                  timeout)
+
+    @override
+    def wake(self) -> None:
+        glfw.post_empty_event()
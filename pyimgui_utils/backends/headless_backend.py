@@ -0,0 +1,49 @@
+import time
+from typing import Optional
+
+import imgui
+from typing_extensions import override
+
+from pyimgui_utils.backends.base import Backend
+
+
+class HeadlessBackend(Backend):
+    """Backend without window nor renderer.
+
+    Frames are built by imgui and discarded, useful for tests, benchmarks
+    and CI machines without display.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.context = None
+        self.should_close = False
+
+    @override
+    def setup(self) -> None:
+        self.context = imgui.create_context()
+        io = imgui.get_io()
+        io.display_size = self.width, self.height
+        io.ini_file_name = None
+        io.delta_time = 1. / 60.
+        io.fonts.get_tex_data_as_rgba32()  # Build the font atlas
+
+    @override
+    def process_inputs(self) -> bool:
+        return not self.should_close
+
+    @override
+    def render(self) -> None:
+        self._render_background()
+
+    @override
+    def shutdown(self) -> None:
+        if self.context is not None:
+            imgui.destroy_context(self.context)
+            self.context = None
+
+    @override
+    def wait_events(self, timeout: Optional[float]) -> bool:
+        if timeout is not None:
+            time.sleep(timeout)
+        return False
@@ -0,0 +1,94 @@
+from typing import Optional
+
+import OpenGL.GL as gl
+import imgui
+import pygame
+from imgui.integrations.pygame import PygameRenderer
+from typing_extensions import override
+
+from pyimgui_utils.backends.base import Backend
+
+
+class PygameBackend(Backend):
+    """Pygame window with an OpenGL context.
+
+    Strongly inspired from pygame integration example of pyimgui repo.
+    https://github.com/pyimgui/pyimgui/blob/master/doc/examples/integrations_pygame.py
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.impl: Optional[PygameRenderer] = None
+        self.context = None
+        self.event_handlers = []  # Functions called with each pygame event
+        self._waited_event = None  # Event consumed by wait_events, processed first
+
+    @override
+    def setup(self) -> None:
+        pygame.init()
+        size = self.width, self.height
+        pygame.display.set_mode(size, pygame.DOUBLEBUF | pygame.OPENGL | pygame.RESIZABLE)
+        pygame.display.set_caption(self.title)
+
+        self.context = imgui.create_context()
+        self.impl = PygameRenderer()
+
+        io = imgui.get_io()
+        io.display_size = size
+        io.ini_file_name = None
+
+    @override
+    def process_inputs(self) -> bool:
+        should_continue = True
+        events = pygame.event.get()
+        if self._waited_event is not None:
+            events.insert(0, self._waited_event)
+            self._waited_event = None
+        for event in events:
+            if event.type == pygame.QUIT:
+                should_continue = False
+            for handler in self.event_handlers:
+                handler(event)
+            self.impl.process_event(event)
+        self.impl.process_inputs()
+        return should_continue
+
+    @override
+    def render(self) -> None:
+        gl.glClearColor(*self.clear_color)
+        gl.glClear(gl.GL_COLOR_BUFFER_BIT)
+        self._render_background()
+        self.impl.render(imgui.get_draw_data())
+        pygame.display.flip()
+
+    @override
+    def shutdown(self) -> None:
+        if self.impl is not None:
+            self.impl.shutdown()
+            self.impl = None
+        if self.context is not None:
+            imgui.destroy_context(self.context)
+            self.context = None
+        pygame.quit()
+
+    @override
+    def wait_events(self, timeout: Optional[float]) -> bool:
+        if self._waited_event is not None:
+            return True
+        if timeout is None:
+            event = pygame.event.wait()
+        elif timeout * 1000 < 1:
+            return pygame.event.peek()
+        else:
+            event = pygame.event.wait(int(timeout * 1000))
+
+        if event.type == pygame.NOEVENT:
+            return False
+
+        # Posting it back would put it behind the queued events
+        self._waited_event = event
+        return True
+
+    @override
+    def wake(self) -> None:
+        pygame.event.post(pygame.event.Event(pygame.USEREVENT))
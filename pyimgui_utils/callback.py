@@ -0,0 +1,234 @@
+"""Widget callbacks
+
+Call widget callbacks and keep track of the ones still in flight.
+A callback returning an awaitable, e.g. a coroutine function, is scheduled
+as a task on the running event loop instead of blocking the frame.
+
+Callbacks can also be handed to a CallbackDispatcher which runs them after
+imgui.render or in a thread pool, out of the middle of the frame.
+"""
+import inspect
+import logging
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Callable, Deque, Dict, Hashable, Optional, Set, Tuple
+
+_log = logging.getLogger(__name__)
+
+
+@dataclass
+class DispatchMode:
+    DEFERRED = 0  # Run queued callbacks in CallbackDispatcher.flush
+    THREAD_POOL = 1  # Run callbacks in worker threads
+
+
+@dataclass
+class DispatcherStats:
+    submitted: int = 0
+    completed: int = 0
+    failed: int = 0
+    total_latency: float = 0.  # Sum of the time spent in queue, in seconds
+    max_latency: float = 0.
+
+    @property
+    def mean_latency(self) -> float:
+        """Mean time between submission and execution start, in seconds."""
+        started = self.completed + self.failed
+        return self.total_latency / started if started > 0 else 0.
+
+
+class CallbackDispatcher:
+
+    def __init__(self,
+                 mode: int = DispatchMode.DEFERRED,
+                 max_workers: int = 4):
+        """Callback dispatcher
+
+        Queue widget callbacks during the frame instead of calling them
+        inline, between pushed styles and IDs. Call flush once per frame,
+        after imgui.render: deferred callbacks run there, and completions of
+        thread pool callbacks are reported back to the widgets from there,
+        on the UI thread. Exceptions are logged and never reach the frame.
+
+        :param mode: DispatchMode.DEFERRED or DispatchMode.THREAD_POOL
+        :param max_workers: Number of worker threads in THREAD_POOL mode
+        """
+        if mode not in (DispatchMode.DEFERRED, DispatchMode.THREAD_POOL):
+            raise ValueError("Invalid dispatch mode!")
+
+        self.mode = mode
+        self.stats = DispatcherStats()
+        self._stats_lock = threading.Lock()
+        self._queue: Deque[Tuple[float, Callable[..., Any], tuple, dict,
+                                 Callable[[Any], None]]] = deque()
+        self._finished: Deque[Tuple[Callable[[Any], None], Any]] = deque()
+        self._executor = None
+        if mode == DispatchMode.THREAD_POOL:
+            from concurrent.futures import ThreadPoolExecutor  # Slow import
+            self._executor = ThreadPoolExecutor(max_workers=max_workers)
+
+    @property
+    def pending_count(self) -> int:
+        """Number of submitted callbacks whose completion is not reported."""
+        with self._stats_lock:
+            return self.stats.submitted - self.stats.completed - self.stats.failed \
+                + len(self._finished)
+
+    def submit(self,
+               callback: Callable[..., Any],
+               args: tuple = (),
+               kwargs: Optional[dict] = None,
+               on_done: Optional[Callable[[Any], None]] = None) -> None:
+        """Queue a callback.
+
+        :param callback: Function to call
+        :param args: Positional arguments of the callback
+        :param kwargs: Keyword arguments of the callback
+        :param on_done: Called from flush, on the UI thread, with the result of
+                        the callback (None if it failed)
+        """
+        job = (time.perf_counter(), callback, args,
+               {} if kwargs is None else kwargs,
+               (lambda result: None) if on_done is None else on_done)
+        with self._stats_lock:
+            self.stats.submitted += 1
+
+        if self._executor is not None:
+            self._executor.submit(self._run_job, job)
+        else:
+            self._queue.append(job)
+
+    def flush(self) -> int:
+        """Run deferred callbacks and report finished ones.
+
+        Callbacks queued during flush are run on the next flush.
+
+        :return: Number of reported callbacks
+        """
+        for _ in range(len(self._queue)):
+            self._run_job(self._queue.popleft())
+
+        reported = 0
+        while self._finished:
+            on_done, result = self._finished.popleft()
+            on_done(result)
+            reported += 1
+        return reported
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop worker threads."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=wait)
+
+    def _run_job(self, job) -> None:
+        submit_time, callback, args, kwargs, on_done = job
+        latency = time.perf_counter() - submit_time
+        try:
+            result = callback(*args, **kwargs)
+            failed = False
+        except Exception:
+            _log.exception("Callback failed")
+            result = None
+            failed = True
+
+        with self._stats_lock:
+            self.stats.total_latency += latency
+            self.stats.max_latency = max(self.stats.max_latency, latency)
+            if failed:
+                self.stats.failed += 1
+            else:
+                self.stats.completed += 1
+            self._finished.append((on_done, result))
+
+
+class CallbackTracker:
+
+    __slots__ = ("dispatcher", "_pending")  # One tracker per widget
+
+    def __init__(self, dispatcher: Optional[CallbackDispatcher] = None):
+        """Callback tracker
+
+        Widgets call their callbacks through a tracker. Synchronous callbacks
+        are called inline, or handed to the dispatcher if any, while
+        coroutines are scheduled on the running event loop (see AsyncRunner).
+        The tracker counts in-flight calls per key so a widget can tell
+        whether one of its callbacks is pending.
+
+        :param dispatcher: Optional dispatcher running the callbacks
+        """
+        self.dispatcher = dispatcher
+        self._pending: Optional[Dict[Hashable, Set[Any]]] = None  # Created on first tracked call
+
+    def is_pending(self, key: Hashable = None) -> bool:
+        """True if a call made with key has not finished yet."""
+        return self._pending is not None and key in self._pending
+
+    @property
+    def pending_count(self) -> int:
+        if self._pending is None:
+            return 0
+        return sum(len(calls) for calls in self._pending.values())
+
+    def call(self,
+             callback: Callable[..., Any],
+             args: tuple = (),
+             kwargs: Optional[dict] = None,
+             key: Hashable = None) -> None:
+        """Call callback, schedule it if it returns an awaitable.
+
+        :param callback: Function or coroutine function to call
+        :param args: Positional arguments of the callback
+        :param kwargs: Keyword arguments of the callback
+        :param key: Key used to track the call, e.g. a menu item id
+        """
+        if self.dispatcher is None:
+            self._handle_result(key, callback(*args, **({} if kwargs is None else kwargs)))
+            return
+
+        token = object()
+        self._track(key, token)
+        self.dispatcher.submit(
+            callback, args, kwargs,
+            on_done=lambda result: self._on_dispatched(key, token, result)
+        )
+
+    def _on_dispatched(self, key: Hashable, token: object, result: Any) -> None:
+        self._untrack(key, token)
+        self._handle_result(key, result)
+
+    def _handle_result(self, key: Hashable, result: Any) -> None:
+        if not inspect.isawaitable(result):
+            return
+
+        import asyncio  # Slow import, only needed by coroutine callbacks
+        try:
+            task = asyncio.ensure_future(result, loop=asyncio.get_running_loop())
+        except RuntimeError:
+            if inspect.iscoroutine(result):
+                result.close()  # Avoid the "never awaited" warning
+            raise RuntimeError("Coroutine callbacks require a running event "
+                               "loop, e.g. draw widgets from AsyncRunner!")
+
+        self._track(key, task)
+        task.add_done_callback(lambda done_task: self._on_done(key, done_task))
+
+    def _track(self, key: Hashable, call: Any) -> None:
+        if self._pending is None:
+            self._pending = {}
+        self._pending.setdefault(key, set()).add(call)
+
+    def _untrack(self, key: Hashable, call: Any) -> None:
+        if self._pending is None:
+            return
+        calls = self._pending.get(key)
+        if calls is not None:
+            calls.discard(call)
+            if not calls:
+                del self._pending[key]
+
+    def _on_done(self, key: Hashable, task) -> None:
+        self._untrack(key, task)
+        if not task.cancelled() and task.exception() is not None:
+            _log.error("Callback failed", exc_info=task.exception())
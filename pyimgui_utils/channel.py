@@ -0,0 +1,136 @@
+"""State channel
+
+Share state between worker threads and the UI thread without holding locks
+across the frame.
+"""
+import threading
+from collections import deque
+from typing import Any, Callable, Deque, Dict, Generic, List, Optional, Tuple, TypeVar
+
+import imgui
+
+T = TypeVar("T")
+
+
+class StateChannel(Generic[T]):
+
+    def __init__(self, initial: Optional[T] = None):
+        """State channel
+
+        Producers publish snapshots with publish. The UI thread swaps in the
+        latest snapshot with acquire, at most once per frame, so every widget
+        reading the channel during a frame sees the same snapshot. Snapshots
+        must not be mutated once published: publish immutable objects or
+        copies (e.g. tuple(values), array.copy()).
+
+        Values set from the UI (e.g. by DragButtons) are queued for producers,
+        which consume them with drain. Until a snapshot published after the
+        drain is acquired, the UI sees its own values over the snapshot so
+        dragged values do not jump back.
+
+        The UI side relies on single reference assignments and deque
+        append/popleft, which are atomic in CPython: it never takes a lock.
+        Producers take a lock in publish only, so concurrent publishes get
+        distinct versions.
+
+        :param initial: Initial snapshot
+        """
+        self._latest: Tuple[int, int, Optional[T]] = (0, 0, initial)  # version, drained seq, snapshot
+        self._version = 0
+        self._publish_lock = threading.Lock()  # Serializes producers, the UI thread never takes it
+        self._frame_time = -1.
+        self._snapshot: Optional[T] = initial
+        self._view: Optional[T] = initial
+
+        self._updates: Deque[Tuple[int, Any, Any]] = deque()
+        self._update_seq = 0
+        self._drained_seq = 0
+        self._overrides: Dict[Any, Tuple[int, Any]] = {}
+        self._setters: List[Callable[[Any], None]] = []
+
+    # -- Producer side --
+
+    def publish(self, snapshot: T) -> None:
+        """Publish a new snapshot. Can be called from any thread.
+
+        :param snapshot: Immutable state, or a copy the producer won't mutate
+        """
+        with self._publish_lock:
+            self._latest = (self._latest[0] + 1, self._drained_seq, snapshot)
+
+    def drain(self) -> List[Tuple[Any, Any]]:
+        """Consume the values set from the UI, oldest first.
+
+        Call it from the producer thread, apply the values to the state then
+        publish a new snapshot.
+
+        :return: List of (key, value) tuples, e.g. (index, value)
+        """
+        updates = []
+        while True:
+            try:
+                seq, key, value = self._updates.popleft()
+            except IndexError:
+                break
+            updates.append((key, value))
+            self._drained_seq = seq
+        return updates
+
+    # -- UI side --
+
+    @property
+    def snapshot(self) -> Optional[T]:
+        """Snapshot acquired for the current frame, without UI overrides."""
+        return self._snapshot
+
+    def acquire(self) -> Optional[T]:
+        """Swap in the latest snapshot, once per frame.
+
+        Must be called from the UI thread, within a frame.
+
+        :return: The snapshot of the current frame, with the values set
+                 from the UI and not consumed yet
+        """
+        frame_time = imgui.get_time()
+        if frame_time != self._frame_time:
+            self._frame_time = frame_time
+            self._swap()
+        return self._view
+
+    def set(self, key: Any, value: Any) -> None:
+        """Set a value from the UI thread and queue it for producers.
+
+        :param key: Key of the value, e.g. an index in the snapshot
+        :param value: New value
+        """
+        self._update_seq += 1
+        self._overrides[key] = (self._update_seq, value)
+        self._updates.append((self._update_seq, key, value))
+        self._view = self._apply_overrides(self._snapshot)
+
+    def setters(self, count: int) -> List[Callable[[Any], None]]:
+        """Setters of the count first indexes, cached between frames."""
+        while len(self._setters) < count:
+            self._setters.append(lambda value, index=len(self._setters): self.set(index, value))
+        return self._setters[:count]
+
+    def _swap(self) -> None:
+        version, drained_seq, snapshot = self._latest
+        if version == self._version:
+            return
+
+        self._version = version
+        self._snapshot = snapshot
+        # Values consumed before the snapshot was published are part of it
+        self._overrides = {key: override for key, override in self._overrides.items()
+                           if override[0] > drained_seq}
+        self._view = self._apply_overrides(snapshot)
+
+    def _apply_overrides(self, snapshot: Optional[T]) -> Optional[T]:
+        if not self._overrides or snapshot is None:
+            return snapshot
+
+        view = dict(snapshot) if isinstance(snapshot, dict) else list(snapshot)
+        for key, (_, value) in self._overrides.items():
+            view[key] = value
+        return view
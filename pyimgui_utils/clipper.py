@@ -0,0 +1,93 @@
+"""List clipper
+
+pyimgui 2.0 does not wrap ImGuiListClipper. This module provides a pure
+python equivalent to only submit the visible items of a long list of
+evenly spaced items.
+"""
+from typing import Iterator, Optional, Tuple
+
+import imgui
+
+
+class ListClipper:
+
+    def __init__(self,
+                 items_count: int,
+                 items_height: Optional[float] = None):
+        """List clipper
+
+        Compute the range of visible items from the scroll position of the
+        current window and move the cursor over the hidden ones, so the
+        scrollbar keeps the size of the whole list.
+
+        e.g.
+            for i in ListClipper(len(lines)):
+                imgui.text(lines[i])
+
+        :param items_count: Number of items in the list
+        :param items_height: Height of one item, text line height with
+                             spacing if None
+        """
+        if items_count < 0:
+            raise ValueError("items_count must be positive!")
+
+        self.items_count = items_count
+        self.items_height = items_height
+        self.display_start = 0
+        self.display_end = 0
+        self._start_pos_y = 0.0
+
+    def begin(self) -> Tuple[int, int]:
+        """Compute the visible range and move the cursor at its beginning.
+
+        :return: display_start and display_end, display_end excluded.
+        """
+        if self.items_height is None:
+            self.items_height = imgui.get_text_line_height_with_spacing()
+
+        self._start_pos_y = imgui.get_cursor_pos_y()
+        self.display_start, self.display_end = visible_range(
+            items_count=self.items_count,
+            items_height=self.items_height,
+            start_pos_y=self._start_pos_y,
+            scroll_y=imgui.get_scroll_y(),
+            window_height=imgui.get_window_height()
+        )
+        imgui.set_cursor_pos_y(self._start_pos_y
+                               + self.display_start * self.items_height)
+        return self.display_start, self.display_end
+
+    def end(self) -> None:
+        """Move the cursor after the last item of the list."""
+        imgui.set_cursor_pos_y(self._start_pos_y
+                               + self.items_count * self.items_height)
+
+    def __iter__(self) -> Iterator[int]:
+        start, end = self.begin()
+        yield from range(start, end)
+        self.end()
+
+
+def visible_range(items_count: int,
+                  items_height: float,
+                  start_pos_y: float,
+                  scroll_y: float,
+                  window_height: float) -> Tuple[int, int]:
+    """Range of items intersecting the visible part of the window.
+
+    :param items_count: Number of items in the list
+    :param items_height: Height of one item
+    :param start_pos_y: Cursor position of the first item, in window
+                        coordinates
+    :param scroll_y: Vertical scroll of the window
+    :param window_height: Height of the window
+    :return: First visible item and last visible item + 1
+    """
+    if items_count == 0 or items_height <= 0:
+        return 0, items_count
+
+    start = int((scroll_y - start_pos_y) // items_height)
+    end = int((scroll_y + window_height - start_pos_y) // items_height) + 1
+    start = min(max(start, 0), items_count)
+    end = min(max(end, start), items_count)
+    return start, end
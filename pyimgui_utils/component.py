@@ -1,42 +1,97 @@
-from typing import Union, Callable, Tuple, Optional, List, Any
+from typing import Union, Callable, Tuple, Optional, List, Any, Dict
 
 import imgui
 
+from pyimgui_utils.callback import CallbackDispatcher, CallbackTracker
+from pyimgui_utils.channel import StateChannel
 from pyimgui_utils.interface import DrawableIT
+from pyimgui_utils.reactive import Observable
+from pyimgui_utils.style import ButtonStyle, style_stack
+from pyimgui_utils.text import text_metrics
+from pyimgui_utils.tooltip import TooltipProvider
 
 
 class DragButtons(DrawableIT):
 
+    __slots__ = ("_btn_width", "_drag_min", "_drag_max", "_drag_speed", "_title",
+                 "_auto_width", "_callbacks")
+
     def __init__(self,
                  drag_min: Union[float, int],
                  drag_max: Union[float, int],
                  drag_speed: Union[float, int] = 1.0,
                  btn_width: Union[int, float] = 220,
-                 title: Optional[str] = None):
+                 title: Optional[str] = None,
+                 auto_width: bool = False,
+                 dispatcher: Optional[CallbackDispatcher] = None):
         """DragButton row.
 
         Facilitate build of drag buttons row creation.
+        Setters can be coroutine functions when drawn from AsyncRunner.
         :param drag_min:   drag buttons min value
         :param drag_max:   drag buttons max value.
         :param drag_speed: drag buttons speed
         :param btn_width:  drag buttons width
         :param title:      Optional drag button title
+        :param auto_width: Share the available width between the buttons, once the title width
+                           is removed, so titles of stacked rows are right aligned. btn_width is ignored
+        :param dispatcher: Optional dispatcher running the setters out of the frame
         """
         self._btn_width = btn_width
         self._drag_min = drag_min
         self._drag_max = drag_max
         self._drag_speed = drag_speed
         self._title = None if title is not None and title == "" else title
+        self._auto_width = auto_width
+        self._callbacks = CallbackTracker(dispatcher)
+
+    def is_pending(self, setter: Union[Callable[[Union[float, int]], Any], Observable]) -> bool:
+        """True if a coroutine or dispatched setter call has not finished yet.
+
+        :param setter: The setter, or the observable drawn without setters
+        """
+        return self._callbacks.is_pending(id(setter))
 
     def draw(self,
-             values: Union[List[float], List[int]],
-             setters: List[Callable[[Union[float, int]], None]],
+             values: Union[List[float], List[int], List[Observable], StateChannel],
+             setters: Optional[List[Callable[[Union[float, int]], None]]] = None,
              format_table: Optional[List[str]] = None):
+        """Draw drag buttons.
+
+        :param values: Values to display, observable values, or a
+                       StateChannel whose snapshot is a sequence of values
+        :param setters: One setter per value. Defaults to the channel setters
+                        when values is a StateChannel, and to the observable
+                        set methods when values are observables
+        :param format_table: Optional format of each value
+        """
+        # IDs of the arguments, stable across channel snapshots
+        values_id, setters_id = id(values), id(setters)
+        setter_keys = None
+        if isinstance(values, StateChannel):
+            channel = values
+            values = channel.acquire()
+            if values is None:
+                return  # Nothing published yet
+            if setters is None:
+                setters = channel.setters(len(values))
+        elif len(values) > 0 and isinstance(values[0], Observable):
+            observables = values
+            values = [observable.value for observable in observables]
+            if setters is None:
+                setters = [observable.set for observable in observables]
+                setter_keys = observables  # Bound methods are new objects on each frame
+        if setters is None:
+            raise TypeError("setters are required unless values is a StateChannel or observables!")
+        if setter_keys is None:
+            setter_keys = setters
+
         btn_nb = len(setters)
+        btn_width = self._calc_btn_width(btn_nb) if self._auto_width else self._btn_width
         for i in range(btn_nb):
-            btn_id = f"{id(self)}{i}{id(values)}{id(setters)}{id(format_table)}"
+            btn_id = f"{id(self)}{i}{values_id}{setters_id}{id(format_table)}"
             imgui.push_id(btn_id)
-            imgui.set_next_item_width(self._btn_width)
+            imgui.set_next_item_width(btn_width)
 
             if format_table is not None:
                 changed, value = imgui.drag_float("",
@@ -56,7 +111,7 @@ class DragButtons(DrawableIT):
             imgui.pop_id()
 
             if changed:
-                setters[i](value)
+                self._callbacks.call(setters[i], (value,), key=id(setter_keys[i]))
 
             if i + 1 >= btn_nb and self._title is not None:
                 imgui.same_line()
@@ -65,101 +120,189 @@ class DragButtons(DrawableIT):
             else:
                 imgui.same_line()
 
+    def _calc_btn_width(self, btn_nb: int) -> float:
+        """Width of each button to fill the available width."""
+        spacing = imgui.get_style().item_spacing.x
+        available = imgui.get_content_region_available_width() - spacing * (btn_nb - 1)
+        if self._title is not None:
+            available -= spacing + text_metrics.text_width(self._title, False)
+        return max(available / max(btn_nb, 1), 1.)
+
 
 class Button(DrawableIT):
 
+    __slots__ = ("_label", "_btn_callback", "_hold_condition", "_style",
+                 "_auto_width", "_hold_while_pending", "_callbacks", "_tooltip")
+
     def __init__(self,
                  label: str,
-                 btn_callback: Callable[..., None],
+                 btn_callback: Callable[..., Any],
                  btn_color: Optional[Tuple[float, float, float]] = None,
                  btn_color_hovered: Optional[Tuple[float, float, float]] = None,
                  btn_color_active: Optional[Tuple[float, float, float]] = None,
-                 hold_condition: Optional[Callable[..., bool]] = None,
+                 hold_condition: Union[Callable[..., bool], Observable[bool], None] = None,
                  hold_btn_color: Optional[Tuple[float, float, float]] = None,
                  hold_btn_color_hovered: Optional[Tuple[float, float, float]] = None,
                  hold_btn_color_active: Optional[Tuple[float, float, float]] = None,
                  width: Optional[int] = 0,
-                 height: Optional[int] = 0):
+                 height: Optional[int] = 0,
+                 auto_width: bool = False,
+                 hold_while_pending: bool = False,
+                 dispatcher: Optional[CallbackDispatcher] = None,
+                 tooltip: Optional[TooltipProvider] = None):
         """Advance imgui button
         It embeds more features than classic imgui button. For instance, it is possible to hold the button color.
 
         :param label:                  Displayed name of the button
-        :param btn_callback:           Callback function when button is pressed
+        :param btn_callback:           Callback function when button is pressed. It can be a coroutine
+                                       function when the button is drawn from AsyncRunner
         :param hold_condition:         Callable function that return true if the button needs to be held,
-                                       false otherwise
+                                       false otherwise. It can be an observable, e.g. a Computed, which is
+                                       only recomputed when its inputs change
         :param hold_btn_color:         A tuple corresponding to the rgb color tuple when button is held
         :param hold_btn_color_hovered: a tuple corresponding to the rgb color tuple when button is held and hovered
         :param hold_btn_color_active:  a tuple corresponding to the rgb color tuple when button is held and active
         :param width:                  Width of the button
         :param height:                 Height of the button
+        :param auto_width:             Fit the width to the label, measured once and cached. width is then the
+                                       minimum width, e.g. to draw grids of buttons with the same width
+        :param hold_while_pending:     Hold the button while a coroutine or dispatched callback is in flight,
+                                       clicks are then ignored so the callback is not started twice
+        :param dispatcher:             Optional dispatcher running the callback out of the frame
+        :param tooltip:                Optional tooltip shown when the button is hovered, its provider is
+                                       called with the arguments of the callback and memoized per button
         """
 
         self._label = label
         self._btn_callback = btn_callback
         self._hold_condition = hold_condition
-        self._hold_btn_color = [0.5, 0.5, 0.5] if hold_btn_color is None else hold_btn_color
-
-        if hold_btn_color_hovered is None:
-            self._hold_btn_color_hovered = self._hold_btn_color
-        else:
-            self._hold_btn_color_hovered = hold_btn_color_hovered
-
-        if hold_btn_color_active is None:
-            self._hold_btn_color_active = self._hold_btn_color
-        else:
-            self._hold_btn_color_active = hold_btn_color_active
-
-        self._btn_color = btn_color
-
-        if btn_color_hovered is None:
-            self._btn_color_hovered = self._btn_color
-        else:
-            self._btn_color_hovered = btn_color_hovered
-
-        if btn_color_active is None:
-            self._btn_color_active = self._btn_color
-        else:
-            self._btn_color_active = btn_color_active
-
-        self._width = width
-        self._height = height
+        self._style = ButtonStyle(color=btn_color,
+                                  color_hovered=btn_color_hovered,
+                                  color_active=btn_color_active,
+                                  hold_color=hold_btn_color,
+                                  hold_color_hovered=hold_btn_color_hovered,
+                                  hold_color_active=hold_btn_color_active,
+                                  width=width,
+                                  height=height)
+        self._auto_width = auto_width
+        self._hold_while_pending = hold_while_pending
+        self._callbacks = CallbackTracker(dispatcher)
+        self._tooltip = tooltip
+
+    # Colors and size are stored in the shared style flyweight
+
+    @property
+    def _btn_color(self) -> Optional[Tuple[float, float, float]]:
+        return self._style.color
+
+    @property
+    def _btn_color_hovered(self) -> Optional[Tuple[float, float, float]]:
+        return self._style.color_hovered
+
+    @property
+    def _btn_color_active(self) -> Optional[Tuple[float, float, float]]:
+        return self._style.color_active
+
+    @property
+    def _hold_btn_color(self) -> Tuple[float, float, float]:
+        return self._style.hold_color
+
+    @property
+    def _hold_btn_color_hovered(self) -> Tuple[float, float, float]:
+        return self._style.hold_color_hovered
+
+    @property
+    def _hold_btn_color_active(self) -> Tuple[float, float, float]:
+        return self._style.hold_color_active
+
+    @property
+    def _width(self) -> float:
+        return self._style.width
+
+    @property
+    def _height(self) -> float:
+        return self._style.height
+
+    @property
+    def pending(self) -> bool:
+        """True if a coroutine or dispatched callback has not finished yet."""
+        return self._callbacks.is_pending()
+
+    def calc_width(self) -> float:
+        """Width of the button once drawn, the label size is cached."""
+        if not self._auto_width and self._style.width > 0:
+            return self._style.width
+
+        label_width = text_metrics.text_width(self._label) + 2 * imgui.get_style().frame_padding.x
+        return max(self._style.width, label_width)
 
     def draw(self, *args, **kwargs) -> None:
         """Draw button."""
-        btn_color_flag = self._btn_color is not None
-        if btn_color_flag:
-            imgui.push_style_color(imgui.COLOR_BUTTON, *self._btn_color, 1.0)
-            imgui.push_style_color(imgui.COLOR_BUTTON_HOVERED, *self._btn_color_hovered, 1.0)
-            imgui.push_style_color(imgui.COLOR_BUTTON_ACTIVE, *self._btn_color_active, 1.0)
-
-        hold_flag = self._hold_condition(*args, **kwargs) if self._hold_condition is not None else False
-
-        if hold_flag:
-            imgui.push_style_color(imgui.COLOR_BUTTON, *self._hold_btn_color, 1.0)
-            imgui.push_style_color(imgui.COLOR_BUTTON_HOVERED, *self._hold_btn_color_hovered, 1.0)
-            imgui.push_style_color(imgui.COLOR_BUTTON_ACTIVE, *self._hold_btn_color_active, 1.0)
-
-        imgui.push_id(f"{id(self)}")
-        if imgui.button(self._label, self._width, self._height):
-            self._btn_callback(*args, **kwargs)
-        imgui.pop_id()
-
-        if hold_flag:
-            imgui.pop_style_color(3)  # both neutral, hovered and active button color styles.
-        if btn_color_flag:
-            imgui.pop_style_color(3)  # both neutral, hovered and active button color styles.
+        style = self._style
+        # The style stack is global: restore it even if a callback raises
+        depth = style_stack.depth
+        try:
+            if style.theme is not None:
+                style_stack.push(style.theme)
+
+            if self._hold_condition is None:
+                hold_flag = False
+            elif isinstance(self._hold_condition, Observable):
+                hold_flag = self._hold_condition.value
+            else:
+                hold_flag = self._hold_condition(*args, **kwargs)
+            held_by_callback = self._hold_while_pending and self.pending
+            hold_flag = hold_flag or held_by_callback
+
+            if hold_flag:
+                style_stack.push(style.hold_theme)
+
+            imgui.push_id(f"{id(self)}")
+            try:
+                width = self.calc_width() if self._auto_width else style.width
+                if imgui.button(self._label, width, style.height) and not held_by_callback:
+                    self._callbacks.call(self._btn_callback, args, kwargs)
+                if self._tooltip is not None:
+                    self._tooltip.draw(*args, item=self)
+            finally:
+                imgui.pop_id()
+        finally:
+            style_stack.pop_to(depth)
 
 
 class NodeTree(DrawableIT):
 
+    __slots__ = ("_btns", "_tree_child_offset", "_auto_width", "_sort_key", "_sort_reverse",
+                 "_sort_generation", "_orders", "_previous_orders", "_tooltip")
+
     def __init__(self,
                  btns: List[Union[Button]] = None,  # todo: do not force use of Button component
-                 tree_child_offset: Optional[int] = 10):
+                 tree_child_offset: Optional[int] = 10,
+                 auto_width: bool = False,
+                 sort_key: Optional[Callable[[Any], Any]] = None,
+                 sort_reverse: bool = False,
+                 tooltip: Optional[TooltipProvider] = None):
         """Node tree
         Draw a node tree with optional buttons on the left side.
 
+        With a sort_key, the elements of each level are drawn sorted. The
+        order of a level is cached with the children it was computed from,
+        and computed again only when the children change: a new list, e.g.
+        from get_children=lambda path: sorted(os.listdir(path)), is compared
+        to the cached one. Lists mutated in place without a length change
+        must be signaled with invalidate_order. Changing the sort key
+        does not sort anything: each level is sorted again the next time it
+        is drawn, so closed levels are never sorted. Only the orders of the
+        levels drawn by the last draw are kept.
+
         :param btns: List of Buttons (from this module)
         :param tree_child_offset: Custom offset of the tree (default 10)
+        :param auto_width: Draw the buttons on the right side of each row, right aligned from their
+                           cached widths
+        :param sort_key: Optional function to call on elements, the key they are sorted by
+        :param sort_reverse: True to sort in descending order
+        :param tooltip: Optional tooltip shown when a row is hovered, its provider is called
+                        with the element of the row
         """
         if btns is not None:
             if (not isinstance(btns, list)
@@ -175,29 +318,111 @@ class NodeTree(DrawableIT):
             raise TypeError("tree_child_offset must be an int!")
 
         self._tree_child_offset = tree_child_offset
+        self._auto_width = auto_width
+        self._sort_key = sort_key
+        self._sort_reverse = sort_reverse
+        self._tooltip = tooltip
+        self._sort_generation = 0  # Incremented when the order changes, outdating the cached orders
+        # Id of the parent element (None for the top level) -> children, their length,
+        # generation and sorted children. Filled by draw, with the orders of the levels it
+        # draws, taken from the orders of the previous draw when they are still valid
+        self._orders: Optional[Dict[Optional[int], Tuple[Any, int, int, List]]] = None
+        self._previous_orders: Optional[Dict[Optional[int], Tuple[Any, int, int, List]]] = None
+
+    @property
+    def sort_key(self) -> Optional[Callable[[Any], Any]]:
+        return self._sort_key
+
+    @property
+    def sort_reverse(self) -> bool:
+        return self._sort_reverse
+
+    def set_sort(self, sort_key: Optional[Callable[[Any], Any]], reverse: bool = False) -> None:
+        """Change the order of elements, levels are sorted again when drawn.
+
+        :param sort_key: Function to call on elements, the key they are sorted by, None to keep
+                         the order of get_children
+        :param reverse: True to sort in descending order
+        """
+        self._sort_key = sort_key
+        self._sort_reverse = reverse
+        self._sort_generation += 1
+        if sort_key is None:
+            self._orders = self._previous_orders = None
+
+    def invalidate_order(self, el: Any = None) -> None:
+        """Sort the children of el again when drawn, every level if el is None."""
+        for orders in (self._orders, self._previous_orders):
+            if orders is None:
+                continue
+            if el is None:
+                orders.clear()
+            else:
+                orders.pop(id(el), None)
+
+    @staticmethod
+    def _same_children(cached: Any, children: Any) -> bool:
+        """True if a new children list has the elements of the cached one."""
+        try:
+            return bool(cached == children)
+        except (TypeError, ValueError):
+            return False  # e.g. elements compared element-wise like numpy arrays
+
+    def _ordered(self, parent_id: Optional[int], children: Any) -> Any:
+        """Children sorted by the sort key, cached per parent element."""
+        if self._sort_key is None or self._orders is None:
+            return children
+
+        cached = self._orders.get(parent_id)
+        if cached is None and self._previous_orders is not None:
+            cached = self._previous_orders.get(parent_id)
+        if (cached is not None and cached[1] == len(children) and cached[2] == self._sort_generation
+                and (cached[0] is children or self._same_children(cached[0], children))):
+            self._orders[parent_id] = cached  # Kept while the level is drawn
+            return cached[3]
+
+        ordered = sorted(children, key=self._sort_key, reverse=self._sort_reverse)
+        self._orders[parent_id] = (children, len(children), self._sort_generation, ordered)
+        return ordered
 
     def draw(self,
-             elements: List,
+             elements: Union[List, StateChannel],
              get_children: Callable[[Any], Any],
-             get_name: Callable[[Any], str]) -> None:
+             get_name: Callable[[Any], str],
+             is_leaf: Optional[Callable[[Any], bool]] = None) -> None:
         """Draw the node tree with elements list.
 
-        :param elements: list of elements represented a node tree
+        :param elements: list of elements represented a node tree, or a
+                         StateChannel whose snapshot is such a list
         :param get_children: Function to call on elements to get their children
         :param get_name: Function to call on elements to get their displayed name
+        :param is_leaf: Optional function to call on elements, True to draw them
+                        without arrow, get_children is then not called
         """
-
-        self._display_node_tree(elements=elements,
-                                get_children=get_children,
-                                get_name=get_name,
-                                btn_cur_pos=imgui.get_cursor_pos_x())
+        if isinstance(elements, StateChannel):
+            elements = elements.acquire()
+            if elements is None:
+                return  # Nothing published yet
+
+        if self._sort_key is not None:
+            # Orders of the levels not drawn this time are dropped
+            self._previous_orders, self._orders = self._orders, {}
+        try:
+            self._display_node_tree(elements=self._ordered(None, elements),
+                                    get_children=get_children,
+                                    get_name=get_name,
+                                    btn_cur_pos=imgui.get_cursor_pos_x(),
+                                    is_leaf=is_leaf)
+        finally:
+            self._previous_orders = None
 
     def _display_node_tree(self,
                            elements: List,
                            get_children: Callable[[Any], Any],
                            get_name: Callable[[Any], str],
                            btn_cur_pos: float,
-                           offset: float = 0) -> None:
+                           offset: float = 0,
+                           is_leaf: Optional[Callable[[Any], bool]] = None) -> None:
         """This is a recursive method that display the tree node.
 
         :param elements: list of elements to display
@@ -205,10 +430,11 @@ class NodeTree(DrawableIT):
         :param get_name: Function to call on elements to get their displayed name
         :param btn_cur_pos: The button position.
         :param offset: Offset of tree levels.
+        :param is_leaf: Optional function to call on elements, True if they have no children
         """
 
-        if not isinstance(elements, list):
-            raise TypeError("elements must be a list!")
+        if not isinstance(elements, (list, tuple)):
+            raise TypeError("elements must be a list or a tuple!")
 
         if not isinstance(btn_cur_pos, float):
             raise TypeError("btn_cur_pos must be a float!")
@@ -223,7 +449,7 @@ class NodeTree(DrawableIT):
 
             imgui.set_cursor_pos_x(btn_cur_pos)  # Draw each button at the same position
 
-            if self._btns is not None:
+            if self._btns is not None and not self._auto_width:
                 for btn in self._btns:
                     imgui.push_id(f"{id(el)}{id(btn)}")
                     btn.draw(el)
@@ -234,13 +460,36 @@ class NodeTree(DrawableIT):
             imgui.set_cursor_pos_x(tree_input_cursor_position)  # Put the cursor back it tree level position
 
             imgui.push_id(f"{id(el)}")
-            if imgui.tree_node(get_name(el)):
+            leaf = is_leaf is not None and is_leaf(el)
+            opened = imgui.tree_node(get_name(el), imgui.TREE_NODE_LEAF if leaf else 0)
+            if self._tooltip is not None:
+                self._tooltip.draw(el)
+            if self._btns is not None and self._auto_width:
+                self._draw_right_aligned_buttons(el)
+
+            if opened and leaf:
+                imgui.tree_pop()
+            elif opened:
                 display_tree_offset = self._tree_child_offset
                 self._display_node_tree(
-                    elements=get_children(el),
+                    elements=self._ordered(id(el), get_children(el)),
                     get_children=get_children,
                     get_name=get_name,
                     btn_cur_pos=btn_cur_pos,
-                    offset=offset + display_tree_offset)
+                    offset=offset + display_tree_offset,
+                    is_leaf=is_leaf)
                 imgui.tree_pop()
             imgui.pop_id()
+
+    def _draw_right_aligned_buttons(self, el: Any) -> None:
+        """Draw the buttons of el on the current row, against the right edge."""
+        spacing = imgui.get_style().item_spacing.x
+        width = sum(btn.calc_width() for btn in self._btns) + spacing * (len(self._btns) - 1)
+        imgui.same_line(imgui.get_window_content_region_max().x - width)
+
+        for i, btn in enumerate(self._btns):
+            if i > 0:
+                imgui.same_line()
+            imgui.push_id(f"{id(el)}{id(btn)}")
+            btn.draw(el)
+            imgui.pop_id()
@@ -0,0 +1,233 @@
+"""File tree
+
+Browse a directory tree with NodeTree, listing directories in worker
+threads and caching the listings until the directories change.
+"""
+import os
+import stat
+import time
+from array import array
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, List, Optional
+
+import imgui
+
+from pyimgui_utils.component import Button, NodeTree
+from pyimgui_utils.interface import DrawableIT
+
+
+class _Listing:
+    """Entries of a directory, sorted once: directories first, then by name.
+
+    Stat data is stored in arrays, one item per entry, instead of one
+    os.stat_result per entry.
+    """
+
+    __slots__ = ("path", "mtime_ns", "names", "is_dirs", "sizes", "mtimes", "error", "nodes",
+                 "visible_nodes")
+
+    def __init__(self, path: str, mtime_ns: int):
+        self.path = path
+        self.mtime_ns = mtime_ns  # Modification time of the directory when listed
+        self.names: List[str] = []
+        self.is_dirs = bytearray()
+        self.sizes = array("Q")
+        self.mtimes = array("d")
+        self.error: Optional[OSError] = None
+        self.nodes: List["FileNode"] = []  # Created on the UI thread
+        self.visible_nodes: List["FileNode"] = []  # Nodes not hidden by a leading dot
+
+
+def _scan(path: str) -> _Listing:
+    """List a directory and stat its entries, run in a worker thread."""
+    try:
+        mtime_ns = os.stat(path).st_mtime_ns
+        with os.scandir(path) as scanner:
+            entries = list(scanner)
+    except OSError as error:
+        listing = _Listing(path, -1)
+        listing.error = error
+        return listing
+
+    rows = []
+    for entry in entries:
+        try:
+            entry_stat = entry.stat()
+            is_dir = stat.S_ISDIR(entry_stat.st_mode)
+            rows.append((not is_dir, entry.name.lower(), entry.name, is_dir,
+                         entry_stat.st_size, entry_stat.st_mtime))
+        except OSError:
+            # Broken link or entry removed since the listing
+            rows.append((True, entry.name.lower(), entry.name, False, 0, 0.))
+    rows.sort()
+
+    listing = _Listing(path, mtime_ns)
+    listing.names = [row[2] for row in rows]
+    listing.is_dirs = bytearray(row[3] for row in rows)
+    listing.sizes = array("Q", (row[4] for row in rows))
+    listing.mtimes = array("d", (row[5] for row in rows))
+    return listing
+
+
+def _check(path: str, mtime_ns: int) -> Optional[_Listing]:
+    """List a directory again if its modification time changed."""
+    try:
+        if os.stat(path).st_mtime_ns == mtime_ns:
+            return None
+    except OSError:
+        pass
+    return _scan(path)
+
+
+class FileNode:
+    """Entry of a FileTree, passed to the NodeTree buttons.
+
+    Nodes keep their identity when their directory is listed again, so the
+    open state of the tree is kept.
+    """
+
+    __slots__ = ("path", "name", "_listing", "_index")
+
+    def __init__(self, path: str, name: str, listing: Optional[_Listing], index: int):
+        self.path = path
+        self.name = name
+        self._listing = listing
+        self._index = index
+
+    @property
+    def is_dir(self) -> bool:
+        return self._listing is None or bool(self._listing.is_dirs[self._index])
+
+    @property
+    def size(self) -> int:
+        return 0 if self._listing is None else self._listing.sizes[self._index]
+
+    @property
+    def mtime(self) -> float:
+        return 0. if self._listing is None else self._listing.mtimes[self._index]
+
+
+class FileTree(DrawableIT):
+
+    def __init__(self,
+                 root: str,
+                 btns: Optional[List[Button]] = None,
+                 auto_width: bool = False,
+                 max_workers: int = 4,
+                 recheck_interval: float = 1.,
+                 max_checks_per_frame: int = 8,
+                 show_hidden: bool = False):
+        """Directory tree
+
+        Directories are listed with os.scandir in a thread pool, the first
+        time they are opened. Entries are stat-ed in the same worker task
+        and sorted once per listing. Until a listing is ready, the directory
+        is drawn empty.
+
+        Listings are cached with the modification time of their directory.
+        Only the directories drawn open are checked again, in the thread
+        pool, at most once per recheck_interval seconds each and at most
+        max_checks_per_frame per frame; a directory is listed again only if
+        its modification time changed.
+
+        e.g.
+            tree = FileTree(".", btns=[Button("Open", btn_callback=lambda node: print(node.path))])
+
+        :param root: Path of the root directory, its entries are drawn at the first level
+        :param btns: Buttons drawn on each row, called with the FileNode
+        :param auto_width: Right align buttons, see NodeTree
+        :param max_workers: Number of worker threads
+        :param recheck_interval: Minimum time between two checks of a directory, in seconds
+        :param max_checks_per_frame: Maximum number of directories checked per frame
+        :param show_hidden: True to draw entries starting with a dot
+        """
+        self.root = FileNode(os.path.abspath(root), os.path.basename(root), None, 0)
+        self.recheck_interval = recheck_interval
+        self.max_checks_per_frame = max_checks_per_frame
+        self.show_hidden = show_hidden
+        self._tree = NodeTree(btns=btns, auto_width=auto_width)
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="FileTree")
+        self._listings: Dict[str, _Listing] = {}
+        self._tasks: Dict[str, Future] = {}
+        self._checked: Dict[str, float] = {}  # Time of the last check of each directory
+        self._frame_time = -1.
+        self._checks = 0  # Checks started during the current frame
+
+    def close(self) -> None:
+        """Stop the worker threads, pending listings are dropped."""
+        self._executor.shutdown(wait=False)
+
+    def invalidate(self, path: Optional[str] = None) -> None:
+        """Drop the listing of a directory, every listing if None."""
+        if path is None:
+            self._listings.clear()
+            self._checked.clear()
+        else:
+            self._listings.pop(os.path.abspath(path), None)
+            self._checked.pop(os.path.abspath(path), None)
+
+    def listing(self, node: FileNode) -> Optional[_Listing]:
+        """Cached listing of a directory, None until the worker is done."""
+        self._collect(node.path)
+        return self._listings.get(node.path)
+
+    def get_children(self, node: FileNode) -> List[FileNode]:
+        """Cached entries of a directory, listed or checked in the background."""
+        self._collect(node.path)
+        listing = self._listings.get(node.path)
+        if listing is None:
+            self._submit(node.path, _scan, node.path)
+            return []
+
+        frame_time = imgui.get_time()
+        if frame_time != self._frame_time:
+            self._frame_time = frame_time
+            self._checks = 0
+        if (self._checks < self.max_checks_per_frame
+                and time.monotonic() - self._checked.get(node.path, 0.) >= self.recheck_interval):
+            if self._submit(node.path, _check, node.path, listing.mtime_ns):
+                self._checks += 1
+
+        return listing.nodes if self.show_hidden else listing.visible_nodes
+
+    def draw(self, *args, **kwargs) -> None:
+        """Draw the entries of the root directory."""
+        self._tree.draw(elements=self.get_children(self.root),
+                        get_children=self.get_children,
+                        get_name=lambda node: node.name,
+                        is_leaf=lambda node: not node.is_dir)
+
+    def _submit(self, path: str, function, *args) -> bool:
+        """Run function in the pool, unless a task of path is running."""
+        if path in self._tasks:
+            return False
+        self._tasks[path] = self._executor.submit(function, *args)
+        return True
+
+    def _collect(self, path: str) -> None:
+        """Store the result of the finished task of path."""
+        task = self._tasks.get(path)
+        if task is None or not task.done():
+            return
+        del self._tasks[path]
+        self._checked[path] = time.monotonic()
+
+        listing = task.result()
+        if listing is not None:
+            self._set_listing(listing)
+
+    def _set_listing(self, listing: _Listing) -> None:
+        """Create the nodes of a listing, reusing the nodes of the previous one."""
+        previous = self._listings.get(listing.path)
+        previous_nodes = {} if previous is None else {node.name: node for node in previous.nodes}
+        nodes = []
+        for index, name in enumerate(listing.names):
+            node = previous_nodes.get(name)
+            if node is None:
+                node = FileNode(os.path.join(listing.path, name), name, listing, index)
+            else:
+                node._listing, node._index = listing, index
+            nodes.append(node)
+        listing.nodes = nodes
+        listing.visible_nodes = [node for node in nodes if not node.name.startswith(".")]
+        self._listings[listing.path] = listing
@@ -0,0 +1,289 @@
+"""Heatmap
+
+Display large 2D arrays aggregated into tiles of a few pixels, through the
+window draw list.
+
+Requires numpy. This module is not imported by pyimgui_utils, import it
+explicitly:
+    from pyimgui_utils.heatmap import Heatmap
+"""
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import imgui
+import numpy as np
+
+from pyimgui_utils.interface import DrawableIT
+
+Region = Tuple[int, int, int, int]  # Data rows and columns: row start, row end, column start, column end
+
+# Anchors of the default colormap, from low to high values
+_DEFAULT_COLORMAP = ((.27, .00, .33), (.23, .32, .55), (.13, .57, .55), (.37, .79, .38), (.99, .91, .14))
+
+
+def colormap_lut(colors: Sequence[Sequence[float]], size: int = 256) -> np.ndarray:
+    """Lookup table of packed imgui colors, interpolated between colors.
+
+    :param colors: Rgb or rgba colors of the lowest to the highest values
+    :param size: Number of entries of the table
+    :return: uint32 array, as returned by imgui.get_color_u32_rgba
+    """
+    if len(colors) < 2 or any(len(color) not in (3, 4) for color in colors):
+        raise ValueError("colors must hold at least two rgb or rgba colors!")
+    anchors = np.array([tuple(color) + (1.,) * (4 - len(color)) for color in colors], dtype=np.float64)
+
+    positions = np.linspace(0., 1., len(anchors))
+    steps = np.linspace(0., 1., size)
+    channels = np.stack([np.interp(steps, positions, anchors[:, channel]) for channel in range(4)], axis=1)
+    channels = np.rint(np.clip(channels, 0., 1.) * 255).astype(np.uint32)
+    return channels[:, 0] | (channels[:, 1] << 8) | (channels[:, 2] << 16) | (channels[:, 3] << 24)
+
+
+class Heatmap(DrawableIT):
+
+    def __init__(self,
+                 data: np.ndarray,
+                 width: float = -1.,
+                 height: float = 200.,
+                 tile_size: float = 4.,
+                 vmin: Optional[float] = None,
+                 vmax: Optional[float] = None,
+                 colormap: Optional[Sequence[Sequence[float]]] = None,
+                 reduce: str = "mean",
+                 interactive: bool = True):
+        """Heatmap of a 2D array
+
+        Cells are aggregated into tiles of about tile_size pixels, and
+        consecutive tiles of a row with the same color are drawn as one
+        rectangle. Aggregations are cached by zoom level: level k merges
+        blocks of 2**k x 2**k cells, and the level drawn is the finest one
+        with at most one tile per tile_size pixels.
+
+        The array is not copied. When it is modified, call mark_dirty with
+        the modified region, or use set_region: only the blocks of the
+        cached levels covering the region are aggregated again, on the next
+        draw.
+
+        The mouse wheel zooms around the hovered cell and dragging pans the
+        view when interactive is True.
+
+        :param data: 2D array of values
+        :param width: Width of the heatmap, fill the available width if negative
+        :param height: Height of the heatmap
+        :param tile_size: Minimum size of a tile in pixels
+        :param vmin: Value of the first color, minimum of the drawn tiles if None
+        :param vmax: Value of the last color, maximum of the drawn tiles if None
+        :param colormap: Rgb or rgba colors from vmin to vmax, a viridis-like map if None
+        :param reduce: Aggregation of the cells of a tile, "mean" or "max"
+        :param interactive: True to zoom and pan with the mouse
+        """
+        if reduce not in ("mean", "max"):
+            raise ValueError("reduce must be 'mean' or 'max'!")
+        if tile_size <= 0:
+            raise ValueError("tile_size must be positive!")
+
+        self.width = width
+        self.height = height
+        self.tile_size = tile_size
+        self.vmin = vmin
+        self.vmax = vmax
+        self.reduce = reduce
+        self.interactive = interactive
+        self._lut = colormap_lut(_DEFAULT_COLORMAP if colormap is None else colormap)
+        self._levels: Dict[int, np.ndarray] = {}  # Aggregated blocks by level, level 0 is data
+        self._dirty: List[Region] = []
+        self._rects: List[Tuple[float, float, float, float, int]] = []
+        self._rects_key: Optional[tuple] = None
+        self.set_data(data)
+
+    @property
+    def data(self) -> np.ndarray:
+        return self._data
+
+    @property
+    def view(self) -> Tuple[float, float, float, float]:
+        """Displayed area, in data rows and columns: top, left, bottom, right."""
+        return self._view
+
+    def set_data(self, data: np.ndarray) -> None:
+        """Replace the array, cached levels are dropped and the view is reset."""
+        data = np.asarray(data)
+        if data.ndim != 2 or data.size == 0:
+            raise ValueError("data must be a non-empty 2D array!")
+
+        self._data = data
+        self._levels = {0: data}
+        self._dirty.clear()
+        self._rects_key = None
+        self._view = (0., 0., float(data.shape[0]), float(data.shape[1]))
+
+    def set_view(self, top: float, left: float, bottom: float, right: float) -> None:
+        """Display an area of the array, clamped to its bounds."""
+        rows, columns = self._data.shape
+        height = min(max(bottom - top, 1.), rows)
+        width = min(max(right - left, 1.), columns)
+        top = min(max(top, 0.), rows - height)
+        left = min(max(left, 0.), columns - width)
+        self._view = (top, left, top + height, left + width)
+
+    def zoom(self, factor: float, row: Optional[float] = None, column: Optional[float] = None) -> None:
+        """Zoom the view around a cell, the center of the view by default.
+
+        :param factor: Zoom factor, greater than 1 to zoom in
+        """
+        top, left, bottom, right = self._view
+        row = (top + bottom) / 2 if row is None else row
+        column = (left + right) / 2 if column is None else column
+        self.set_view(row - (row - top) / factor, column - (column - left) / factor,
+                      row + (bottom - row) / factor, column + (right - column) / factor)
+
+    def mark_dirty(self,
+                   rows: slice = slice(None),
+                   columns: slice = slice(None)) -> None:
+        """Aggregate a region of the array again on the next draw, after it
+        was modified in place. The whole array by default.
+
+        e.g. heatmap.mark_dirty(slice(10, 20), slice(0, 50))
+        """
+        row_start, row_end, _ = rows.indices(self._data.shape[0])
+        column_start, column_end, _ = columns.indices(self._data.shape[1])
+        if row_end > row_start and column_end > column_start:
+            self._dirty.append((row_start, row_end, column_start, column_end))
+
+    def set_region(self, row: int, column: int, values: np.ndarray) -> None:
+        """Write values in the array from (row, column) and mark them dirty."""
+        values = np.asarray(values)
+        if values.ndim != 2:
+            raise ValueError("values must be a 2D array!")
+        rows = slice(row, row + values.shape[0])
+        columns = slice(column, column + values.shape[1])
+        self._data[rows, columns] = values
+        self.mark_dirty(rows, columns)
+
+    def level(self, level: int) -> np.ndarray:
+        """Blocks of 2**level x 2**level cells aggregated, computed once."""
+        self._flush_dirty()
+        blocks = self._levels.get(level)
+        if blocks is None:
+            rows, columns = self._data.shape
+            size = 1 << level
+            blocks = np.empty((-(-rows // size), -(-columns // size)), dtype=np.float64)
+            self._aggregate(size, blocks, (0, rows, 0, columns))
+            self._levels[level] = blocks
+        return blocks
+
+    def _flush_dirty(self) -> None:
+        """Aggregate the dirty regions again in the cached levels."""
+        if not self._dirty:
+            return
+        for level, blocks in self._levels.items():
+            if level > 0:
+                for region in self._dirty:
+                    self._aggregate(1 << level, blocks, region)
+        self._dirty.clear()
+        self._rects_key = None
+
+    def _aggregate(self, size: int, blocks: np.ndarray, region: Region) -> None:
+        """Compute the blocks of size x size cells covering a region."""
+        rows, columns = self._data.shape
+        block_rows = slice(region[0] // size, -(-region[1] // size))
+        block_columns = slice(region[2] // size, -(-region[3] // size))
+        row_start, row_end = block_rows.start * size, min(block_rows.stop * size, rows)
+        column_start, column_end = block_columns.start * size, min(block_columns.stop * size, columns)
+        shape = (block_rows.stop - block_rows.start, size, block_columns.stop - block_columns.start, size)
+
+        # Pad the cells to whole blocks with a neutral value
+        cells = np.full((shape[0] * size, shape[2] * size), 0. if self.reduce == "mean" else -np.inf)
+        cells[:row_end - row_start, :column_end - column_start] = self._data[row_start:row_end,
+                                                                             column_start:column_end]
+        cells = cells.reshape(shape)
+        if self.reduce == "max":
+            blocks[block_rows, block_columns] = cells.max(axis=(1, 3))
+            return
+
+        row_counts = np.minimum(rows - np.arange(row_start, row_start + shape[0] * size, size), size)
+        column_counts = np.minimum(columns - np.arange(column_start, column_start + shape[2] * size, size), size)
+        blocks[block_rows, block_columns] = cells.sum(axis=(1, 3)) / np.outer(row_counts, column_counts)
+
+    def _tile_level(self, pixel_width: float, pixel_height: float) -> int:
+        """Finest level with tiles of at least tile_size pixels."""
+        top, left, bottom, right = self._view
+        cells_per_tile = max((bottom - top) * self.tile_size / pixel_height,
+                             (right - left) * self.tile_size / pixel_width)
+        level = 0
+        while (1 << level) < cells_per_tile:
+            level += 1
+        return level
+
+    def tile_rects(self, x: float, y: float, width: float, height: float) -> List[Tuple[float, float, float, float, int]]:
+        """Rectangles drawn for an area of the screen, cached until the view,
+        the area or the data changes.
+
+        :return: List of (x0, y0, x1, y1, packed color)
+        """
+        self._flush_dirty()
+        key = (self._view, x, y, width, height, self.vmin, self.vmax)
+        if key == self._rects_key:
+            return self._rects
+
+        level = self._tile_level(width, height)
+        blocks = self.level(level)
+        size = 1 << level
+        top, left, bottom, right = self._view
+        first_row, end_row = int(top // size), -int(-bottom // size)
+        first_column, end_column = int(left // size), -int(-right // size)
+        tiles = blocks[first_row:end_row, first_column:end_column]
+
+        # Vectorized colormap
+        vmin = float(np.nanmin(tiles)) if self.vmin is None else self.vmin
+        vmax = float(np.nanmax(tiles)) if self.vmax is None else self.vmax
+        scale = (len(self._lut) - 1) / (vmax - vmin) if vmax > vmin else 0.
+        indexes = np.clip(np.nan_to_num((tiles - vmin) * scale), 0, len(self._lut) - 1).astype(np.intp)
+        colors = self._lut[indexes]
+
+        # Merge the consecutive tiles of a row with the same color
+        run_starts = np.ones(colors.shape, dtype=bool)
+        run_starts[:, 1:] = colors[:, 1:] != colors[:, :-1]
+        run_rows, run_columns = np.nonzero(run_starts)
+        run_ends = np.append(run_columns[1:], 0)
+        run_ends[np.append(run_rows[1:] != run_rows[:-1], True)] = colors.shape[1]
+
+        # Tile edges on the screen, clipped to the area
+        edges_y = np.clip(y + (np.arange(first_row, end_row + 1) * size - top) * (height / (bottom - top)),
+                          y, y + height)
+        edges_x = np.clip(x + (np.arange(first_column, end_column + 1) * size - left) * (width / (right - left)),
+                          x, x + width)
+        self._rects = list(zip(edges_x[run_columns].tolist(), edges_y[run_rows].tolist(),
+                               edges_x[run_ends].tolist(), edges_y[run_rows + 1].tolist(),
+                               colors[run_rows, run_columns].tolist()))
+        self._rects_key = key
+        return self._rects
+
+    def draw(self, *args, **kwargs) -> None:
+        """Draw the heatmap at the cursor position."""
+        width = self.width if self.width > 0 else imgui.get_content_region_available_width()
+        x, y = imgui.get_cursor_screen_pos()
+        imgui.push_id(f"{id(self)}")  # Instances must not share the button state
+        imgui.invisible_button("##heatmap", width, self.height)
+        if self.interactive:
+            self._handle_mouse(x, y, width)
+
+        add_rect_filled = imgui.get_window_draw_list().add_rect_filled
+        for rect in self.tile_rects(x, y, width, self.height):
+            add_rect_filled(*rect)
+        imgui.pop_id()
+
+    def _handle_mouse(self, x: float, y: float, width: float) -> None:
+        top, left, bottom, right = self._view
+        io = imgui.get_io()
+        if imgui.is_item_active():
+            delta_x, delta_y = io.mouse_delta
+            if delta_x != 0 or delta_y != 0:
+                self.set_view(top - delta_y * (bottom - top) / self.height,
+                              left - delta_x * (right - left) / width,
+                              bottom - delta_y * (bottom - top) / self.height,
+                              right - delta_x * (right - left) / width)
+        elif imgui.is_item_hovered() and io.mouse_wheel != 0:
+            mouse_x, mouse_y = io.mouse_pos
+            self.zoom(1.25 ** io.mouse_wheel,
+                      top + (mouse_y - y) * (bottom - top) / self.height,
+                      left + (mouse_x - x) * (right - left) / width)
@@ -8,6 +8,8 @@ class DrawableIT(ABC):
     draw content on the screen.
     """
 
+    __slots__ = ()  # Let subclasses define slots
+
     @abstractmethod
     def draw(self, *args, **kwargs) -> None:
         """Draw the content in an imgui context."""
@@ -0,0 +1,443 @@
+"""Log viewer
+
+Display live logs kept in a bounded ring buffer, or tail a log file, drawing
+only the visible lines.
+"""
+import bisect
+import logging
+import os
+import re
+import threading
+from abc import ABC, abstractmethod
+from array import array
+from typing import BinaryIO, List, Optional, Tuple
+
+import imgui
+from typing_extensions import override
+
+from pyimgui_utils.clipper import ListClipper
+from pyimgui_utils.window import BasicWindow
+
+_log = logging.getLogger(__name__)
+
+_LEVEL_PATTERN = re.compile(r"\b(CRITICAL|ERROR|WARNING|INFO|DEBUG)\b")
+_LEVELS = (logging.DEBUG, logging.INFO, logging.WARNING, logging.ERROR, logging.CRITICAL)
+_LEVEL_COLORS = {
+    logging.WARNING: (1., .8, .2, 1.),
+    logging.ERROR: (1., .35, .35, 1.),
+    logging.CRITICAL: (1., .2, .6, 1.),
+}
+
+
+def parse_level(line: str) -> int:
+    """Level of a formatted log line, from the first level name it contains.
+
+    :return: The logging level, logging.NOTSET if none is found
+    """
+    match = _LEVEL_PATTERN.search(line)
+    return logging.NOTSET if match is None else logging.getLevelName(match.group(1))
+
+
+class LogSource(ABC):
+    """Lines of a log, addressed by absolute indexes.
+
+    Indexes keep designating the same line when lines are added or dropped:
+    the valid ones are in range(first_index, end_index).
+    """
+
+    @property
+    @abstractmethod
+    def first_index(self) -> int:
+        """Index of the oldest line still available."""
+        pass
+
+    @property
+    @abstractmethod
+    def end_index(self) -> int:
+        """Index after the newest line."""
+        pass
+
+    @abstractmethod
+    def get_line(self, index: int) -> Tuple[int, str]:
+        """Level and text of a line."""
+        pass
+
+    def update(self) -> None:
+        """Load new lines, called by LogWindow on each frame."""
+        pass
+
+
+class RingBufferSource(LogSource):
+
+    def __init__(self, capacity: int = 10_000):
+        """Bounded in memory log
+
+        Keep the capacity newest lines, older lines are overwritten. Lines
+        can be appended from any thread.
+
+        :param capacity: Maximum number of lines kept
+        """
+        if capacity <= 0:
+            raise ValueError("capacity must be positive!")
+
+        self.capacity = capacity
+        self._lines: List[Optional[Tuple[int, str]]] = [None] * capacity
+        self._count = 0
+        self._lock = threading.Lock()
+
+    @property
+    @override
+    def first_index(self) -> int:
+        return max(self._count - self.capacity, 0)
+
+    @property
+    @override
+    def end_index(self) -> int:
+        return self._count
+
+    @override
+    def get_line(self, index: int) -> Tuple[int, str]:
+        """Level and text of a line.
+
+        :raise IndexError: If the line has been overwritten
+        """
+        # Under the lock, so a line overwritten by append is not returned for index
+        with self._lock:
+            if not self._count - self.capacity <= index < self._count:
+                raise IndexError(f"Line {index} is not in the buffer!")
+            return self._lines[index % self.capacity]
+
+    def append(self, text: str, level: int = logging.INFO) -> None:
+        """Append a line, multi-line texts are split."""
+        with self._lock:
+            for line in text.splitlines() or [""]:
+                self._lines[self._count % self.capacity] = (level, line)
+                self._count += 1
+
+
+class FileSource(LogSource):
+
+    def __init__(self, path: str, index_budget: int = 4 * 1024 * 1024):
+        """Log file tail
+
+        A line offset index is built incrementally: each update indexes at
+        most index_budget new bytes, so a large file is indexed over several
+        frames. Lines are read on demand from a file handle, bounded by the
+        file size, so a file truncated while it is read, e.g. by a copytruncate
+        log rotation, gives missing lines instead of the SIGBUS a memory
+        map would raise. The file is indexed from the start when it is
+        truncated or replaced.
+
+        :param path: Path of the log file
+        :param index_budget: Maximum number of bytes indexed per update
+        """
+        self.path = path
+        self.index_budget = index_budget
+        self._file: Optional[BinaryIO] = None
+        self._lock = threading.Lock()  # Serializes the seek and read of the file
+        self._size = 0  # File size at the last update
+        self._offsets = array("Q", [0])  # Start offset of each line, then end of the last one
+        self._indexed = 0  # Bytes indexed, up to the end of the last complete line
+        self._scanned = 0  # Bytes searched for line ends
+        self.update()
+
+    @property
+    @override
+    def first_index(self) -> int:
+        return 0
+
+    @property
+    @override
+    def end_index(self) -> int:
+        return len(self._offsets) - 1
+
+    @property
+    def is_indexed(self) -> bool:
+        """True if every byte of the file has been indexed."""
+        return self._file is None or self._scanned >= self._size
+
+    @override
+    def get_line(self, index: int) -> Tuple[int, str]:
+        """Level and text of a line.
+
+        :raise IndexError: If the line has been truncated from the file
+        """
+        # Local references, the file is kept open while a filter thread reads it
+        file, offsets = self._file, self._offsets
+        if file is None or not 0 <= index < len(offsets) - 1:
+            raise IndexError(f"Line {index} is not in the file!")
+        start, end = offsets[index], offsets[index + 1]
+        with self._lock:
+            file.seek(start)
+            data = file.read(end - start)
+        if len(data) < end - start:
+            raise IndexError(f"Line {index} has been truncated!")
+        line = data.decode("utf-8", errors="replace").rstrip("\r\n")
+        return parse_level(line), line
+
+    @override
+    def update(self) -> None:
+        try:
+            stat = os.stat(self.path)
+        except OSError:
+            return
+
+        if self._file is not None and (stat.st_size < self._indexed
+                                       or not os.path.samestat(stat, os.fstat(self._file.fileno()))):
+            # Truncated or replaced: index the new content from the start. The
+            # previous file is closed once no filter thread uses it
+            self._file = None
+            self._offsets = array("Q", [0])
+            self._size = self._indexed = self._scanned = 0
+
+        if stat.st_size == 0:
+            return
+        if self._file is None:
+            try:
+                self._file = open(self.path, "rb", buffering=0)  # No stale buffer once truncated
+            except OSError:
+                return
+        self._size = os.fstat(self._file.fileno()).st_size
+        self._index_lines()
+
+    def _index_lines(self) -> None:
+        with self._lock:
+            self._file.seek(self._scanned)
+            data = self._file.read(min(self.index_budget, self._size - self._scanned))
+        offsets = self._offsets
+        position = 0
+        while True:
+            line_end = data.find(b"\n", position)
+            if line_end < 0:
+                break
+            position = line_end + 1
+            offsets.append(self._scanned + position)
+
+        self._indexed = offsets[-1]
+        self._scanned += len(data)
+
+
+class LogFilter:
+
+    def __init__(self,
+                 source: LogSource,
+                 min_level: int = logging.NOTSET,
+                 substring: str = ""):
+        """Filter of log lines, run in a background thread
+
+        The lines available when start is called are filtered by the thread,
+        newer ones are filtered by update, from the UI thread.
+
+        :param source: Filtered log
+        :param min_level: Minimum level of the kept lines
+        :param substring: Text the kept lines contain, case insensitive
+        """
+        self.source = source
+        self.min_level = min_level
+        self.substring = substring.lower()
+        self.matches = array("Q")  # Absolute indexes of the matching lines
+        self._end = source.end_index  # Lines before are handled by the thread
+        self.error: Optional[Exception] = None  # Raised by the source in the thread
+        self._done = threading.Event()
+        self._cancelled = False
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    @property
+    def is_active(self) -> bool:
+        """True if the filter drops some lines."""
+        return self.min_level > logging.NOTSET or self.substring != ""
+
+    @property
+    def done(self) -> bool:
+        return self._done.is_set()
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def cancel(self) -> None:
+        self._cancelled = True
+
+    def update(self, max_lines: int = 1000) -> None:
+        """Filter up to max_lines new lines once the thread is done."""
+        if not self.done:
+            return
+
+        end = min(self.source.end_index, self._end + max_lines)
+        first_index = self.source.first_index
+        self._filter(max(self._end, first_index), end, self.matches)
+        self._end = end
+
+        # Drop the lines evicted from the source, once they are half of the
+        # matches so the copy is amortized
+        evicted = bisect.bisect_left(self.matches, first_index)
+        if evicted > 0 and evicted * 2 >= len(self.matches):
+            del self.matches[:evicted]
+
+    def _run(self) -> None:
+        matches = array("Q")
+        step = 4096  # Lines filtered between two cancellation checks
+        try:
+            for start in range(self.source.first_index, self._end, step):
+                if self._cancelled:
+                    return
+                self._filter(max(start, self.source.first_index), min(start + step, self._end), matches)
+        except Exception as error:
+            # Keep the lines filtered so far
+            _log.exception("Log filter failed")
+            self.error = error
+        finally:
+            self.matches = matches
+            self._done.set()
+
+    def _filter(self, start: int, end: int, matches: array) -> None:
+        source = self.source
+        get_line = source.get_line
+        for index in range(start, end):
+            try:
+                level, line = get_line(index)
+            except IndexError:
+                if index < source.first_index:
+                    continue  # Evicted while filtering
+                raise
+            if level < self.min_level:
+                continue
+            if self.substring != "" and self.substring not in line.lower():
+                continue
+            matches.append(index)
+
+
+class _LogHandler(logging.Handler):
+
+    def __init__(self, source: RingBufferSource, level: int):
+        super().__init__(level)
+        self._source = source
+
+    @override
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            self._source.append(self.format(record), record.levelno)
+        except Exception:
+            self.handleError(record)
+
+
+class LogWindow(BasicWindow):
+
+    def __init__(self,
+                 source: Optional[LogSource] = None,
+                 name: str = "Log",
+                 capacity: int = 10_000,
+                 closeable: bool = False,
+                 imgui_window_flags: int = 0):
+        """Log viewer window
+
+        Draw the lines of a log source with a list clipper, so the frame time
+        does not depend on the log size. Lines can be filtered by minimum
+        level and by substring; the filter runs in a background thread and
+        the unfiltered lines are shown until it is done. The view follows
+        new lines while it is scrolled to the bottom.
+
+        e.g.
+            log_window = LogWindow()
+            logging.getLogger().addHandler(log_window.handler())
+
+            file_window = LogWindow.tail("app.log")
+
+        :param source: Log to display, a RingBufferSource of capacity lines if None
+        :param name: The title of window
+        :param capacity: Capacity of the default ring buffer
+        :param closeable: True if the window is closeable, False otherwise
+        :param imgui_window_flags: Optional imgui window flags
+        """
+        super().__init__(name=name,
+                         closeable=closeable,
+                         imgui_window_flags=imgui_window_flags)
+        self.source = RingBufferSource(capacity) if source is None else source
+        self.min_level = logging.NOTSET
+        self.substring = ""
+        self._filter: Optional[LogFilter] = None
+        self._displayed_filter: Optional[LogFilter] = None  # Last finished filter
+
+    @classmethod
+    def tail(cls, path: str, name: Optional[str] = None, **kwargs) -> "LogWindow":
+        """Log window tailing a log file."""
+        return cls(source=FileSource(path), name=path if name is None else name, **kwargs)
+
+    def append(self, text: str, level: int = logging.INFO) -> None:
+        """Append a line to the ring buffer source. Thread-safe."""
+        if not isinstance(self.source, RingBufferSource):
+            raise TypeError("Lines can only be appended to a RingBufferSource!")
+        self.source.append(text, level)
+
+    def handler(self, level: int = logging.NOTSET) -> logging.Handler:
+        """Logging handler appending formatted records to the window."""
+        if not isinstance(self.source, RingBufferSource):
+            raise TypeError("Records can only be appended to a RingBufferSource!")
+        handler = _LogHandler(self.source, level)
+        handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(name)s: %(message)s"))
+        return handler
+
+    def set_filter(self, min_level: int = logging.NOTSET, substring: str = "") -> None:
+        """Filter displayed lines, in a background thread."""
+        self.min_level = min_level
+        self.substring = substring
+        if self._filter is not None:
+            self._filter.cancel()
+
+        self._filter = LogFilter(self.source, min_level, substring)
+        if self._filter.is_active:
+            self._filter.start()
+        else:
+            self._filter = None
+            self._displayed_filter = None
+
+    def visible_lines(self) -> Tuple[int, int, Optional[array]]:
+        """Lines to display: first and end indexes, and the filtered indexes
+        if a filter is done (None otherwise).
+        """
+        if self._filter is not None and self._filter.done:
+            self._displayed_filter = self._filter
+        if self._displayed_filter is None:
+            return self.source.first_index, self.source.end_index, None
+
+        self._displayed_filter.update()
+        matches = self._displayed_filter.matches
+        first = bisect.bisect_left(matches, self.source.first_index)
+        return first, len(matches), matches
+
+    @override
+    def draw_content(self, *args, **kwargs) -> None:
+        self.source.update()
+        self._draw_filter_inputs()
+
+        first, end, matches = self.visible_lines()
+        imgui.begin_child("##lines", 0, 0, border=True)
+        follow = imgui.get_scroll_y() >= imgui.get_scroll_max_y()
+
+        clipper = ListClipper(end - first)
+        for position in clipper:
+            index = first + position if matches is None else matches[first + position]
+            try:
+                level, line = self.source.get_line(index)
+            except IndexError:
+                level, line = logging.NOTSET, ""  # Evicted by another thread since visible_lines
+            color = _LEVEL_COLORS.get(level)
+            if color is None:
+                imgui.text_unformatted(line)
+            else:
+                imgui.text_colored(line, *color)
+
+        if follow:
+            imgui.set_scroll_here_y(1.)
+        imgui.end_child()
+
+    def _draw_filter_inputs(self) -> None:
+        level_names = ["ALL"] + [logging.getLevelName(level) for level in _LEVELS]
+        current = 0 if self.min_level not in _LEVELS else _LEVELS.index(self.min_level) + 1
+        imgui.set_next_item_width(100)
+        level_changed, current = imgui.combo("##level", current, level_names)
+        imgui.same_line()
+        imgui.set_next_item_width(-1)
+        substring_changed, substring = imgui.input_text("##filter", self.substring, 256)
+
+        if level_changed or substring_changed:
+            self.set_filter(logging.NOTSET if current == 0 else _LEVELS[current - 1], substring)
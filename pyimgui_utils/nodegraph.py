@@ -0,0 +1,292 @@
+"""Node graph
+
+Node and link editor canvas, drawing and hit-testing only the nodes of the
+viewport through a grid index.
+
+Requires numpy. This module is not imported by pyimgui_utils, import it
+explicitly:
+    from pyimgui_utils.nodegraph import NodeGraph
+"""
+from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple, Union
+
+import imgui
+import numpy as np
+
+from pyimgui_utils.interface import DrawableIT
+
+Rect = Tuple[float, float, float, float]  # Canvas coordinates: left, top, right, bottom
+Cell = Tuple[int, int]
+
+
+class NodeGraph(DrawableIT):
+
+    def __init__(self,
+                 width: float = -1.,
+                 height: float = 400.,
+                 node_size: Tuple[float, float] = (120., 40.),
+                 cell_size: float = 256.,
+                 detail_zoom: float = .5,
+                 capacity: int = 256):
+        """Node graph canvas
+
+        Node positions and sizes are stored in NumPy arrays, links in an
+        array of (source, target) node indexes. Node bounds are indexed in a
+        uniform grid of cell_size canvas units: the nodes of the viewport
+        are read from the cells it covers, and hit-testing the mouse reads
+        one cell, so both stay cheap whatever the number of nodes. Links are
+        culled with a vectorized bounding box test.
+
+        Dragging a node moves it, dragging the background pans the canvas
+        and the mouse wheel zooms around the mouse. Below detail_zoom, links
+        are drawn as straight lines and labels are hidden.
+
+        e.g.
+            graph = NodeGraph()
+            source = graph.add_node("Source", (0, 0))
+            sink = graph.add_node("Sink", (200, 50))
+            graph.add_link(source, sink)
+
+        :param width: Width of the canvas, fill the available width if negative
+        :param height: Height of the canvas
+        :param node_size: Default size of nodes, in canvas units
+        :param cell_size: Size of the grid cells, in canvas units, about the
+                          size of the largest nodes
+        :param detail_zoom: Minimum zoom drawing labels and curved links
+        :param capacity: Initial number of nodes
+        """
+        if cell_size <= 0:
+            raise ValueError("cell_size must be positive!")
+
+        self.width = width
+        self.height = height
+        self.node_size = node_size
+        self.cell_size = cell_size
+        self.detail_zoom = detail_zoom
+        self.offset = (0., 0.)  # Canvas coordinates of the top left corner
+        self.zoom = 1.
+        self.hovered: Optional[int] = None
+        self.selected: Optional[int] = None
+        self.labels: List[str] = []
+        self._positions = np.zeros((capacity, 2))
+        self._sizes = np.zeros((capacity, 2))
+        self._links = np.zeros((0, 2), dtype=np.intp)
+        self._cells: Dict[Cell, Set[int]] = {}
+        self._dragged: Optional[int] = None
+        self._panning = False
+
+    def __len__(self) -> int:
+        return len(self.labels)
+
+    @property
+    def positions(self) -> np.ndarray:
+        """Top left corners of nodes, read-only: use move_node."""
+        positions = self._positions[:len(self)]
+        positions.flags.writeable = False
+        return positions
+
+    @property
+    def sizes(self) -> np.ndarray:
+        sizes = self._sizes[:len(self)]
+        sizes.flags.writeable = False
+        return sizes
+
+    @property
+    def links(self) -> np.ndarray:
+        return self._links
+
+    def add_node(self, label: str, position: Sequence[float],
+                 size: Optional[Sequence[float]] = None) -> int:
+        """Add a node and return its index."""
+        return int(self.add_nodes([label], [position], None if size is None else [size])[0])
+
+    def add_nodes(self,
+                  labels: Sequence[str],
+                  positions: Union[Sequence[Sequence[float]], np.ndarray],
+                  sizes: Optional[Union[Sequence[Sequence[float]], np.ndarray]] = None) -> np.ndarray:
+        """Add nodes.
+
+        :param labels: Titles of nodes
+        :param positions: Top left corners, array of shape (N, 2)
+        :param sizes: Sizes, array of shape (N, 2), node_size if None
+        :return: Indexes of the new nodes
+        """
+        positions = np.asarray(positions, dtype=np.float64).reshape(-1, 2)
+        if len(positions) != len(labels):
+            raise ValueError("labels and positions must have the same length!")
+        sizes = np.broadcast_to(self.node_size if sizes is None else np.asarray(sizes, dtype=np.float64),
+                                positions.shape)
+
+        start, end = len(self), len(self) + len(positions)
+        if end > len(self._positions):
+            capacity = max(end, 2 * len(self._positions))
+            self._positions = np.resize(self._positions, (capacity, 2))
+            self._sizes = np.resize(self._sizes, (capacity, 2))
+        self._positions[start:end] = positions
+        self._sizes[start:end] = sizes
+        self.labels.extend(labels)
+
+        for node in range(start, end):
+            self._index(node)
+        return np.arange(start, end)
+
+    def add_link(self, source: int, target: int) -> None:
+        self.add_links([(source, target)])
+
+    def add_links(self, links: Union[Sequence[Tuple[int, int]], np.ndarray]) -> None:
+        """Add links, array of shape (M, 2) of source and target node indexes."""
+        links = np.asarray(links, dtype=np.intp).reshape(-1, 2)
+        if len(links) > 0 and (links.min() < 0 or links.max() >= len(self)):
+            raise IndexError("Links must connect existing nodes!")
+        self._links = np.concatenate((self._links, links))
+
+    def move_node(self, node: int, position: Sequence[float]) -> None:
+        """Move the top left corner of a node, and update the grid index."""
+        old_cells = set(self._node_cells(node))
+        self._positions[node] = position
+        new_cells = set(self._node_cells(node))
+        for cell in old_cells - new_cells:
+            nodes = self._cells[cell]
+            nodes.discard(node)
+            if not nodes:
+                del self._cells[cell]
+        for cell in new_cells - old_cells:
+            self._cells.setdefault(cell, set()).add(node)
+
+    def _index(self, node: int) -> None:
+        for cell in self._node_cells(node):
+            self._cells.setdefault(cell, set()).add(node)
+
+    def _node_cells(self, node: int) -> Iterable[Cell]:
+        left, top = self._positions[node]
+        right, bottom = self._positions[node] + self._sizes[node]
+        return self._rect_cells((left, top, right, bottom))
+
+    def _rect_cells(self, rect: Rect) -> Iterable[Cell]:
+        left, top, right, bottom = (int(coordinate // self.cell_size) for coordinate in rect)
+        return ((column, row) for column in range(left, right + 1) for row in range(top, bottom + 1))
+
+    def nodes_in_rect(self, rect: Rect) -> np.ndarray:
+        """Indexes of the nodes intersecting a canvas rectangle, ascending."""
+        left, top, right, bottom = (int(coordinate // self.cell_size) for coordinate in rect)
+        if (right - left + 1) * (bottom - top + 1) <= len(self._cells):
+            cells = (self._cells.get(cell) for cell in self._rect_cells(rect))
+        else:
+            # Zoomed out: fewer occupied cells than covered ones
+            cells = (nodes for (column, row), nodes in self._cells.items()
+                     if left <= column <= right and top <= row <= bottom)
+        candidates = set()
+        for nodes in cells:
+            if nodes:
+                candidates.update(nodes)
+
+        nodes = np.fromiter(candidates, dtype=np.intp, count=len(candidates))
+        nodes.sort()
+        minimums = self._positions[nodes]
+        maximums = minimums + self._sizes[nodes]
+        inside = ((minimums[:, 0] <= rect[2]) & (maximums[:, 0] >= rect[0])
+                  & (minimums[:, 1] <= rect[3]) & (maximums[:, 1] >= rect[1]))
+        return nodes[inside]
+
+    def node_at(self, x: float, y: float) -> Optional[int]:
+        """Topmost node under a canvas point, None if there is none."""
+        nodes = self._cells.get((int(x // self.cell_size), int(y // self.cell_size)))
+        if not nodes:
+            return None
+        for node in sorted(nodes, reverse=True):  # Last drawn is on top
+            left, top = self._positions[node]
+            width, height = self._sizes[node]
+            if left <= x <= left + width and top <= y <= top + height:
+                return node
+        return None
+
+    def links_in_rect(self, rect: Rect) -> np.ndarray:
+        """Indexes of the links whose bounding box intersects a canvas rectangle."""
+        starts, ends = self._link_ends(self._links)
+        return np.flatnonzero((np.minimum(starts[:, 0], ends[:, 0]) <= rect[2])
+                              & (np.maximum(starts[:, 0], ends[:, 0]) >= rect[0])
+                              & (np.minimum(starts[:, 1], ends[:, 1]) <= rect[3])
+                              & (np.maximum(starts[:, 1], ends[:, 1]) >= rect[1]))
+
+    def _link_ends(self, links: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Canvas points of links: right middle of sources, left middle of targets."""
+        sources, targets = links[:, 0], links[:, 1]
+        starts = self._positions[sources] + self._sizes[sources] * (1., .5)
+        ends = self._positions[targets] + self._sizes[targets] * (0., .5)
+        return starts, ends
+
+    def viewport(self, width: float, height: float) -> Rect:
+        """Canvas rectangle displayed in a canvas widget of width x height pixels."""
+        left, top = self.offset
+        return left, top, left + width / self.zoom, top + height / self.zoom
+
+    def draw(self, *args, **kwargs) -> None:
+        """Draw the canvas at the cursor position."""
+        width = self.width if self.width > 0 else imgui.get_content_region_available_width()
+        x, y = imgui.get_cursor_screen_pos()
+        imgui.push_id(f"{id(self)}")  # Instances must not share the button state
+        imgui.invisible_button("##node_graph", width, self.height)
+        self._handle_mouse(x, y, width)
+
+        draw_list = imgui.get_window_draw_list()
+        draw_list.add_rect_filled(x, y, x + width, y + self.height,
+                                  imgui.get_color_u32_rgba(.1, .1, .12, 1.))
+        # Nodes and links crossing the viewport edges must not overflow the canvas
+        draw_list.push_clip_rect(x, y, x + width, y + self.height, True)
+        viewport = self.viewport(width, self.height)
+        left, top = self.offset
+        zoom = self.zoom
+
+        links = self._links[self.links_in_rect(viewport)]
+        if len(links) > 0:
+            starts, ends = self._link_ends(links)
+            starts = ((starts - (left, top)) * zoom + (x, y)).tolist()
+            ends = ((ends - (left, top)) * zoom + (x, y)).tolist()
+            link_color = imgui.get_color_u32_rgba(.8, .8, .8, 1.)
+            if zoom < self.detail_zoom:
+                for (x0, y0), (x1, y1) in zip(starts, ends):
+                    draw_list.add_line(x0, y0, x1, y1, link_color)
+            else:
+                tangent = 50. * zoom
+                for (x0, y0), (x1, y1) in zip(starts, ends):
+                    draw_list.add_bezier_cubic(x0, y0, x0 + tangent, y0, x1 - tangent, y1, x1, y1, link_color, 1.)
+
+        nodes = self.nodes_in_rect(viewport)
+        minimums = (self._positions[nodes] - (left, top)) * zoom + (x, y)
+        maximums = minimums + self._sizes[nodes] * zoom
+        node_color = imgui.get_color_u32_rgba(.25, .25, .3, 1.)
+        highlight_color = imgui.get_color_u32_rgba(.9, .7, .2, 1.)
+        text_color = imgui.get_color_u32_rgba(1., 1., 1., 1.)
+        for node, (x0, y0), (x1, y1) in zip(nodes.tolist(), minimums.tolist(), maximums.tolist()):
+            draw_list.add_rect_filled(x0, y0, x1, y1, node_color, 4.)
+            if node == self.hovered or node == self.selected:
+                draw_list.add_rect(x0, y0, x1, y1, highlight_color, 4.)
+            if zoom >= self.detail_zoom:
+                draw_list.add_text(x0 + 4, y0 + 4, text_color, self.labels[node])
+        draw_list.pop_clip_rect()
+        imgui.pop_id()
+
+    def _handle_mouse(self, x: float, y: float, width: float) -> None:
+        io = imgui.get_io()
+        mouse_x, mouse_y = io.mouse_pos
+        canvas_x = self.offset[0] + (mouse_x - x) / self.zoom
+        canvas_y = self.offset[1] + (mouse_y - y) / self.zoom
+        self.hovered = self.node_at(canvas_x, canvas_y) if imgui.is_item_hovered() else None
+
+        if imgui.is_item_activated():
+            self.selected = self._dragged = self.hovered
+            self._panning = self.hovered is None
+        if not imgui.is_item_active():
+            self._dragged = None
+            self._panning = False
+
+        delta_x, delta_y = io.mouse_delta
+        if self._dragged is not None and (delta_x != 0 or delta_y != 0):
+            self.move_node(self._dragged, self._positions[self._dragged]
+                           + (delta_x / self.zoom, delta_y / self.zoom))
+        elif self._panning:
+            self.offset = (self.offset[0] - delta_x / self.zoom, self.offset[1] - delta_y / self.zoom)
+        elif imgui.is_item_hovered() and io.mouse_wheel != 0:
+            zoom = min(max(self.zoom * 1.25 ** io.mouse_wheel, .05), 10.)
+            # Keep the canvas point under the mouse
+            self.offset = (canvas_x - (mouse_x - x) / zoom, canvas_y - (mouse_y - y) / zoom)
+            self.zoom = zoom
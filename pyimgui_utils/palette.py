@@ -0,0 +1,372 @@
+"""Command palette
+
+Fuzzy search every menu item of a MenuBarWindow and extra registered
+commands from a single text input, usually opened with Ctrl+P.
+"""
+import operator
+import re
+import time
+from dataclasses import dataclass
+from itertools import compress, islice, repeat
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+import imgui
+from typing_extensions import override
+
+from pyimgui_utils.callback import CallbackDispatcher, CallbackTracker
+from pyimgui_utils.clipper import ListClipper
+from pyimgui_utils.reactive import value_of
+from pyimgui_utils.window import (BasicWindow, MenuBar, MenuBarWindow, MenuItem,
+                                  MenuProvider, _menu_item_name)
+
+
+@dataclass
+class Command:
+    name: str
+    action: Callable[[], Any]
+    shortcut: str = ""
+    is_enabled: Optional[Callable[[], bool]] = None
+
+
+class _SearchState:
+    """Matches of a query and the candidates not checked yet."""
+
+    def __init__(self, query: str, candidates: List[int]):
+        self.query = query
+        self.candidates = candidates
+        self.position = 0  # Candidates before position have been checked
+        self.matches: List[int] = []
+        self.ranked: List[int] = []
+
+    @property
+    def has_more(self) -> bool:
+        return self.position < len(self.candidates)
+
+
+class CommandIndex:
+
+    def __init__(self,
+                 commands: Optional[List[Command]] = None,
+                 batch_size: int = 200,
+                 time_budget: float = 0.0005,
+                 chunk_size: int = 256):
+        """Precomputed fuzzy search index
+
+        A query matches a command if its characters appear in order in the
+        command name, case insensitive. Matches are ranked by tier, prefix
+        then substring then fuzzy match, and by name length inside a tier.
+
+        Commands are stored sorted by name length and each character maps to
+        the ids of the commands containing it, so the candidates of a new
+        query are a lookup. Candidates are checked by chunks, with C level
+        iteration (map, compress), until batch_size matches are found or the
+        time budget is spent. The remaining candidates are checked by later
+        calls to more(), e.g. on the next frames.
+
+        When the query extends the previous one, only the previous matches
+        and the unchecked candidates are checked again; when it is shortened,
+        the previous state is restored.
+
+        :param commands: Commands to index
+        :param batch_size: Number of matches fetched at once
+        :param time_budget: Maximum time spent in search or more, in seconds
+        :param chunk_size: Number of candidates checked between two time checks
+        """
+        self.batch_size = batch_size
+        self.time_budget = time_budget
+        self.chunk_size = chunk_size
+        self._commands: List[Command] = []
+        self._labels: List[str] = []
+        self._char_index: Dict[str, List[int]] = {}
+        self._states: List[_SearchState] = []
+        self.rebuild([] if commands is None else commands)
+
+    def __len__(self) -> int:
+        return len(self._commands)
+
+    def __getitem__(self, command_id: int) -> Command:
+        return self._commands[command_id]
+
+    @property
+    def has_more(self) -> bool:
+        """True if the last search has unchecked candidates."""
+        return self._states[-1].has_more
+
+    def rebuild(self, commands: List[Command]) -> None:
+        """Replace indexed commands."""
+        self._commands = sorted(commands, key=lambda command: len(command.name))
+        self._labels = [command.name.lower() for command in self._commands]
+
+        char_sets: Dict[str, Set[int]] = {}
+        for command_id, label in enumerate(self._labels):
+            for char in set(label):
+                char_sets.setdefault(char, set()).add(command_id)
+        self._char_index = {char: sorted(ids) for char, ids in char_sets.items()}
+
+        self._states = [_SearchState("", list(range(len(self._commands))))]
+        self._fetch(self._states[0])
+
+    def search(self, query: str) -> List[int]:
+        """Ranked ids of the commands matching query.
+
+        :param query: Text typed by the user
+        :return: Command ids of the fetched matches, best match first
+        """
+        query = query.lower()
+
+        # Restore the longest searched prefix of query
+        while len(self._states) > 1 and not query.startswith(self._states[-1].query):
+            self._states.pop()
+
+        previous = self._states[-1]
+        if previous.query == query:
+            return previous.ranked
+
+        if previous.query == "":
+            candidates = self._char_index.get(query[0], [])
+        else:
+            candidates = previous.matches + previous.candidates[previous.position:]
+
+        state = _SearchState(query, candidates)
+        self._states.append(state)
+        self._fetch(state)
+        return state.ranked
+
+    def more(self) -> List[int]:
+        """Fetch more matches for the last query.
+
+        :return: Command ids of every fetched match, best match first
+        """
+        state = self._states[-1]
+        if state.has_more:
+            self._fetch(state)
+        return state.ranked
+
+    def _fetch(self, state: _SearchState) -> None:
+        """Check candidates until batch_size matches are found or the time
+        budget is spent.
+        """
+        if len(state.query) > 1:
+            search = re.compile(".*?".join(re.escape(char) for char in state.query)).search
+        else:
+            search = None  # Candidates of one character queries already match
+
+        deadline = time.perf_counter() + self.time_budget
+        wanted = len(state.matches) + self.batch_size
+        start_matches = len(state.matches)
+        while state.has_more and len(state.matches) < wanted:
+            chunk = state.candidates[state.position:state.position + self.chunk_size]
+            data = iter(chunk)
+            if search is None:
+                batch = islice(data, wanted - len(state.matches))
+            else:
+                selectors = map(search, map(self._labels.__getitem__, chunk))
+                batch = islice(compress(data, selectors), wanted - len(state.matches))
+
+            state.matches.extend(batch)
+            state.position += len(chunk) - operator.length_hint(data)
+
+            if time.perf_counter() > deadline:
+                break
+
+        if len(state.matches) != start_matches:
+            state.ranked = self._rank(state.query, state.matches)
+
+    def _rank(self, query: str, matches: List[int]) -> List[int]:
+        """Stable partition of matches in prefix, substring and fuzzy tiers.
+
+        Matches are sorted by ids, i.e. name length.
+        """
+        matches = sorted(matches)
+        if query == "":
+            return matches
+
+        labels = list(map(self._labels.__getitem__, matches))
+        is_substring = list(map(str.__contains__, labels, repeat(query)))
+        is_prefix = list(map(str.startswith, labels, repeat(query)))
+        is_substring_only = list(map(operator.gt, is_substring, is_prefix))
+        return (list(compress(matches, is_prefix))
+                + list(compress(matches, is_substring_only))
+                + list(compress(matches, map(operator.not_, is_substring))))
+
+
+class CommandPalette(BasicWindow):
+
+    def __init__(self,
+                 menu_bar_window: Optional[MenuBarWindow] = None,
+                 commands: Optional[List[Command]] = None,
+                 name: str = "Command palette",
+                 width: float = 400.,
+                 results_height: float = 300.,
+                 dispatcher: Optional[CallbackDispatcher] = None):
+        """Command palette window
+
+        Search every menu item of menu_bar_window and the extra commands.
+        The window is hidden until open is called, e.g. from a "Ctrl+P" menu
+        item shortcut. Enter calls the selected command, escape closes the
+        palette.
+
+        Each keystroke only searches within the time budget of the index,
+        the remaining matches are fetched on the following frames while the
+        result list is scrolled.
+
+        The palette never generates the items of a MenuProvider: they are
+        searchable once the provider has generated them, e.g. when its menu
+        has been opened. The index is rebuilt when the palette opens if a
+        provider generated or dropped its items since the last build.
+
+        :param menu_bar_window: Menu bar window whose items are searchable
+        :param commands: Extra commands
+        :param name: The title of window
+        :param width: Width of the window
+        :param results_height: Height of the result list
+        :param dispatcher: Optional dispatcher running the commands out of the
+                           frame
+        """
+        super().__init__(name=name,
+                         imgui_window_flags=imgui.WINDOW_NO_COLLAPSE
+                         | imgui.WINDOW_ALWAYS_AUTO_RESIZE)
+        self._menu_bar_window = menu_bar_window
+        self._extra_commands = [] if commands is None else list(commands)
+        self._index = CommandIndex()
+        self._index_dirty = True
+        # Providers met by the last index build, with the items they had then
+        self._indexed_providers: List[Tuple[MenuProvider, Optional[List[MenuItem]]]] = []
+        self._width = width
+        self._results_height = results_height
+
+        self.is_open = False
+        self.query = ""
+        self.results: List[int] = []
+        self.selected = 0
+        self._focus_input = False
+        self._wanted_results = self._index.batch_size
+        self._callbacks = CallbackTracker(dispatcher)
+
+    def register_command(self, command: Command) -> None:
+        """Add an extra command to the palette."""
+        self._extra_commands.append(command)
+        self.invalidate()
+
+    def invalidate(self) -> None:
+        """Rebuild the index the next time the palette is opened."""
+        self._index_dirty = True
+
+    def open(self) -> None:
+        if self._index_dirty or any(provider.cached_items is not items
+                                    for provider, items in self._indexed_providers):
+            self._rebuild_index()
+        self.is_open = True
+        self._focus_input = True
+        self.set_query("")
+
+    def close(self) -> None:
+        self.is_open = False
+
+    def set_query(self, query: str) -> None:
+        """Update search results for query."""
+        self.query = query
+        self.results = self._index.search(query)
+        self.selected = 0
+        self._wanted_results = self._index.batch_size
+
+    def run_selected(self) -> bool:
+        """Call the selected command and close the palette.
+
+        :return: True if a command has been called
+        """
+        if not self.results:
+            return False
+
+        command = self._index[self.results[self.selected]]
+        if command.is_enabled is not None and not command.is_enabled():
+            return False
+
+        self.close()
+        self._callbacks.call(command.action)
+        return True
+
+    def _rebuild_index(self) -> None:
+        commands = []
+        self._indexed_providers = []
+        if self._menu_bar_window is not None:
+            for menu_bar in self._menu_bar_window.menu_bars:
+                self._collect_menu_commands(menu_bar, "", lambda: True, commands)
+        commands.extend(self._extra_commands)
+        self._index.rebuild(commands)
+        self._index_dirty = False
+
+    def _collect_menu_commands(self,
+                               menu_bar: MenuBar,
+                               path: str,
+                               is_parent_enabled: Callable[[], bool],
+                               commands: List[Command]) -> None:
+        """Recursively turn menu items into commands named after their path."""
+        path = f"{path}{menu_bar.name} > "
+
+        def is_menu_bar_enabled() -> bool:
+            return is_parent_enabled() and value_of(menu_bar.enabled)
+
+        menu_items = list(menu_bar.menu_items)
+        if menu_bar.provider is not None:
+            provider_items = menu_bar.provider.cached_items
+            self._indexed_providers.append((menu_bar.provider, provider_items))
+            if provider_items is not None:
+                menu_items.extend(provider_items)
+
+        for menu_item in menu_items:
+            commands.append(Command(
+                name=path + _menu_item_name(menu_item),
+                action=lambda item=menu_item: item.action(),
+                shortcut=menu_item.shortcut,
+                is_enabled=lambda item=menu_item: is_menu_bar_enabled() and value_of(item.enabled)
+            ))
+
+        for submenu in menu_bar.submenus:
+            self._collect_menu_commands(submenu, path, is_menu_bar_enabled, commands)
+
+    @override
+    def draw(self, *args, **kwargs) -> None:
+        if self.is_open:
+            super().draw(*args, **kwargs)
+
+    @override
+    def draw_content(self, *args, **kwargs) -> None:
+        if self._focus_input:
+            imgui.set_keyboard_focus_here()
+            self._focus_input = False
+
+        imgui.set_next_item_width(self._width)
+        changed, query = imgui.input_text("##query", self.query, 256)
+        if changed:
+            self.set_query(query)
+
+        if imgui.is_key_pressed(imgui.get_key_index(imgui.KEY_ESCAPE)):
+            self.close()
+        elif imgui.is_key_pressed(imgui.get_key_index(imgui.KEY_DOWN_ARROW)):
+            self.selected = min(self.selected + 1, max(len(self.results) - 1, 0))
+        elif imgui.is_key_pressed(imgui.get_key_index(imgui.KEY_UP_ARROW)):
+            self.selected = max(self.selected - 1, 0)
+        elif imgui.is_key_pressed(imgui.get_key_index(imgui.KEY_ENTER)):
+            self.run_selected()
+
+        if self._index.has_more and len(self.results) < self._wanted_results:
+            self.results = self._index.more()
+
+        imgui.begin_child("##results", self._width, self._results_height)
+        clipper = ListClipper(len(self.results))
+        for index in clipper:
+            command = self._index[self.results[index]]
+            label = f"{command.name}##{index}"
+            clicked, _ = imgui.selectable(label, index == self.selected)
+            if command.shortcut != "":
+                imgui.same_line(self._width - imgui.calc_text_size(command.shortcut).x - 20)
+                imgui.text_disabled(command.shortcut)
+            if clicked:
+                self.selected = index
+                self.run_selected()
+        imgui.end_child()
+
+        if clipper.display_end >= len(self.results):
+            # Scrolled to the end of fetched results
+            self._wanted_results = len(self.results) + self._index.batch_size
@@ -0,0 +1,211 @@
+"""Streaming plot
+
+Plot the last samples of a telemetry stream, decimated to the pixel width.
+
+Requires numpy. This module is not imported by pyimgui_utils, import it
+explicitly:
+    from pyimgui_utils.plot import StreamingPlot
+"""
+from typing import List, Optional, Sequence, Tuple, Union
+
+import imgui
+import numpy as np
+
+from pyimgui_utils.interface import DrawableIT
+
+
+class StreamingPlot(DrawableIT):
+
+    def __init__(self,
+                 capacity: int,
+                 label: str = "",
+                 width: float = -1.,
+                 height: float = 80.,
+                 scale_min: Optional[float] = None,
+                 scale_max: Optional[float] = None,
+                 color: Sequence[float] = (.3, .7, 1., 1.),
+                 background_color: Sequence[float] = (0., 0., 0., .3),
+                 level_factor: int = 4,
+                 dtype: type = np.float64):
+        """Streaming line plot
+
+        Samples are appended into a preallocated ring buffer. On each frame,
+        the displayed samples are reduced to one min/max pair per pixel
+        column and drawn as a single polyline through the window draw list.
+
+        The reduction reads a min/max pyramid: level k holds the min and max
+        of blocks of level_factor**k samples. Levels are updated lazily,
+        once per frame, for the samples appended since the last frame only.
+        The level used holds between 1 and level_factor blocks per pixel, so
+        drawing costs O(width) whatever the number of samples.
+
+        :param capacity: Number of samples kept, rounded up to a multiple of
+                         the largest block size
+        :param label: Text drawn over the plot
+        :param width: Width of the plot, fill the available width if negative
+        :param height: Height of the plot
+        :param scale_min: Value at the bottom, minimum of the displayed samples if None
+        :param scale_max: Value at the top, maximum of the displayed samples if None
+        :param color: Rgba color of the line
+        :param background_color: Rgba color of the background
+        :param level_factor: Number of blocks of a level merged in a block of the next level
+        :param dtype: NumPy dtype of the samples
+        """
+        if capacity <= 0:
+            raise ValueError("capacity must be positive!")
+        if level_factor < 2:
+            raise ValueError("level_factor must be at least 2!")
+
+        self.label = label
+        self.width = width
+        self.height = height
+        self.scale_min = scale_min
+        self.scale_max = scale_max
+        self.color = tuple(color)
+        self.background_color = tuple(background_color)
+        self.level_factor = level_factor
+
+        self._block_sizes: List[int] = []
+        block_size = level_factor
+        while block_size <= capacity:
+            self._block_sizes.append(block_size)
+            block_size *= level_factor
+        largest = self._block_sizes[-1] if self._block_sizes else 1
+        self.capacity = -(-capacity // largest) * largest
+
+        self._samples = np.zeros(self.capacity, dtype=dtype)
+        self._levels: List[Tuple[np.ndarray, np.ndarray]] = [
+            (np.zeros(self.capacity // size, dtype=dtype), np.zeros(self.capacity // size, dtype=dtype))
+            for size in self._block_sizes
+        ]
+        self._count = 0  # Number of samples appended since the creation
+        self._updated = 0  # Samples before are aggregated in the levels
+
+    def __len__(self) -> int:
+        """Number of samples available."""
+        return min(self._count, self.capacity)
+
+    @property
+    def samples(self) -> np.ndarray:
+        """Copy of the available samples, oldest first."""
+        start = self._count - len(self)
+        return self._samples[np.arange(start, self._count) % self.capacity]
+
+    def append(self, value: float) -> None:
+        """Append one sample."""
+        self._samples[self._count % self.capacity] = value
+        self._count += 1
+
+    def extend(self, values: Union[Sequence[float], np.ndarray]) -> None:
+        """Append samples, vectorized."""
+        values = np.asarray(values, dtype=self._samples.dtype).ravel()
+        if len(values) > self.capacity:
+            self._count += len(values) - self.capacity
+            values = values[-self.capacity:]
+
+        start = self._count % self.capacity
+        first = min(len(values), self.capacity - start)
+        self._samples[start:start + first] = values[:first]
+        self._samples[:len(values) - first] = values[first:]
+        self._count += len(values)
+
+    def clear(self) -> None:
+        self._count = 0
+        self._updated = 0
+
+    def decimate(self, columns: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Min and max of the displayed samples for each pixel column.
+
+        :param columns: Number of pixel columns
+        :return: Min and max arrays, with at most columns values each
+        """
+        self._update_levels()
+        count = len(self)
+        if count == 0 or columns <= 0:
+            empty = np.zeros(0, dtype=self._samples.dtype)
+            return empty, empty
+
+        # Largest blocks holding at most one pixel column of samples
+        level = -1
+        for index, size in enumerate(self._block_sizes):
+            if size * columns > count:
+                break
+            level = index
+
+        if level < 0:
+            block_size = 1
+            mins = maxs = self._samples
+        else:
+            block_size = self._block_sizes[level]
+            mins, maxs = self._levels[level]
+
+        # Skip the partially overwritten oldest block
+        first_block = -(-(self._count - count) // block_size)
+        end_block = -(-self._count // block_size)
+        blocks = np.arange(first_block, end_block) % len(mins)
+        block_mins = mins[blocks]
+        block_maxs = maxs[blocks]
+
+        columns = min(columns, len(blocks))
+        starts = (np.arange(columns) * len(blocks)) // columns
+        return np.minimum.reduceat(block_mins, starts), np.maximum.reduceat(block_maxs, starts)
+
+    def _update_levels(self) -> None:
+        """Aggregate the samples appended since the last update."""
+        first_sample = max(self._updated, self._count - self.capacity)
+        if first_sample >= self._count:
+            return
+
+        child_mins = child_maxs = self._samples
+        child_size = 1
+        for size, (mins, maxs) in zip(self._block_sizes, self._levels):
+            factor = size // child_size
+            valid_children = -(-self._count // child_size)
+            first_block = first_sample // size
+            full_end = valid_children // factor
+
+            if full_end > first_block:
+                children = (np.arange(first_block * factor, full_end * factor)
+                            % len(child_mins)).reshape(-1, factor)
+                blocks = np.arange(first_block, full_end) % len(mins)
+                mins[blocks] = child_mins[children].min(axis=1)
+                maxs[blocks] = child_maxs[children].max(axis=1)
+
+            if valid_children % factor:
+                # Partial last block, over the available children only
+                children = np.arange(full_end * factor, valid_children) % len(child_mins)
+                block = full_end % len(mins)
+                mins[block] = child_mins[children].min()
+                maxs[block] = child_maxs[children].max()
+
+            child_mins, child_maxs, child_size = mins, maxs, size
+
+        self._updated = self._count
+
+    def draw(self, *args, **kwargs) -> None:
+        """Draw the plot at the cursor position."""
+        width = self.width if self.width > 0 else imgui.get_content_region_available_width()
+        x, y = imgui.get_cursor_screen_pos()
+        imgui.dummy(width, self.height)
+
+        draw_list = imgui.get_window_draw_list()
+        draw_list.add_rect_filled(x, y, x + width, y + self.height,
+                                  imgui.get_color_u32_rgba(*self.background_color))
+
+        mins, maxs = self.decimate(int(width))
+        if len(mins) > 0:
+            scale_min = float(mins.min()) if self.scale_min is None else self.scale_min
+            scale_max = float(maxs.max()) if self.scale_max is None else self.scale_max
+            scale = (self.height - 1) / (scale_max - scale_min) if scale_max > scale_min else 0.
+            bottom = y + self.height - 1
+
+            # Zigzag between the max and the min of each column
+            points = np.empty((2 * len(mins), 2), dtype=np.float64)
+            points[0::2, 0] = points[1::2, 0] = x + np.arange(len(mins)) * (width / len(mins))
+            points[0::2, 1] = bottom - (np.clip(maxs, scale_min, scale_max) - scale_min) * scale
+            points[1::2, 1] = bottom - (np.clip(mins, scale_min, scale_max) - scale_min) * scale
+            draw_list.add_polyline(points.tolist(), imgui.get_color_u32_rgba(*self.color),
+                                   thickness=1.)
+
+        if self.label != "":
+            draw_list.add_text(x + 4, y + 2, imgui.get_color_u32_rgba(1., 1., 1., 1.), self.label)
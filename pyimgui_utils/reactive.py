@@ -0,0 +1,158 @@
+"""Reactive values
+
+Observable values and computed values with automatic dependency tracking.
+Widgets read them instead of calling functions on each frame: a Computed is
+recomputed only when an observable it read has changed.
+"""
+import weakref
+from typing import Callable, Generic, List, Optional, Set, TypeVar, Union
+
+T = TypeVar("T")
+
+_computing: List["Computed"] = []  # Computed values being recomputed, innermost last
+
+
+def _default_equals(value: object, other: object) -> bool:
+    """value == other, False if the result is not a boolean, e.g. for arrays."""
+    if value is other:
+        return True
+    try:
+        return bool(value == other)
+    except (TypeError, ValueError):
+        return False
+
+
+class Observable(Generic[T]):
+
+    def __init__(self, value: T, equals: Optional[Callable[[T, T], bool]] = None):
+        """Observable value
+
+        Reading value from a Computed function registers the observable as a
+        dependency of the Computed. Setting a different value invalidates the
+        dependents and calls the subscribers.
+
+        Bound set methods can be used as setters, e.g. DragButtons setters.
+
+        :param value: Initial value
+        :param equals: Function telling whether two values are equal, == by
+                       default. Values whose == does not return a boolean,
+                       e.g. numpy arrays, are equal only if they are the same
+                       object, unless equals is given (e.g. np.array_equal)
+        """
+        self._value = value
+        self._equals = _default_equals if equals is None else equals
+        self._dependents: "weakref.WeakSet[Computed]" = weakref.WeakSet()
+        self._subscribers: List[Callable[[T], None]] = []
+
+    @property
+    def value(self) -> T:
+        if _computing:
+            _computing[-1]._add_dependency(self)
+        return self._value
+
+    @value.setter
+    def value(self, value: T) -> None:
+        self.set(value)
+
+    def set(self, value: T) -> None:
+        """Set the value, notify dependents and subscribers if it changed."""
+        if self._equals(value, self._value):
+            return
+
+        self._value = value
+        self._notify()
+
+    def subscribe(self, callback: Callable[[T], None]) -> Callable[[], None]:
+        """Call callback with the new value each time it changes.
+
+        :param callback: Function called with the new value
+        :return: Function removing the subscription
+        """
+        self._subscribers.append(callback)
+        return lambda: self._subscribers.remove(callback)
+
+    def _notify(self) -> None:
+        for dependent in list(self._dependents):
+            dependent._invalidate()
+        for callback in list(self._subscribers):
+            callback(self._value)
+
+
+class Computed(Observable[T]):
+
+    def __init__(self, compute: Callable[[], T], equals: Optional[Callable[[T, T], bool]] = None):
+        """Value computed from observables
+
+        compute is called lazily, the first time value is read after one of
+        the observables it read during its last call has changed. The
+        dependencies are tracked again on each call, so conditional reads are
+        handled.
+
+        A Computed with subscribers is recomputed as soon as a dependency
+        changes, to notify them only when its value actually changed.
+
+        e.g.
+            opened = Observable(True)
+            menu_item = MenuItem("Open", enabled=Computed(lambda: not opened.value))
+
+        :param compute: Function computing the value from observables
+        :param equals: Function telling whether two values are equal, see Observable
+        """
+        super().__init__(None, equals)
+        self._compute = compute
+        self._dependencies: Set[Observable] = set()
+        self._dirty = True
+
+    @property
+    def value(self) -> T:
+        if self._dirty:
+            self._recompute()
+        return Observable.value.fget(self)
+
+    def set(self, value: T) -> None:
+        raise TypeError("Computed values are read only!")
+
+    def subscribe(self, callback: Callable[[T], None]) -> Callable[[], None]:
+        """Call callback with the new value each time it changes.
+
+        The value is computed now if needed, so the dependencies are tracked
+        even if value is never read.
+        """
+        if self._dirty:
+            self._recompute()
+        return super().subscribe(callback)
+
+    def _add_dependency(self, observable: Observable) -> None:
+        self._dependencies.add(observable)
+        observable._dependents.add(self)
+
+    def _recompute(self) -> None:
+        for dependency in self._dependencies:
+            dependency._dependents.discard(self)
+        self._dependencies = set()
+
+        _computing.append(self)
+        try:
+            self._value = self._compute()
+        finally:
+            _computing.pop()
+        self._dirty = False
+
+    def _invalidate(self) -> None:
+        if self._dirty:
+            return  # Dependents are already invalidated
+
+        self._dirty = True
+        if self._subscribers:
+            previous = self._value
+            self._recompute()
+            if not self._equals(self._value, previous):
+                self._notify()
+        else:
+            for dependent in list(self._dependents):
+                dependent._invalidate()
+
+
+def value_of(value: Union[T, Observable[T]]) -> T:
+    """Value of an observable, or value itself if it is not observable."""
+    return value.value if isinstance(value, Observable) else value
@@ -0,0 +1,290 @@
+"""Application runners
+
+Drive the imgui frame loop instead of writing a while loop per application.
+"""
+import heapq
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, List, Optional, Tuple
+
+import imgui
+
+from pyimgui_utils.callback import CallbackDispatcher
+from pyimgui_utils.scheduler import FrameScheduler, frame_scheduler
+
+
+class AsyncRunner:
+
+    def __init__(self,
+                 draw: Callable[[], None],
+                 process_inputs: Callable[[], bool],
+                 render: Callable[[], None],
+                 frame_rate: float = 60.,
+                 dispatcher: Optional[CallbackDispatcher] = None):
+        """Asyncio frame loop
+
+        Run the frame loop as an asyncio task at a target frame rate. Between
+        two frames the event loop runs other tasks, e.g. coroutine callbacks
+        of Button, MenuItem or DragButtons setters.
+
+        :param draw: Function drawing widgets, called between imgui.new_frame
+                     and imgui.render
+        :param process_inputs: Function polling backend events and feeding
+                               them to imgui. It returns False to stop
+        :param render: Function rendering imgui draw data and swapping buffers
+        :param frame_rate: Target number of frames per second
+        :param dispatcher: Optional callback dispatcher, flushed after each
+                           render
+        """
+        if frame_rate <= 0:
+            raise ValueError("frame_rate must be positive!")
+
+        self._draw = draw
+        self._process_inputs = process_inputs
+        self._render = render
+        self.frame_rate = frame_rate
+        self.dispatcher = dispatcher
+        self.frame_count = 0
+        self._should_stop = False
+
+    def stop(self) -> None:
+        """Stop the frame loop after the current frame."""
+        self._should_stop = True
+
+    def run(self) -> None:
+        """Run the frame loop in a new event loop until it stops."""
+        import asyncio  # Slow import, only paid by asyncio applications
+        asyncio.run(self.run_async())
+
+    async def run_async(self) -> None:
+        """Frame loop coroutine, to await in an already running event loop."""
+        import asyncio
+        loop = asyncio.get_running_loop()
+        self._should_stop = False
+        next_frame_time = loop.time()
+
+        while not self._should_stop:
+            if not self._process_inputs():
+                break
+
+            imgui.new_frame()
+            self._draw()
+            imgui.render()
+            self._render()
+            if self.dispatcher is not None:
+                self.dispatcher.flush()
+            self.frame_count += 1
+
+            # Sleep until next frame, yield to other tasks anyway when late
+            next_frame_time = max(next_frame_time + 1. / self.frame_rate,
+                                  loop.time())
+            await asyncio.sleep(next_frame_time - loop.time())
+
+
+@dataclass
+class RunnerStats:
+    frames: int = 0
+    wall_time: float = 0.  # Seconds spent in run
+    cpu_time: float = 0.  # Process CPU seconds spent in run
+    idle_time: float = 0.  # Seconds spent blocked waiting for events
+    frame_rate: float = 60.  # Target frame rate, used to compute savings
+
+    @property
+    def fps(self) -> float:
+        """Measured frames per second."""
+        return self.frames / self.wall_time if self.wall_time > 0 else 0.
+
+    @property
+    def cpu_usage(self) -> float:
+        """Measured CPU usage, 1.0 means one core fully used."""
+        return self.cpu_time / self.wall_time if self.wall_time > 0 else 0.
+
+    @property
+    def frames_saved(self) -> int:
+        """Frames not rendered compared to a loop always running at the
+        target frame rate.
+        """
+        return max(int(self.wall_time * self.frame_rate) - self.frames, 0)
+
+
+class FrameRunner:
+
+    def __init__(self,
+                 draw: Callable[[], None],
+                 process_inputs: Callable[[], bool],
+                 render: Callable[[], None],
+                 wait_events: Optional[Callable[[Optional[float]], bool]] = None,
+                 wake: Optional[Callable[[], None]] = None,
+                 frame_rate: float = 60.,
+                 extra_frames: int = 3,
+                 dispatcher: Optional[CallbackDispatcher] = None,
+                 scheduler: Optional[FrameScheduler] = None):
+        """Frame loop with idle mode
+
+        Render frames at the target frame rate while something changes, and
+        block on input events otherwise. The runner keeps drawing while:
+            - an input event has been received during the last extra_frames
+              frames, so animations and hover effects can settle,
+            - mark_dirty has been called, e.g. by a worker updating data,
+            - an imgui item is active or a text input has the focus,
+            - a dispatched callback has completed,
+            - jobs of the frame scheduler are unfinished, as windows step
+              them when they are drawn.
+        It wakes up for timers registered with add_timer, and for frames
+        requested with FrameScheduler.request_frame, e.g. by tooltips.
+
+        Without wait_events, the runner never idles and behaves like a plain
+        while loop.
+
+        :param draw: Function drawing widgets, called between imgui.new_frame
+                     and imgui.render
+        :param process_inputs: Function polling backend events and feeding
+                               them to imgui. It returns False to stop
+        :param render: Function rendering imgui draw data and swapping buffers
+        :param wait_events: Function blocking until a backend event arrives or
+                            timeout seconds elapsed (None means no timeout). It
+                            returns True if an event arrived, and must leave it
+                            for process_inputs.
+        :param wake: Thread-safe function interrupting wait_events, e.g.
+                     glfw.post_empty_event. Used by mark_dirty, add_timer and
+                     stop when called from another thread.
+        :param frame_rate: Target number of frames per second while active
+        :param extra_frames: Number of frames drawn after the last input
+        :param dispatcher: Optional callback dispatcher, flushed after each
+                           render
+        :param scheduler: Scheduler of the jobs of the drawn windows, the
+                          shared frame_scheduler if None
+        """
+        if frame_rate <= 0:
+            raise ValueError("frame_rate must be positive!")
+
+        self._draw = draw
+        self._process_inputs = process_inputs
+        self._render = render
+        self._wait_events = wait_events
+        self.frame_rate = frame_rate
+        self.extra_frames = extra_frames
+        self.dispatcher = dispatcher
+        self.scheduler = frame_scheduler if scheduler is None else scheduler
+        self.stats = RunnerStats(frame_rate=frame_rate)
+
+        self._remaining_frames = extra_frames
+        self._dirty = threading.Event()
+        self._timers: List[Tuple[float, int, Optional[Callable[[], None]]]] = []
+        self._timer_count = 0
+        self._timers_lock = threading.Lock()
+        self._should_stop = False
+        self._wake = (lambda: None) if wake is None else wake
+
+    def mark_dirty(self) -> None:
+        """Request a redraw, e.g. after a worker updated displayed data.
+        Thread-safe.
+        """
+        self._dirty.set()
+        self._wake()
+
+    def add_timer(self,
+                  delay: float,
+                  callback: Optional[Callable[[], None]] = None) -> None:
+        """Wake the runner up after delay seconds. Thread-safe.
+
+        :param delay: Delay in seconds
+        :param callback: Optional function called on the UI thread before the
+                         frame
+        """
+        with self._timers_lock:
+            self._timer_count += 1
+            heapq.heappush(self._timers,
+                           (time.perf_counter() + delay, self._timer_count, callback))
+        self._wake()
+
+    def stop(self) -> None:
+        """Stop the frame loop after the current frame."""
+        self._should_stop = True
+        self._wake()
+
+    def run(self) -> None:
+        """Run the frame loop until process_inputs returns False or stop is
+        called.
+        """
+        self._should_stop = False
+        start_wall = time.perf_counter()
+        start_cpu = time.process_time()
+        next_frame_time = start_wall
+
+        try:
+            while not self._should_stop:
+                if self._wait_events is not None and self._is_idle():
+                    wait_start = time.perf_counter()
+                    has_event = self._wait_events(self._next_timer_delay())
+                    self.stats.idle_time += time.perf_counter() - wait_start
+                    next_frame_time = time.perf_counter()
+                    if self._should_stop:
+                        break
+
+                    if has_event:
+                        self._remaining_frames = self.extra_frames
+                    elif self._is_idle():
+                        continue  # Spurious wake up
+
+                self._run_timers()
+                if not self._process_inputs():
+                    break
+
+                self._dirty.clear()
+                imgui.new_frame()
+                self._draw()
+                active = imgui.is_any_item_active() or imgui.get_io().want_text_input
+                imgui.render()
+                self._render()
+                if self.dispatcher is not None and self.dispatcher.flush() > 0:
+                    self._dirty.set()
+                self.stats.frames += 1
+
+                if active:
+                    self._remaining_frames = self.extra_frames
+                else:
+                    self._remaining_frames = max(self._remaining_frames - 1, 0)
+
+                next_frame_time = max(next_frame_time + 1. / self.frame_rate,
+                                      time.perf_counter())
+                delay = next_frame_time - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+        finally:
+            self.stats.wall_time += time.perf_counter() - start_wall
+            self.stats.cpu_time += time.process_time() - start_cpu
+
+    def _is_idle(self) -> bool:
+        """True if nothing requires a new frame."""
+        if self._remaining_frames > 0 or self._dirty.is_set():
+            return False
+
+        delay = self._next_timer_delay()
+        return delay is None or delay > 0
+
+    def _next_timer_delay(self) -> Optional[float]:
+        """Seconds before the next timer or scheduler frame, None if none."""
+        delay = self.scheduler.next_frame_delay()
+        with self._timers_lock:
+            if not self._timers:
+                return delay
+            timer_delay = max(self._timers[0][0] - time.perf_counter(), 0.)
+        return timer_delay if delay is None else min(timer_delay, delay)
+
+    def _run_timers(self) -> None:
+        """Call expired timer callbacks."""
+        if self.scheduler.pop_frame_request():
+            self._remaining_frames = max(self._remaining_frames, 1)
+
+        now = time.perf_counter()
+        expired = []
+        with self._timers_lock:
+            while self._timers and self._timers[0][0] <= now:
+                expired.append(heapq.heappop(self._timers)[2])
+
+        for callback in expired:
+            self._remaining_frames = max(self._remaining_frames, 1)
+            if callback is not None:
+                callback()
@@ -0,0 +1,217 @@
+"""Frame scheduler
+
+Time-slice bulk work, e.g. rebuilding an index or recomputing plots, over
+several frames instead of doing it all in one frame. Jobs are generators:
+each step runs until the next yield, and a frame runs steps of the jobs in
+turn until its time slice is spent.
+"""
+import logging
+import time
+from typing import Any, Callable, Dict, Generator, Hashable, List, Optional
+
+import imgui
+
+_log = logging.getLogger(__name__)
+
+JobGenerator = Generator[Optional[float], None, Any]
+
+
+class Job:
+
+    __slots__ = ("name", "key", "progress", "result", "error", "done", "cancelled",
+                 "steps", "elapsed", "_generator", "_on_done")
+
+    def __init__(self,
+                 generator: JobGenerator,
+                 name: str = "",
+                 key: Hashable = None,
+                 on_done: Optional[Callable[[Any], None]] = None):
+        """Job of a FrameScheduler
+
+        The generator yields its progress, between 0 and 1, or None if it is
+        unknown, after each step. Its return value is the result of the job.
+
+        :param generator: Generator doing the work
+        :param name: Displayed name of the job
+        :param key: Key of the job in the scheduler, see FrameScheduler.submit
+        :param on_done: Called with the result of the job (None if it failed)
+        """
+        self.name = name
+        self.key = key
+        self.progress: Optional[float] = 0.
+        self.result: Any = None
+        self.error: Optional[Exception] = None
+        self.done = False
+        self.cancelled = False
+        self.steps = 0
+        self.elapsed = 0.  # Seconds spent in steps
+        self._generator = generator
+        self._on_done = on_done
+
+    def cancel(self) -> None:
+        """Stop the job, the generator is closed."""
+        if self.done:
+            return
+        self.cancelled = True
+        self.done = True
+        self._generator.close()
+
+    def step(self) -> None:
+        """Run the generator until its next yield."""
+        start = time.perf_counter()
+        try:
+            self.progress = next(self._generator)
+        except StopIteration as stop:
+            self.progress = 1.
+            self._finish(stop.value)
+        except Exception as error:
+            _log.exception("Job %r failed", self.name)
+            self.error = error
+            self._finish(None)
+        self.steps += 1
+        self.elapsed += time.perf_counter() - start
+
+    def _finish(self, result: Any) -> None:
+        self.result = result
+        self.done = True
+        if self._on_done is None:
+            return
+        try:
+            self._on_done(result)
+        except Exception:
+            # Never let it escape the frame of the window running the scheduler
+            _log.exception("on_done of job %r failed", self.name)
+
+
+class FrameScheduler:
+
+    def __init__(self,
+                 frame_budget: float = 1. / 60,
+                 share: float = .25):
+        """Cooperative scheduler of generator jobs
+
+        Each frame, run steps of the jobs in turn, one step per job, until
+        share * frame_budget seconds are spent, e.g. 4ms of a 60 fps frame by
+        default. At least one step runs per frame, so a step should be short
+        compared to the slice. Jobs left unfinished resume on the next frames.
+
+        Windows run the shared frame_scheduler when they are drawn, see
+        ImGuiWindowAbstract.submit_job. It runs once per frame whatever the
+        number of windows, and FrameRunner keeps drawing frames while it has
+        unfinished jobs or a frame requested with request_frame is due.
+
+        :param frame_budget: Duration of a frame, in seconds
+        :param share: Part of the frame budget given to jobs
+        """
+        if frame_budget <= 0:
+            raise ValueError("frame_budget must be positive!")
+        if not 0 < share <= 1:
+            raise ValueError("share must be in ]0, 1]!")
+
+        self.frame_budget = frame_budget
+        self.share = share
+        self._jobs: List[Job] = []
+        self._keys: Dict[Hashable, Job] = {}
+        self._next = 0  # Index of the job stepped first on the next frame
+        self._frame_time = -1.
+        self._requested_time: Optional[float] = None  # perf_counter time of the earliest requested frame
+
+    def __len__(self) -> int:
+        return len(self._jobs)
+
+    @property
+    def time_slice(self) -> float:
+        """Time given to jobs per frame, in seconds."""
+        return self.frame_budget * self.share
+
+    @property
+    def jobs(self) -> List[Job]:
+        """Unfinished jobs, in submission order."""
+        return list(self._jobs)
+
+    def get(self, key: Hashable) -> Optional[Job]:
+        """Last job submitted with key, finished or not."""
+        return self._keys.get(key)
+
+    def request_frame(self, delay: float = 0.) -> None:
+        """Request a frame in delay seconds, e.g. to show a tooltip once its
+        hover delay is spent while FrameRunner idles. Not thread-safe, use
+        FrameRunner.mark_dirty from other threads.
+        """
+        requested_time = time.perf_counter() + delay
+        if self._requested_time is None or requested_time < self._requested_time:
+            self._requested_time = requested_time
+
+    def next_frame_delay(self) -> Optional[float]:
+        """Seconds before a frame is needed, 0 while jobs are unfinished,
+        None if no frame is needed.
+        """
+        if self._jobs:
+            return 0.
+        if self._requested_time is None:
+            return None
+        return max(self._requested_time - time.perf_counter(), 0.)
+
+    def pop_frame_request(self) -> bool:
+        """True if a requested frame is due, the request is then dropped."""
+        if self._requested_time is None or self._requested_time > time.perf_counter():
+            return False
+        self._requested_time = None
+        return True
+
+    def submit(self,
+               generator: JobGenerator,
+               name: str = "",
+               key: Hashable = None,
+               on_done: Optional[Callable[[Any], None]] = None) -> Job:
+        """Add a job, stepped from the next run.
+
+        :param generator: Generator doing the work, see Job
+        :param name: Displayed name of the job
+        :param key: Optional key, the unfinished job submitted with the same
+                    key is cancelled, e.g. to restart an index rebuild
+        :param on_done: Called with the result of the job (None if it failed)
+        :return: The job, to read its progress
+        """
+        if key is not None:
+            previous = self._keys.get(key)
+            if previous is not None:
+                previous.cancel()
+        job = Job(generator, name, key, on_done)
+        self._jobs.append(job)
+        if key is not None:
+            self._keys[key] = job
+        return job
+
+    def run(self) -> None:
+        """Run jobs for the time slice, once per frame."""
+        frame_time = imgui.get_time()
+        if frame_time == self._frame_time or not self._jobs:
+            return
+        self._frame_time = frame_time
+        self.run_for(self.time_slice)
+
+    def run_for(self, duration: float) -> int:
+        """Run jobs in turn for duration seconds, at least one step.
+
+        :return: Number of steps run
+        """
+        deadline = time.perf_counter() + duration
+        steps = 0
+        while self._jobs:
+            index = self._next % len(self._jobs)
+            job = self._jobs[index]
+            if not job.done:
+                job.step()
+                steps += 1
+            if job.done:
+                del self._jobs[index]
+                self._next = index  # The following job moved to index
+            else:
+                self._next = index + 1
+            if time.perf_counter() >= deadline:
+                break
+        return steps
+
+
+frame_scheduler = FrameScheduler()  # Shared by windows
@@ -0,0 +1,349 @@
+"""Virtual selectors
+
+Combo and list box over huge option sets, drawing only the visible options
+and filtering them incrementally by substring.
+"""
+import bisect
+import threading
+import time
+from array import array
+from itertools import compress, repeat
+from typing import Callable, List, Optional, Sequence, Union
+
+import imgui
+
+from pyimgui_utils.clipper import ListClipper
+from pyimgui_utils.interface import DrawableIT
+
+ItemSource = Union[Sequence[str], Callable[[int], str]]
+
+
+class _FilterState:
+    """Matches of a query, and the progress of the search."""
+
+    def __init__(self, query: str, narrowed: Optional[array], position: int):
+        self.query = query
+        self.matches = array("Q")
+        self.narrowed = narrowed  # Matches of the previous query, checked first
+        self.narrowed_position = 0
+        self.position = position  # Items before position have been searched
+
+
+class OptionFilter:
+
+    def __init__(self,
+                 items: ItemSource,
+                 count: Optional[int] = None,
+                 time_budget: float = 0.002,
+                 background_index: bool = True):
+        """Case insensitive substring filter of options
+
+        Options are read by index from a sequence, or from a callable when
+        count is given: only the index thread copies them.
+
+        A background thread builds a search index: the lowercased options,
+        and the same options joined in one string with the offset of each
+        one. Once it is ready, str.find over the whole string skips to the
+        next match, and the options following it are tested by chunks with
+        C level iteration (map, compress), so both rare and frequent
+        substrings are fast. Until then, options are tested one by one.
+
+        Each call to search or more works within time_budget, the remaining
+        options are searched by later calls to more, e.g. on the next
+        frames. When a query extends the previous one, only the previous
+        matches and the options not searched yet are searched again; when it
+        is shortened, the previous state is restored.
+
+        :param items: Sequence of options, or callable returning the option
+                      at an index, called from the index thread too
+        :param count: Number of options, required if items is a callable
+        :param time_budget: Maximum time spent in search or more, in seconds
+        :param background_index: False to never build the search index
+        """
+        if callable(items):
+            if count is None:
+                raise ValueError("count is required when items is a callable!")
+            self._get_item = items
+        else:
+            self._get_item = items.__getitem__
+            count = len(items) if count is None else count
+
+        self.count = count
+        self.time_budget = time_budget
+        self._labels: Optional[List[str]] = None  # Lowercased options
+        self._text: Optional[str] = None  # Lowercased options, separated by "\0"
+        self._offsets: Optional[array] = None  # Start of each option in _text
+        self._states: List[_FilterState] = [_FilterState("", None, count)]
+        if background_index:
+            threading.Thread(target=self._build_index, daemon=True).start()
+
+    def __getitem__(self, index: int) -> str:
+        return self._get_item(index)
+
+    @property
+    def is_indexed(self) -> bool:
+        return self._offsets is not None
+
+    @property
+    def query(self) -> str:
+        return self._states[-1].query
+
+    @property
+    def has_more(self) -> bool:
+        """True if the last query has options not searched yet."""
+        state = self._states[-1]
+        return state.position < self.count or (state.narrowed is not None
+                                               and state.narrowed_position < len(state.narrowed))
+
+    def result_count(self) -> int:
+        """Number of matches found so far, every option for an empty query."""
+        state = self._states[-1]
+        return self.count if state.query == "" else len(state.matches)
+
+    def result(self, position: int) -> int:
+        """Index of the option at a position of the results."""
+        state = self._states[-1]
+        return position if state.query == "" else state.matches[position]
+
+    def search(self, query: str) -> None:
+        """Filter the options containing query, within the time budget."""
+        query = query.lower()
+        while len(self._states) > 1 and not query.startswith(self._states[-1].query):
+            self._states.pop()
+
+        previous = self._states[-1]
+        if previous.query == query:
+            return
+
+        if previous.query == "":
+            state = _FilterState(query, None, 0)
+        else:
+            # Previous matches, then the options the previous search did not reach
+            narrowed = previous.matches
+            if previous.narrowed is not None:
+                narrowed = previous.matches + previous.narrowed[previous.narrowed_position:]
+            state = _FilterState(query, narrowed, previous.position)
+        self._states.append(state)
+        self.more()
+
+    def more(self) -> None:
+        """Search more options for the last query, within the time budget."""
+        state = self._states[-1]
+        deadline = time.perf_counter() + self.time_budget
+        if state.narrowed is not None:
+            self._search_narrowed(state, deadline)
+        if state.narrowed is None or state.narrowed_position == len(state.narrowed):
+            if self._offsets is not None:
+                self._search_index(state, deadline)
+            else:
+                self._search_items(state, deadline)
+
+    def _search_narrowed(self, state: _FilterState, deadline: float) -> None:
+        get_item, labels, query, narrowed = self._get_item, self._labels, state.query, state.narrowed
+        while state.narrowed_position < len(narrowed):
+            end = min(state.narrowed_position + 256, len(narrowed))
+            chunk = narrowed[state.narrowed_position:end]
+            if labels is None:
+                state.matches.extend(index for index in chunk if query in get_item(index).lower())
+            else:
+                state.matches.extend(compress(chunk, map(str.__contains__,
+                                                         map(labels.__getitem__, chunk), repeat(query))))
+            state.narrowed_position = end
+            if time.perf_counter() > deadline:
+                return
+
+    def _search_items(self, state: _FilterState, deadline: float) -> None:
+        get_item, query = self._get_item, state.query
+        while state.position < self.count:
+            end = min(state.position + 256, self.count)
+            state.matches.extend(index for index in range(state.position, end)
+                                 if query in get_item(index).lower())
+            state.position = end
+            if time.perf_counter() > deadline:
+                return
+
+    def _search_index(self, state: _FilterState, deadline: float) -> None:
+        labels, offsets, query = self._labels, self._offsets, state.query
+        find = self._text.find
+        while state.position < self.count:
+            offset = find(query, offsets[state.position])
+            if offset < 0:
+                state.position = self.count
+                return
+
+            # Test the chunk of options starting at the match
+            start = bisect.bisect_right(offsets, offset) - 1
+            end = min(start + 256, self.count)
+            state.matches.extend(compress(range(start, end),
+                                          map(str.__contains__, labels[start:end], repeat(query))))
+            state.position = end
+            if time.perf_counter() > deadline:
+                return
+
+    def _build_index(self) -> None:
+        get_item = self._get_item
+        labels = [get_item(index).lower() for index in range(self.count)]
+        offsets = array("Q", [0])
+        for label in labels:
+            offsets.append(offsets[-1] + len(label) + 1)
+        offsets.pop()  # Keep one offset per option
+        # "\0" can't be typed, so no match spans two options
+        self._text = "\0".join(labels)
+        self._labels = labels
+        self._offsets = offsets
+
+
+class VirtualListBox(DrawableIT):
+
+    def __init__(self,
+                 items: ItemSource,
+                 count: Optional[int] = None,
+                 label: str = "##virtual_list_box",
+                 width: float = -1.,
+                 height: float = 200.,
+                 show_filter: bool = True,
+                 on_select: Optional[Callable[[int], None]] = None,
+                 options: Optional[OptionFilter] = None):
+        """List box over a huge option set
+
+        Only the visible options are submitted, with a list clipper. A text
+        input above the list filters options containing the typed text, see
+        OptionFilter.
+
+        e.g.
+            parts = VirtualListBox(part_numbers, on_select=print)
+
+        :param items: Sequence of options, or callable returning the option at an index
+        :param count: Number of options, required if items is a callable
+        :param label: Label of the list box, unique in the window
+        :param width: Width of the list box, fill the available width if negative
+        :param height: Height of the option list
+        :param show_filter: True to draw the filter input
+        :param on_select: Called with the index of the clicked option
+        :param options: Filter to share between selectors, built from items if None
+        """
+        self.options = OptionFilter(items, count) if options is None else options
+        self.label = label
+        self.width = width
+        self.height = height
+        self.show_filter = show_filter
+        self.on_select = on_select
+        self.selected: Optional[int] = None
+        self.query = ""
+        self._wanted_results = 0
+
+    @property
+    def selected_label(self) -> str:
+        return "" if self.selected is None else self.options[self.selected]
+
+    def set_query(self, query: str) -> None:
+        self.query = query
+        self.options.search(query)
+
+    def select(self, index: Optional[int]) -> None:
+        self.selected = index
+        if index is not None and self.on_select is not None:
+            self.on_select(index)
+
+    def draw(self, *args, **kwargs) -> bool:
+        """Draw the filter input and the list.
+
+        :return: True if an option has been clicked
+        """
+        if self.show_filter:
+            self.draw_filter()
+        return self.draw_list()
+
+    def draw_filter(self) -> None:
+        imgui.set_next_item_width(self.width)
+        changed, query = imgui.input_text(f"{self.label}_filter", self.query, 256)
+        if changed:
+            self.set_query(query)
+
+    def draw_list(self) -> bool:
+        options = self.options
+        if options.query != self.query.lower():
+            options.search(self.query)  # The filter is shared, or was used by another query
+        if options.has_more:
+            options.more()
+
+        clicked = False
+        imgui.begin_child(self.label, self.width if self.width > 0 else 0, self.height, border=True)
+        for position in ListClipper(options.result_count()):
+            index = options.result(position)
+            if imgui.selectable(f"{options[index]}##{index}", index == self.selected)[0]:
+                self.select(index)
+                clicked = True
+        imgui.end_child()
+        return clicked
+
+
+class VirtualCombo(DrawableIT):
+
+    def __init__(self,
+                 items: ItemSource,
+                 count: Optional[int] = None,
+                 label: str = "##virtual_combo",
+                 width: float = -1.,
+                 popup_height: float = 300.,
+                 placeholder: str = "",
+                 on_select: Optional[Callable[[int], None]] = None,
+                 options: Optional[OptionFilter] = None):
+        """Combo over a huge option set
+
+        The popup holds a type-ahead filter input, focused when it opens,
+        and a VirtualListBox of the matching options. Clicking an option
+        selects it and closes the popup.
+
+        :param items: Sequence of options, or callable returning the option at an index
+        :param count: Number of options, required if items is a callable
+        :param label: Label of the combo
+        :param width: Width of the combo, fill the available width if negative
+        :param popup_height: Height of the option list in the popup
+        :param placeholder: Preview when no option is selected
+        :param on_select: Called with the index of the clicked option
+        :param options: Filter to share between selectors, built from items if None
+        """
+        self.label = label
+        self.width = width
+        self.placeholder = placeholder
+        self._list_box = VirtualListBox(items, count,
+                                        label=f"{label}_options",
+                                        height=popup_height,
+                                        on_select=on_select,
+                                        options=options)
+        self._was_open = False
+
+    @property
+    def options(self) -> OptionFilter:
+        return self._list_box.options
+
+    @property
+    def selected(self) -> Optional[int]:
+        return self._list_box.selected
+
+    def select(self, index: Optional[int]) -> None:
+        self._list_box.select(index)
+
+    def draw(self, *args, **kwargs) -> bool:
+        """Draw the combo.
+
+        :return: True if an option has been clicked
+        """
+        list_box = self._list_box
+        preview = self.placeholder if list_box.selected is None else list_box.selected_label
+        imgui.set_next_item_width(self.width)
+        combo = imgui.begin_combo(self.label, preview)
+        if not combo.opened:
+            self._was_open = False
+            return False
+
+        if not self._was_open:
+            imgui.set_keyboard_focus_here()
+            self._was_open = True
+        list_box.draw_filter()
+        clicked = list_box.draw_list()
+        if clicked:
+            imgui.close_current_popup()
+        imgui.end_combo()
+        return clicked
@@ -0,0 +1,263 @@
+"""Shape batch
+
+Accumulate squares, lines and circles in NumPy arrays and draw them in one
+OpenGL call, or through an imgui draw list.
+
+Requires numpy. This module is not imported by pyimgui_utils, import it
+explicitly:
+    from pyimgui_utils.shapes import ShapeBatch
+"""
+from typing import Optional, Sequence, Tuple, Union
+
+import imgui
+import numpy as np
+
+Color = Sequence[float]  # Rgb or rgba, between 0 and 1
+Colors = Union[Color, np.ndarray]  # One color, or one color per shape
+
+def _to_rgba8(colors: Colors, count: int) -> np.ndarray:
+    """Rgba uint8 array of count colors from one color or one per shape."""
+    colors = np.asarray(colors, dtype=np.float64)
+    if colors.shape[-1] not in (3, 4):
+        raise ValueError("colors must be rgb or rgba!")
+    if colors.shape[-1] == 3:
+        colors = np.concatenate((colors, np.ones(colors.shape[:-1] + (1,))), axis=-1)
+    colors = np.broadcast_to(colors, (count, 4))
+    return np.rint(np.clip(colors, 0., 1.) * 255).astype(np.uint8)
+
+
+class _ShapeArray:
+    """Growable rows of float parameters and rgba8 colors."""
+
+    __slots__ = ("params", "colors", "count")
+
+    def __init__(self, width: int, capacity: int):
+        self.params = np.empty((capacity, width), dtype=np.float32)
+        self.colors = np.empty((capacity, 4), dtype=np.uint8)
+        self.count = 0
+
+    def extend(self, params: np.ndarray, colors: np.ndarray) -> None:
+        end = self.count + len(params)
+        if end > len(self.params):
+            capacity = max(end, 2 * len(self.params))
+            self.params = np.resize(self.params, (capacity, self.params.shape[1]))
+            self.colors = np.resize(self.colors, (capacity, 4))
+        self.params[self.count:end] = params
+        self.colors[self.count:end] = colors
+        self.count = end
+
+    def rows(self) -> Tuple[np.ndarray, np.ndarray]:
+        return self.params[:self.count], self.colors[:self.count]
+
+
+class ShapeBatch:
+
+    def __init__(self, circle_segments: int = 24, capacity: int = 1024):
+        """Batch of shapes
+
+        Shapes are stored in contiguous arrays, per kind. Adding many shapes
+        at once with add_squares, add_lines or add_circles is vectorized.
+
+        render_gl tessellates the batch into one triangle array, cached until
+        the batch changes, and draws it with a single glDrawArrays call. It
+        uses client vertex arrays: like glBegin/glEnd, it requires a
+        compatibility OpenGL context, e.g. the pygame backend. Coordinates
+        are then in normalized device coordinates, [0, 0] being the center
+        of the screen.
+
+        render_draw_list adds the shapes to an imgui draw list, the
+        background one by default. Coordinates are then in pixels. pyimgui
+        has no bulk vertex upload, so each shape still costs one call: only
+        the call arguments are cached.
+
+        e.g.
+            batch = ShapeBatch()
+            batch.add_squares(positions, .4, (1, 0, 0))
+            backend.background_functions.append(batch.render_gl)
+
+        :param circle_segments: Number of segments of circles
+        :param capacity: Initial number of shapes of each kind
+        """
+        if circle_segments < 3:
+            raise ValueError("circle_segments must be at least 3!")
+
+        self.circle_segments = circle_segments
+        self._squares = _ShapeArray(3, capacity)  # x, y, size
+        self._lines = _ShapeArray(5, capacity)  # x0, y0, x1, y1, thickness
+        self._circles = _ShapeArray(3, capacity)  # x, y, radius
+        self._vertices: Optional[Tuple[np.ndarray, np.ndarray]] = None
+        self._draw_list_args: Optional[Tuple[list, list, list]] = None  # Rects, lines and circles
+
+    def __len__(self) -> int:
+        return self._squares.count + self._lines.count + self._circles.count
+
+    def clear(self) -> None:
+        """Remove every shape, the arrays are kept for reuse."""
+        self._squares.count = self._lines.count = self._circles.count = 0
+        self._changed()
+
+    def add_square(self, center: Sequence[float], size: float, color: Color) -> None:
+        self.add_squares([center], size, color)
+
+    def add_squares(self,
+                    centers: Union[Sequence[Sequence[float]], np.ndarray],
+                    sizes: Union[float, np.ndarray],
+                    colors: Colors) -> None:
+        """Add squares.
+
+        :param centers: Array of shape (N, 2)
+        :param sizes: Side length, one for all squares or one per square
+        :param colors: One color for all squares or an array of shape (N, 3|4)
+        """
+        centers = np.asarray(centers, dtype=np.float32).reshape(-1, 2)
+        params = np.column_stack((centers, np.broadcast_to(sizes, len(centers))))
+        self._squares.extend(params, _to_rgba8(colors, len(centers)))
+        self._changed()
+
+    def add_line(self, start: Sequence[float], end: Sequence[float], color: Color,
+                 thickness: float = 1.) -> None:
+        self.add_lines([start], [end], color, thickness)
+
+    def add_lines(self,
+                  starts: Union[Sequence[Sequence[float]], np.ndarray],
+                  ends: Union[Sequence[Sequence[float]], np.ndarray],
+                  colors: Colors,
+                  thickness: Union[float, np.ndarray] = 1.) -> None:
+        """Add line segments.
+
+        :param starts: Array of shape (N, 2)
+        :param ends: Array of shape (N, 2)
+        :param colors: One color for all lines or an array of shape (N, 3|4)
+        :param thickness: Thickness, one for all lines or one per line
+        """
+        starts = np.asarray(starts, dtype=np.float32).reshape(-1, 2)
+        ends = np.asarray(ends, dtype=np.float32).reshape(-1, 2)
+        if len(starts) != len(ends):
+            raise ValueError("starts and ends must have the same length!")
+        params = np.column_stack((starts, ends, np.broadcast_to(thickness, len(starts))))
+        self._lines.extend(params, _to_rgba8(colors, len(starts)))
+        self._changed()
+
+    def add_circle(self, center: Sequence[float], radius: float, color: Color) -> None:
+        self.add_circles([center], radius, color)
+
+    def add_circles(self,
+                    centers: Union[Sequence[Sequence[float]], np.ndarray],
+                    radii: Union[float, np.ndarray],
+                    colors: Colors) -> None:
+        """Add filled circles.
+
+        :param centers: Array of shape (N, 2)
+        :param radii: Radius, one for all circles or one per circle
+        :param colors: One color for all circles or an array of shape (N, 3|4)
+        """
+        centers = np.asarray(centers, dtype=np.float32).reshape(-1, 2)
+        params = np.column_stack((centers, np.broadcast_to(radii, len(centers))))
+        self._circles.extend(params, _to_rgba8(colors, len(centers)))
+        self._changed()
+
+    def _changed(self) -> None:
+        self._vertices = None
+        self._draw_list_args = None
+
+    def vertices(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Triangles of the batch, cached until it changes.
+
+        :return: Positions, float32 array of shape (V, 2), and colors, uint8
+                 array of shape (V, 4), three vertices per triangle
+        """
+        if self._vertices is None:
+            parts = [self._square_triangles(), self._line_triangles(), self._circle_triangles()]
+            self._vertices = (np.concatenate([positions for positions, _ in parts]),
+                              np.concatenate([colors for _, colors in parts]))
+        return self._vertices
+
+    def _square_triangles(self) -> Tuple[np.ndarray, np.ndarray]:
+        params, colors = self._squares.rows()
+        half = params[:, 2:3] / 2
+        x0, y0 = params[:, 0:1] - half, params[:, 1:2] - half
+        x1, y1 = params[:, 0:1] + half, params[:, 1:2] + half
+        positions = np.stack((np.hstack((x0, x0, x1, x0, x1, x1)),
+                              np.hstack((y0, y1, y1, y0, y1, y0))), axis=-1)
+        return positions.reshape(-1, 2), np.repeat(colors, 6, axis=0)
+
+    def _line_triangles(self) -> Tuple[np.ndarray, np.ndarray]:
+        params, colors = self._lines.rows()
+        starts, ends = params[:, 0:2], params[:, 2:4]
+        directions = ends - starts
+        lengths = np.linalg.norm(directions, axis=1, keepdims=True)
+        normals = directions[:, ::-1] * np.array([-1., 1.], dtype=np.float32)
+        normals *= params[:, 4:5] / 2 / np.maximum(lengths, np.finfo(np.float32).tiny)
+        corners = (starts + normals, starts - normals, ends - normals, ends + normals)
+        positions = np.stack([corners[index] for index in (0, 1, 2, 0, 2, 3)], axis=1)
+        return positions.reshape(-1, 2), np.repeat(colors, 6, axis=0)
+
+    def _circle_triangles(self) -> Tuple[np.ndarray, np.ndarray]:
+        params, colors = self._circles.rows()
+        angles = np.linspace(0., 2 * np.pi, self.circle_segments + 1, dtype=np.float32)
+        unit = np.stack((np.cos(angles), np.sin(angles)), axis=-1)
+        rims = params[:, None, 0:2] + params[:, None, 2:3] * unit  # (N, segments + 1, 2)
+        positions = np.empty((len(params), self.circle_segments, 3, 2), dtype=np.float32)
+        positions[:, :, 0] = params[:, None, 0:2]
+        positions[:, :, 1] = rims[:, :-1]
+        positions[:, :, 2] = rims[:, 1:]
+        return positions.reshape(-1, 2), np.repeat(colors, 3 * self.circle_segments, axis=0)
+
+    def render_gl(self) -> None:
+        """Draw the batch with one glDrawArrays call, e.g. as a backend
+        background function.
+        """
+        import OpenGL.GL as gl  # Only required by this renderer, as by the backends
+
+        positions, colors = self.vertices()
+        if len(positions) == 0:
+            return
+
+        gl.glEnableClientState(gl.GL_VERTEX_ARRAY)
+        gl.glEnableClientState(gl.GL_COLOR_ARRAY)
+        gl.glVertexPointer(2, gl.GL_FLOAT, 0, positions)
+        gl.glColorPointer(4, gl.GL_UNSIGNED_BYTE, 0, colors)
+        gl.glDrawArrays(gl.GL_TRIANGLES, 0, len(positions))
+        gl.glDisableClientState(gl.GL_COLOR_ARRAY)
+        gl.glDisableClientState(gl.GL_VERTEX_ARRAY)
+
+    def render_draw_list(self, draw_list=None) -> None:
+        """Add the batch to an imgui draw list, call between new_frame and render.
+
+        :param draw_list: Target draw list, the background one if None
+        """
+        if draw_list is None:
+            draw_list = imgui.get_background_draw_list()
+
+        rects, lines, circles = self._get_draw_list_args()
+        add_rect_filled = draw_list.add_rect_filled
+        for rect in rects:
+            add_rect_filled(*rect)
+
+        add_line = draw_list.add_line
+        for line in lines:
+            add_line(*line)
+
+        add_circle_filled = draw_list.add_circle_filled
+        for circle in circles:
+            add_circle_filled(*circle)
+
+    def _get_draw_list_args(self) -> Tuple[list, list, list]:
+        """Arguments of the draw list calls, cached until the batch changes."""
+        if self._draw_list_args is None:
+            # imgui packs colors as r | g << 8 | b << 16 | a << 24
+            params, colors = self._squares.rows()
+            half = params[:, 2] / 2
+            rects = list(zip((params[:, 0] - half).tolist(), (params[:, 1] - half).tolist(),
+                             (params[:, 0] + half).tolist(), (params[:, 1] + half).tolist(),
+                             colors.view("<u4").ravel().tolist()))
+
+            params, colors = self._lines.rows()
+            lines = list(zip(*params[:, :4].T.tolist(), colors.view("<u4").ravel().tolist(),
+                             params[:, 4].tolist()))
+
+            params, colors = self._circles.rows()
+            circles = list(zip(*params.T.tolist(), colors.view("<u4").ravel().tolist(),
+                               [self.circle_segments] * len(params)))
+            self._draw_list_args = (rects, lines, circles)
+        return self._draw_list_args
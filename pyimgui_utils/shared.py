@@ -0,0 +1,148 @@
+"""Shared memory bridge
+
+Drive widgets from a simulation running in another process without pickling
+values through pipes. Values live in a multiprocessing.shared_memory block
+and are exposed as a NumPy array, which DragButtons draws and writes in
+place.
+
+Requires numpy and python 3.8+. This module is not imported by
+pyimgui_utils, import it explicitly:
+    from pyimgui_utils.shared import SharedArray
+"""
+import time
+from contextlib import contextmanager
+from multiprocessing import shared_memory
+from typing import Any, Callable, Iterator, List, Optional, Tuple, Union
+
+import numpy as np
+
+_HEADER_SIZE = 16  # int64 sequence number, padded to keep values aligned
+
+
+class SharedArray:
+
+    def __init__(self,
+                 shape: Union[int, Tuple[int, ...]],
+                 dtype: Any = np.float64,
+                 name: Optional[str] = None,
+                 create: bool = True):
+        """NumPy array in shared memory
+
+        The array is created by one process and attached by name from the
+        others, with the same shape and dtype, e.g.
+            params = SharedArray(3)  # UI process
+            params = SharedArray(3, name=params.name, create=False)  # Simulation
+
+        Consistent reads use a sequence number protocol (seqlock): the writer
+        makes the sequence number odd while it writes and even again once
+        done. read copies the values and retries until the sequence number
+        is even and unchanged across the copy. Each array must have a single
+        writer process: use one array per direction, e.g. parameters written
+        by the UI and state written by the simulation.
+
+        The writer process uses values directly, e.g.
+            drag_buttons.draw(params.values, params.setters())
+
+        :param shape: Shape of the array
+        :param dtype: NumPy dtype of the values
+        :param name: Name of the shared memory block, generated if None
+        :param create: Create the block if True, attach an existing one otherwise
+        """
+        self.shape: Tuple[int, ...] = (shape,) if isinstance(shape, int) else tuple(shape)
+        self.dtype = np.dtype(dtype)
+        size = _HEADER_SIZE + int(np.prod(self.shape)) * self.dtype.itemsize
+
+        if create:
+            self._shm = shared_memory.SharedMemory(name=name, create=True, size=size)
+        else:
+            self._shm = shared_memory.SharedMemory(name=name)
+            if self._shm.size < size:
+                self._shm.close()
+                raise ValueError("Shared memory block is smaller than the array!")
+
+        self._is_owner = create
+        self._sequence = np.ndarray((1,), dtype=np.int64, buffer=self._shm.buf)
+        self.values: np.ndarray = np.ndarray(self.shape, dtype=self.dtype,
+                                             buffer=self._shm.buf, offset=_HEADER_SIZE)
+        if create:
+            self._sequence[0] = 0
+            self.values.fill(0)
+
+        self._setters: List[Callable[[Any], None]] = []
+
+    @property
+    def name(self) -> str:
+        """Name to attach the block from another process."""
+        return self._shm.name
+
+    @property
+    def sequence(self) -> int:
+        """Sequence number, incremented twice by each write. Compare it with
+        a previous value to know whether the array changed.
+        """
+        return int(self._sequence[0])
+
+    @contextmanager
+    def write(self) -> Iterator[np.ndarray]:
+        """Write several values as a single update.
+
+        e.g.
+            with state.write() as values:
+                values[:] = positions
+        """
+        self._sequence[0] += 1  # Odd: write in progress
+        try:
+            yield self.values
+        finally:
+            self._sequence[0] += 1
+
+    def set(self, index: Any, value: Any) -> None:
+        """Write one value, or a slice, as a single update."""
+        with self.write() as values:
+            values[index] = value
+
+    def setters(self) -> List[Callable[[Any], None]]:
+        """Setters of each value of a one dimension array, cached."""
+        if len(self.shape) != 1:
+            raise ValueError("Setters require a one dimension array!")
+
+        if not self._setters:
+            self._setters = [lambda value, index=index: self.set(index, value)
+                             for index in range(self.shape[0])]
+        return self._setters
+
+    def read(self, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """Copy the values written by another process, consistently.
+
+        :param out: Optional array receiving the values, to avoid allocations
+        :return: The copied values
+        """
+        if out is None:
+            out = np.empty(self.shape, dtype=self.dtype)
+
+        while True:
+            start = self._sequence[0]
+            if start % 2 == 0:
+                np.copyto(out, self.values)
+                if self._sequence[0] == start:
+                    return out
+            time.sleep(0)  # Let the writer finish
+
+    def close(self) -> None:
+        """Detach the block from this process. values can't be used anymore."""
+        self.values = None
+        self._sequence = None
+        self._setters = []
+        self._shm.close()
+
+    def unlink(self) -> None:
+        """Destroy the block, once every process closed it."""
+        self._shm.unlink()
+
+    def __enter__(self) -> "SharedArray":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+        if self._is_owner:
+            self.unlink()
@@ -0,0 +1,148 @@
+"""Keyboard shortcuts
+
+Parse shortcut strings such as "Ctrl+Shift+S" into hashable key chords and
+index them so that a key event can be resolved to an action in O(1).
+"""
+from typing import Callable, Dict, NamedTuple, Optional, Tuple
+
+_MODIFIER_ALIASES = {
+    "ctrl": "ctrl",
+    "control": "ctrl",
+    "shift": "shift",
+    "alt": "alt",
+    "option": "alt",
+    "super": "super",
+    "cmd": "super",
+    "command": "super",
+    "meta": "super",
+    "win": "super",
+}
+
+_KEY_ALIASES = {
+    "del": "DELETE",
+    "esc": "ESCAPE",
+    "return": "ENTER",
+    "ins": "INSERT",
+    "pgup": "PAGEUP",
+    "pgdown": "PAGEDOWN",
+    "page up": "PAGEUP",
+    "page down": "PAGEDOWN",
+}
+
+
+class KeyChord(NamedTuple):
+    """A key together with its modifiers. Hashable, used as index key."""
+    key: str
+    ctrl: bool = False
+    shift: bool = False
+    alt: bool = False
+    super: bool = False
+
+
+def normalize_key(key: str) -> str:
+    """Normalize a key name.
+
+    Key names coming from different backends do not share the same case
+    (e.g. pygame.key.name returns 'a' while a menu shortcut reads 'A').
+
+    :param key: Key name, e.g. 'a', 'F1', 'Delete'
+    :return: The canonical, upper case, key name.
+    """
+    key = key.strip()
+    if key == "":
+        raise ValueError("Empty key name!")
+    alias = _KEY_ALIASES.get(key.lower())
+    return alias if alias is not None else key.upper()
+
+
+def parse_chord(shortcut: str) -> KeyChord:
+    """Parse a shortcut string into a KeyChord.
+
+    Modifiers and key are separated by '+', e.g. "Ctrl+Shift+S".
+    A trailing '+' is accepted as the plus key, e.g. "Ctrl++".
+
+    :param shortcut: Shortcut as displayed in a menu item.
+    :return: The corresponding KeyChord.
+    """
+    if not isinstance(shortcut, str):
+        raise TypeError("shortcut must be a str!")
+
+    shortcut = shortcut.strip()
+    if shortcut.endswith("++"):
+        parts = shortcut[:-2].split("+") + ["+"]
+    elif shortcut == "+":
+        parts = ["+"]
+    else:
+        parts = shortcut.split("+")
+
+    modifiers = set()
+    for part in parts[:-1]:
+        modifier = _MODIFIER_ALIASES.get(part.strip().lower())
+        if modifier is None:
+            raise ValueError(f"Unknown modifier '{part}' in shortcut '{shortcut}'!")
+        modifiers.add(modifier)
+
+    return KeyChord(key=normalize_key(parts[-1]),
+                    ctrl="ctrl" in modifiers,
+                    shift="shift" in modifiers,
+                    alt="alt" in modifiers,
+                    super="super" in modifiers)
+
+
+class ShortcutIndex:
+    """Hash index from key chords to actions.
+
+    Each entry holds an action and an optional predicate which tells whether
+    the action is currently enabled. The predicate is evaluated at dispatch
+    time only, so flags can change without rebuilding the index.
+    """
+
+    def __init__(self):
+        self._index: Dict[KeyChord, Tuple[Callable[[], None],
+                                          Optional[Callable[[], bool]]]] = {}
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def __contains__(self, chord: KeyChord) -> bool:
+        return chord in self._index
+
+    def clear(self) -> None:
+        """Remove every entry of the index."""
+        self._index.clear()
+
+    def register(self,
+                 shortcut: str,
+                 action: Callable[[], None],
+                 is_enabled: Optional[Callable[[], bool]] = None) -> KeyChord:
+        """Register an action for a shortcut.
+
+        The first registration of a chord wins, as imgui would only display
+        duplicated shortcuts without resolving the conflict.
+
+        :param shortcut: Shortcut string, e.g. "Ctrl+S"
+        :param action: Function to call when the shortcut is dispatched
+        :param is_enabled: Optional predicate, the action is skipped if it
+                           returns False
+        :return: The parsed chord
+        """
+        chord = parse_chord(shortcut)
+        self._index.setdefault(chord, (action, is_enabled))
+        return chord
+
+    def dispatch(self, chord: KeyChord) -> bool:
+        """Call the action bound to chord.
+
+        :param chord: Pressed key chord
+        :return: True if an enabled action has been called, False otherwise.
+        """
+        entry = self._index.get(chord)
+        if entry is None:
+            return False
+
+        action, is_enabled = entry
+        if is_enabled is not None and not is_enabled():
+            return False
+
+        action()
+        return True
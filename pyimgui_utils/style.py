@@ -0,0 +1,240 @@
+"""Themes
+
+Group style colors and variables in a Theme and push them through a
+StyleStack, which skips the entries already active and pops the right count.
+"""
+import weakref
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple, Union
+
+import imgui
+
+Color = Tuple[float, float, float, float]
+StyleVarValue = Union[float, Tuple[float, float]]
+
+_MISSING = object()
+
+
+def _to_rgba(color: Sequence[float]) -> Color:
+    """Color tuple with an alpha channel, opaque if color is rgb."""
+    if len(color) == 3:
+        return float(color[0]), float(color[1]), float(color[2]), 1.0
+    if len(color) == 4:
+        return float(color[0]), float(color[1]), float(color[2]), float(color[3])
+    raise ValueError("Colors must be rgb or rgba sequences!")
+
+
+def _to_style_var_value(value: Union[float, Sequence[float]]) -> StyleVarValue:
+    if isinstance(value, (int, float)):
+        return float(value)
+    if len(value) == 2:
+        return float(value[0]), float(value[1])
+    raise ValueError("Style variables must be floats or 2 float sequences!")
+
+
+class Theme:
+
+    __slots__ = ("colors", "style_vars", "_hash")
+
+    def __init__(self,
+                 colors: Optional[Dict[int, Sequence[float]]] = None,
+                 style_vars: Optional[Dict[int, Union[float, Sequence[float]]]] = None):
+        """Theme
+
+        Set of style colors and variables. Entries are converted once, when
+        the theme is created, into the tuples pushed to imgui.
+
+        e.g.
+            Theme(colors={imgui.COLOR_BUTTON: (.5, 0., 0.)},
+                  style_vars={imgui.STYLE_FRAME_ROUNDING: 6.})
+
+        :param colors: imgui color indexes (imgui.COLOR_*) mapped to rgb or rgba
+                       colors
+        :param style_vars: imgui style variables (imgui.STYLE_*) mapped to a
+                           float or a 2 float tuple
+        """
+        self.colors: Tuple[Tuple[int, Color], ...] = tuple(
+            (index, _to_rgba(color)) for index, color in ({} if colors is None else colors).items()
+        )
+        self.style_vars: Tuple[Tuple[int, StyleVarValue], ...] = tuple(
+            (index, _to_style_var_value(value))
+            for index, value in ({} if style_vars is None else style_vars).items()
+        )
+        self._hash = hash((self.colors, self.style_vars))
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, Theme):
+            return NotImplemented
+        return self.colors == other.colors and self.style_vars == other.style_vars
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def __repr__(self) -> str:
+        return f"Theme(colors={dict(self.colors)}, style_vars={dict(self.style_vars)})"
+
+
+class StyleStack:
+
+    def __init__(self):
+        """Style stack
+
+        Push themes and keep track of the colors and variables they made
+        active. An entry equal to the active one is not pushed again, e.g. a
+        button inside a window with the same button colors, and pop removes
+        exactly what the matching push added.
+
+        Entries pushed directly with imgui.push_style_* are unknown to the
+        stack: they are never skipped, nor popped.
+        """
+        self._active_colors: Dict[int, Color] = {}
+        self._active_vars: Dict[int, StyleVarValue] = {}
+        # Per push: pushed colors count, pushed variables count, previous active entries
+        self._frames: List[Tuple[int, int, List[Tuple[Dict, int, Any]]]] = []
+
+    @property
+    def depth(self) -> int:
+        """Number of themes pushed and not popped yet."""
+        return len(self._frames)
+
+    def push(self, theme: Theme) -> None:
+        """Push the entries of theme which differ from the active ones."""
+        restore = []
+        color_count = 0
+        for index, color in theme.colors:
+            previous = self._active_colors.get(index, _MISSING)
+            if previous == color:
+                continue
+            imgui.push_style_color(index, *color)
+            self._active_colors[index] = color
+            restore.append((self._active_colors, index, previous))
+            color_count += 1
+
+        var_count = 0
+        for index, value in theme.style_vars:
+            previous = self._active_vars.get(index, _MISSING)
+            if previous == value:
+                continue
+            imgui.push_style_var(index, value)
+            self._active_vars[index] = value
+            restore.append((self._active_vars, index, previous))
+            var_count += 1
+
+        self._frames.append((color_count, var_count, restore))
+
+    def pop(self) -> None:
+        """Pop the entries pushed by the last push."""
+        if not self._frames:
+            raise RuntimeError("No theme to pop!")
+
+        color_count, var_count, restore = self._frames.pop()
+        if color_count > 0:
+            imgui.pop_style_color(color_count)
+        if var_count > 0:
+            imgui.pop_style_var(var_count)
+
+        for active, index, previous in reversed(restore):
+            if previous is _MISSING:
+                del active[index]
+            else:
+                active[index] = previous
+
+    def pop_to(self, depth: int) -> None:
+        """Pop the themes pushed after depth, e.g. after an exception
+        skipped their pop.
+
+        :param depth: Depth to restore, as read before the pushes
+        """
+        while len(self._frames) > depth:
+            self.pop()
+
+    @contextmanager
+    def apply(self, theme: Theme) -> Iterator[None]:
+        """Push theme for the duration of a with block."""
+        self.push(theme)
+        try:
+            yield
+        finally:
+            self.pop()
+
+
+class ButtonStyle:
+    """Immutable button colors and size, shared by every button with the
+    same values.
+
+    Instances are interned while they are used: creating a style equal to an
+    existing one returns the existing instance, so thousands of buttons with
+    the same look share a single style and its precomputed themes. A missing hovered or active
+    color defaults to the neutral one, so equivalent styles are interned
+    together.
+    """
+
+    __slots__ = ("color", "color_hovered", "color_active",
+                 "hold_color", "hold_color_hovered", "hold_color_active",
+                 "width", "height", "theme", "hold_theme", "__weakref__")
+
+    # Styles no button uses anymore are dropped
+    _interned: "weakref.WeakValueDictionary[tuple, ButtonStyle]" = weakref.WeakValueDictionary()
+
+    def __new__(cls,
+                color: Optional[Sequence[float]] = None,
+                color_hovered: Optional[Sequence[float]] = None,
+                color_active: Optional[Sequence[float]] = None,
+                hold_color: Optional[Sequence[float]] = None,
+                hold_color_hovered: Optional[Sequence[float]] = None,
+                hold_color_active: Optional[Sequence[float]] = None,
+                width: float = 0,
+                height: float = 0) -> "ButtonStyle":
+        """Interned button style
+
+        :param color: Rgb color of the button, imgui style color if None
+        :param color_hovered: Rgb color when hovered
+        :param color_active: Rgb color when active
+        :param hold_color: Rgb color when held, grey if None
+        :param hold_color_hovered: Rgb color when held and hovered
+        :param hold_color_active: Rgb color when held and active
+        :param width: Width of the button, 0 to fit the label
+        :param height: Height of the button, 0 to fit the label
+        """
+        color = None if color is None else tuple(color)
+        color_hovered = color if color_hovered is None else tuple(color_hovered)
+        color_active = color if color_active is None else tuple(color_active)
+        hold_color = (0.5, 0.5, 0.5) if hold_color is None else tuple(hold_color)
+        hold_color_hovered = hold_color if hold_color_hovered is None else tuple(hold_color_hovered)
+        hold_color_active = hold_color if hold_color_active is None else tuple(hold_color_active)
+
+        key = (color, color_hovered, color_active,
+               hold_color, hold_color_hovered, hold_color_active, width, height)
+        style = cls._interned.get(key)
+        if style is not None:
+            return style
+
+        style = super().__new__(cls)
+        for name, value in zip(cls.__slots__, key):
+            object.__setattr__(style, name, value)
+        object.__setattr__(style, "theme", None if color is None else _button_theme(
+            color, color_hovered, color_active))
+        object.__setattr__(style, "hold_theme", _button_theme(
+            hold_color, hold_color_hovered, hold_color_active))
+        cls._interned[key] = style
+        return style
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError("ButtonStyle is immutable!")
+
+    def __reduce__(self):
+        return ButtonStyle, (self.color, self.color_hovered, self.color_active,
+                             self.hold_color, self.hold_color_hovered, self.hold_color_active,
+                             self.width, self.height)
+
+
+def _button_theme(color: Sequence[float],
+                  color_hovered: Sequence[float],
+                  color_active: Sequence[float]) -> Theme:
+    """Theme of neutral, hovered and active button colors."""
+    return Theme(colors={imgui.COLOR_BUTTON: color,
+                         imgui.COLOR_BUTTON_HOVERED: color_hovered,
+                         imgui.COLOR_BUTTON_ACTIVE: color_active})
+
+
+style_stack = StyleStack()  # Shared by widgets and windows
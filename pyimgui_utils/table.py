@@ -0,0 +1,229 @@
+"""Data table
+
+Sortable table over NumPy arrays, drawing only the visible rows.
+
+Requires numpy. This module is not imported by pyimgui_utils, import it
+explicitly:
+    from pyimgui_utils.table import DataTable
+"""
+from typing import Dict, List, Mapping, Optional, Sequence, Tuple, Union
+
+import imgui
+import numpy as np
+
+from pyimgui_utils.clipper import visible_range
+from pyimgui_utils.interface import DrawableIT
+
+SortKey = Tuple[Tuple[int, bool], ...]  # (column index, descending) by priority
+
+
+class DataTable(DrawableIT):
+
+    def __init__(self,
+                 data: Union[np.ndarray, Mapping[str, np.ndarray]],
+                 columns: Optional[Sequence[str]] = None,
+                 formats: Optional[Mapping[str, str]] = None,
+                 label: str = "##data_table",
+                 height: float = 0.,
+                 flags: int = (imgui.TABLE_SORTABLE | imgui.TABLE_SORT_MULTI
+                               | imgui.TABLE_RESIZABLE | imgui.TABLE_ROW_BACKGROUND
+                               | imgui.TABLE_BORDERS)):
+        """Data table
+
+        Display a structured array, or a dict of column arrays of the same
+        length, in an imgui table. Only the visible rows are submitted, the
+        rows above and below are replaced by a spacer row each.
+
+        Clicking headers sorts the table, a sort set with sort before the
+        first draw is kept until a header is clicked. The sort index of each
+        column and direction is computed with a stable argsort the first time
+        it is needed and cached until set_data is called. Rows are
+        filtered with a boolean mask: only row indexes are selected, the
+        data is never copied.
+
+        :param data: Structured array or dict of 1 dimension arrays
+        :param columns: Names of the displayed columns, all of them if None
+        :param formats: Format specs of columns, e.g. {"price": ".2f"}
+        :param label: Label of the imgui table, unique in the window
+        :param height: Height of the table, fill the window if 0
+        :param flags: imgui table flags, TABLE_SCROLL_Y is always added
+        """
+        self.label = label
+        self.height = height
+        self.flags = flags | imgui.TABLE_SCROLL_Y
+        self._formats = {} if formats is None else dict(formats)
+        self._column_names: List[str] = []
+        self._columns: List[np.ndarray] = []
+        self._row_count = 0
+        self._column_orders: Dict[Tuple[int, bool], np.ndarray] = {}
+        self._sort_orders: Dict[SortKey, np.ndarray] = {}
+        self._sort_key: SortKey = ()
+        self._specs_read = False  # True once the table sort specs have been read
+        self._mask: Optional[np.ndarray] = None
+        self._rows: Optional[np.ndarray] = None  # Visible row indexes, None if outdated
+        self.set_data(data, columns)
+
+    @property
+    def row_count(self) -> int:
+        """Number of rows once filtered."""
+        return len(self.rows)
+
+    @property
+    def sort_key(self) -> SortKey:
+        return self._sort_key
+
+    @property
+    def rows(self) -> np.ndarray:
+        """Indexes of the displayed rows in the data, in display order."""
+        if self._rows is None:
+            order = self._sort_order(self._sort_key)
+            if self._mask is None:
+                self._rows = np.arange(self._row_count) if order is None else order
+            elif order is None:
+                self._rows = np.flatnonzero(self._mask)
+            else:
+                self._rows = order[self._mask[order]]
+        return self._rows
+
+    def set_data(self,
+                 data: Union[np.ndarray, Mapping[str, np.ndarray]],
+                 columns: Optional[Sequence[str]] = None) -> None:
+        """Replace the data, cached sort indexes and filter are dropped."""
+        if isinstance(data, np.ndarray):
+            if data.dtype.names is None:
+                raise TypeError("data must be a structured array or a dict of arrays!")
+            names = list(data.dtype.names) if columns is None else list(columns)
+            arrays = [data[name] for name in names]  # Field views, not copies
+        else:
+            names = list(data.keys()) if columns is None else list(columns)
+            arrays = [np.asarray(data[name]) for name in names]
+
+        if any(array.ndim != 1 for array in arrays):
+            raise ValueError("Columns must be 1 dimension arrays!")
+        if len({len(array) for array in arrays}) > 1:
+            raise ValueError("Columns must have the same length!")
+
+        self._column_names = names
+        self._columns = arrays
+        self._row_count = len(arrays[0]) if arrays else 0
+        self._column_orders.clear()
+        self._sort_orders.clear()
+        self._mask = None
+        self._rows = None
+
+    def set_filter(self, mask: Optional[np.ndarray]) -> None:
+        """Display only the rows where mask is True, every row if None.
+
+        e.g. table.set_filter(data["price"] > 10)
+        """
+        if mask is not None:
+            mask = np.asarray(mask, dtype=bool)
+            if mask.shape != (self._row_count,):
+                raise ValueError("mask must have one value per row!")
+        self._mask = mask
+        self._rows = None
+
+    def sort(self, sort_key: SortKey) -> None:
+        """Sort rows by columns, e.g. ((2, True), (0, False)) sorts by
+        descending third column then ascending first column.
+        """
+        sort_key = tuple((int(column), bool(descending)) for column, descending in sort_key)
+        if sort_key != self._sort_key:
+            self._sort_key = sort_key
+            self._rows = None
+
+    def _column_order(self, column: int, descending: bool) -> np.ndarray:
+        """Cached stable sort index of a column."""
+        order = self._column_orders.get((column, descending))
+        if order is None:
+            values = self._columns[column]
+            if descending:
+                # Reversed stable sort of the reversed column, equal values keep their order
+                order = len(values) - 1 - np.argsort(values[::-1], kind="stable")[::-1]
+            else:
+                order = np.argsort(values, kind="stable")
+            self._column_orders[(column, descending)] = order
+        return order
+
+    def _sort_order(self, sort_key: SortKey) -> Optional[np.ndarray]:
+        """Cached sort index, None if unsorted."""
+        if not sort_key:
+            return None
+        if len(sort_key) == 1:
+            return self._column_order(*sort_key[0])
+
+        order = self._sort_orders.get(sort_key)
+        if order is None:
+            # Dense ranks keep ties, so that the next columns break them
+            ranks = []
+            for column, descending in reversed(sort_key):
+                _, rank = np.unique(self._columns[column], return_inverse=True)
+                ranks.append(-rank if descending else rank)
+            order = np.lexsort(ranks)
+            self._sort_orders[sort_key] = order
+        return order
+
+    def _read_sort_specs(self) -> None:
+        sort_specs = imgui.table_get_sort_specs()
+        if sort_specs is None or not sort_specs.specs_dirty:
+            return
+
+        sort_specs.specs_dirty = False
+        specs_read, self._specs_read = self._specs_read, True
+        if not specs_read and self._sort_key:
+            return  # Default specs of a new table, keep the sort set before
+
+        self.sort(tuple((spec.column_index,
+                         spec.sort_direction == imgui.SORT_DIRECTION_DESCENDING)
+                        for spec in sorted(sort_specs.specs, key=lambda spec: spec.sort_order)))
+
+    def draw(self, *args, **kwargs) -> None:
+        """Draw the table."""
+        column_count = len(self._columns)
+        if column_count == 0:
+            return
+
+        table = imgui.begin_table(self.label, column_count, self.flags, 0, self.height)
+        if not table.opened:
+            return
+
+        # Header arrows of a new table show the sort set before the first draw
+        sorted_columns = dict(self._sort_key)
+        for column, name in enumerate(self._column_names):
+            flags = 0
+            if column in sorted_columns:
+                flags = imgui.TABLE_COLUMN_DEFAULT_SORT | (imgui.TABLE_COLUMN_PREFER_SORT_DESCENDING
+                                                           if sorted_columns[column] else 0)
+            imgui.table_setup_column(name, flags)
+        imgui.table_setup_scroll_freeze(0, 1)
+        imgui.table_headers_row()
+        self._read_sort_specs()
+
+        rows = self.rows
+        row_height = imgui.get_text_line_height() + 2 * imgui.get_style().cell_padding.y
+        start, end = visible_range(items_count=len(rows),
+                                   items_height=row_height,
+                                   start_pos_y=imgui.get_cursor_pos_y(),
+                                   scroll_y=imgui.get_scroll_y(),
+                                   window_height=imgui.get_window_height())
+
+        if start > 0:
+            imgui.table_next_row(0, start * row_height)
+
+        visible_rows = rows[start:end]
+        cells = []
+        for column, name in zip(self._columns, self._column_names):
+            values = column[visible_rows].tolist()  # Only the visible values are copied
+            spec = self._formats.get(name, "")
+            cells.append([format(value, spec) for value in values])
+
+        for row_cells in zip(*cells):
+            imgui.table_next_row()
+            for cell in row_cells:
+                imgui.table_next_column()
+                imgui.text(cell)
+
+        if end < len(rows):
+            imgui.table_next_row(0, (len(rows) - end) * row_height)
+
+        imgui.end_table()
@@ -0,0 +1,102 @@
+"""Text metrics cache
+
+Measure labels once with imgui.calc_text_size and reuse the result on the
+next frames, e.g. to size buttons from their labels.
+"""
+from collections import OrderedDict
+from typing import Any, Hashable, List, Tuple
+
+import imgui
+
+
+class TextMetrics:
+
+    def __init__(self, max_size: int = 4096):
+        """Text size cache
+
+        Sizes are cached by text, font and wrap width, with a least recently
+        used eviction once max_size entries are stored.
+
+        The font is identified by the current font size and by the fonts
+        pushed with push_font: fonts of the same size pushed directly with
+        imgui.push_font can't be told apart. The cache is cleared
+        automatically when the font atlas is rebuilt or the global font scale
+        changes, which is checked once per frame.
+
+        :param max_size: Maximum number of cached sizes
+        """
+        if max_size <= 0:
+            raise ValueError("max_size must be positive!")
+
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._sizes: "OrderedDict[Hashable, Tuple[float, float]]" = OrderedDict()
+        self._fonts: List[int] = []  # Ids of the fonts pushed with push_font
+        self._frame_time = -1.
+        self._fonts_state: Tuple[Any, ...] = ()
+
+    def __len__(self) -> int:
+        return len(self._sizes)
+
+    def invalidate(self) -> None:
+        """Drop every cached size."""
+        self._sizes.clear()
+
+    def push_font(self, font: Any) -> None:
+        """Push font with imgui.push_font and use it in cache keys."""
+        imgui.push_font(font)
+        self._fonts.append(id(font))
+
+    def pop_font(self) -> None:
+        imgui.pop_font()
+        self._fonts.pop()
+
+    def calc_text_size(self,
+                       text: str,
+                       hide_text_after_double_hash: bool = False,
+                       wrap_width: float = -1.) -> Tuple[float, float]:
+        """Cached imgui.calc_text_size, within a frame.
+
+        :param text: Text to measure
+        :param hide_text_after_double_hash: Ignore the text after "##", as
+                                            widget labels do
+        :param wrap_width: Wrap width, no wrapping if negative
+        :return: Width and height of the text
+        """
+        self._check_fonts()
+        key = (text, hide_text_after_double_hash, wrap_width,
+               imgui.get_font_size(), self._fonts[-1] if self._fonts else None)
+        size = self._sizes.get(key)
+        if size is not None:
+            self._sizes.move_to_end(key)
+            self.hits += 1
+            return size
+
+        self.misses += 1
+        measured = imgui.calc_text_size(text, hide_text_after_double_hash, wrap_width)
+        size = (measured.x, measured.y)
+        self._sizes[key] = size
+        if len(self._sizes) > self.max_size:
+            self._sizes.popitem(last=False)
+        return size
+
+    def text_width(self, text: str, hide_text_after_double_hash: bool = True) -> float:
+        """Cached width of a label, text after "##" is hidden by default."""
+        return self.calc_text_size(text, hide_text_after_double_hash)[0]
+
+    def _check_fonts(self) -> None:
+        """Clear the cache if fonts changed since the last frame."""
+        frame_time = imgui.get_time()
+        if frame_time == self._frame_time:
+            return
+
+        self._frame_time = frame_time
+        io = imgui.get_io()
+        fonts_state = (io.fonts.texture_width, io.fonts.texture_height, io.font_global_scale)
+        if fonts_state != self._fonts_state:
+            self._fonts_state = fonts_state
+            self.invalidate()
+
+
+text_metrics = TextMetrics()  # Shared by widgets
@@ -0,0 +1,283 @@
+"""Timeline
+
+Gantt chart of time intervals in lanes, drawing only the intervals of the
+visible time window.
+
+Requires numpy. This module is not imported by pyimgui_utils, import it
+explicitly:
+    from pyimgui_utils.timeline import Timeline
+"""
+from typing import List, Optional, Sequence, Tuple, Union
+
+import imgui
+import numpy as np
+
+from pyimgui_utils.interface import DrawableIT
+
+Bar = Tuple[float, float, int, int]  # Pixel start, pixel end, packed color, interval index
+
+
+def pack_color(color: Sequence[float]) -> int:
+    """Rgba color packed as by imgui.get_color_u32_rgba, without a context."""
+    red, green, blue, alpha = (int(round(min(max(channel, 0.), 1.) * 255)) for channel in color)
+    return red | green << 8 | blue << 16 | alpha << 24
+
+
+class _Lane:
+    """Intervals of a lane, sorted by start.
+
+    max_ends[i] is the maximum end of the intervals 0 to i. It is sorted, so
+    the first interval that can overlap a time is found by binary search,
+    as the last one is with starts.
+    """
+
+    __slots__ = ("name", "starts", "ends", "colors", "ids", "max_ends", "_pending")
+
+    def __init__(self, name: str):
+        self.name = name
+        self.starts = np.zeros(0)
+        self.ends = np.zeros(0)
+        self.colors = np.zeros(0, dtype=np.uint32)
+        self.ids = np.zeros(0, dtype=np.intp)  # Index of each interval in the timeline insertion order
+        self.max_ends = np.zeros(0)
+        self._pending: List[Tuple[np.ndarray, ...]] = []
+
+    def __len__(self) -> int:
+        return len(self.starts) + sum(len(pending[0]) for pending in self._pending)
+
+    def add(self, starts: np.ndarray, ends: np.ndarray, colors: np.ndarray, ids: np.ndarray) -> None:
+        """Add intervals, sorted on the next query."""
+        self._pending.append((starts, ends, colors, ids))
+
+    def sort(self) -> None:
+        """Merge the pending intervals in the sorted arrays."""
+        if not self._pending:
+            return
+        starts, ends, colors, ids = (np.concatenate(arrays) for arrays in zip(
+            (self.starts, self.ends, self.colors, self.ids), *self._pending))
+        order = np.argsort(starts, kind="stable")
+        self.starts = starts[order]
+        self.ends = ends[order]
+        self.colors = colors[order]
+        self.ids = ids[order]
+        self.max_ends = np.maximum.accumulate(self.ends)
+        self._pending.clear()
+
+    def query(self, start: float, end: float) -> np.ndarray:
+        """Positions, in the sorted arrays, of the intervals overlapping [start, end)."""
+        self.sort()
+        last = np.searchsorted(self.starts, end, side="left")
+        first = np.searchsorted(self.max_ends[:last], start, side="right")
+        return first + np.flatnonzero(self.ends[first:last] > start)
+
+
+class Timeline(DrawableIT):
+
+    def __init__(self,
+                 lanes: Sequence[str],
+                 width: float = -1.,
+                 lane_height: float = 20.,
+                 name_width: float = 100.,
+                 color: Sequence[float] = (.3, .6, .9, 1.),
+                 aggregate_color: Sequence[float] = (.6, .6, .6, 1.),
+                 min_bar_width: float = 3.,
+                 labels: Optional[Sequence[str]] = None,
+                 max_zoom_out: float = 100.):
+        """Timeline of intervals in lanes
+
+        Intervals of each lane are kept sorted by start, with the running
+        maximum of their ends: the intervals overlapping the visible time
+        window are found with two binary searches, the others are never
+        read.
+
+        Intervals narrower than min_bar_width pixels are merged into
+        aggregate bars covering the pixel columns they overlap, so a frame
+        draws at most one aggregate bar per pixel column and lane, whatever
+        the number of intervals.
+
+        The mouse wheel zooms around the hovered time and dragging pans the
+        view. Hovering a bar shows its label if labels are given.
+
+        :param lanes: Names of the lanes, displayed on the left
+        :param width: Width of the timeline, fill the available width if negative
+        :param lane_height: Height of a lane in pixels
+        :param name_width: Width of the lane names column in pixels
+        :param color: Default rgba color of intervals
+        :param aggregate_color: Rgba color of merged intervals
+        :param min_bar_width: Intervals narrower than this, in pixels, are merged
+        :param labels: Labels of intervals in insertion order, for tooltips
+        :param max_zoom_out: Maximum duration of the view, as a multiple of
+                             the duration of the whole timeline
+        """
+        self.width = width
+        self.lane_height = lane_height
+        self.name_width = name_width
+        self.min_bar_width = min_bar_width
+        self.labels = labels
+        self.max_zoom_out = max_zoom_out
+        self._color = pack_color(color)
+        self._aggregate_color = pack_color(aggregate_color)
+        self._lanes = [_Lane(name) for name in lanes]
+        self._count = 0
+        self._view: Optional[Tuple[float, float]] = None
+
+    def __len__(self) -> int:
+        return self._count
+
+    @property
+    def view(self) -> Tuple[float, float]:
+        """Visible time window: start and end. The whole timeline by default."""
+        if self._view is None:
+            self.fit()
+        return self._view
+
+    def set_view(self, start: float, end: float) -> None:
+        if not (np.isfinite(start) and np.isfinite(end)):
+            raise ValueError("start and end must be finite!")
+        if end <= start:
+            raise ValueError("end must be greater than start!")
+        self._view = (float(start), float(end))
+
+    def fit(self) -> None:
+        """Show every interval."""
+        self._view = self._extent()
+
+    def zoom(self, factor: float, time: Optional[float] = None) -> None:
+        """Zoom around a time, the center of the view by default.
+
+        The view duration is kept between max_zoom_out times the duration of
+        the timeline and the float resolution of the view bounds.
+
+        :param factor: Zoom factor, greater than 1 to zoom in
+        """
+        start, end = self.view
+        time = (start + end) / 2 if time is None else time
+        extent_start, extent_end = self._extent()
+        max_span = (extent_end - extent_start) * self.max_zoom_out
+        min_span = 1024 * np.spacing(max(abs(start), abs(end), 1.))
+        span = end - start
+        factor = min(max(factor, span / max_span), span / min_span)
+        self.set_view(time - (time - start) / factor, time + (end - time) / factor)
+
+    def _extent(self) -> Tuple[float, float]:
+        """Start of the first interval and end of the last one, (0, 1) if empty."""
+        starts, ends = [], []
+        for lane in self._lanes:
+            lane.sort()
+            if len(lane) > 0:
+                starts.append(lane.starts[0])
+                ends.append(lane.max_ends[-1])
+
+        if not starts or max(ends) <= min(starts):
+            return 0., 1.
+        return float(min(starts)), float(max(ends))
+
+    def pan(self, delta: float) -> None:
+        """Move the view by delta time units."""
+        start, end = self.view
+        self.set_view(start + delta, end + delta)
+
+    def add_intervals(self,
+                      lane: int,
+                      starts: Union[Sequence[float], np.ndarray],
+                      ends: Union[Sequence[float], np.ndarray],
+                      colors: Optional[Union[Sequence[int], np.ndarray]] = None) -> None:
+        """Add intervals to a lane.
+
+        :param lane: Index of the lane
+        :param starts: Start times, in any order
+        :param ends: End times, not before starts
+        :param colors: Packed colors of intervals, as returned by
+                       imgui.get_color_u32_rgba, the default color if None
+        """
+        starts = np.asarray(starts, dtype=np.float64).ravel()
+        ends = np.asarray(ends, dtype=np.float64).ravel()
+        if starts.shape != ends.shape:
+            raise ValueError("starts and ends must have the same length!")
+        if np.any(ends < starts):
+            raise ValueError("Intervals must not end before they start!")
+        colors = np.full(len(starts), self._color, dtype=np.uint32) if colors is None \
+            else np.broadcast_to(np.asarray(colors, dtype=np.uint32), starts.shape)
+        self._lanes[lane].add(starts, ends, colors, np.arange(self._count, self._count + len(starts)))
+        self._count += len(starts)
+
+    def add_interval(self, lane: int, start: float, end: float, color: Optional[int] = None) -> None:
+        self.add_intervals(lane, [start], [end], None if color is None else [color])
+
+    def lane_bars(self, lane: int, width: float) -> Tuple[List[Bar], List[Tuple[float, float]]]:
+        """Bars of a lane for the current view, in pixels from the left of
+        the time area.
+
+        :param lane: Index of the lane
+        :param width: Width of the time area in pixels
+        :return: Bars of the intervals drawn individually, and pixel start
+                 and end of the aggregate bars of merged intervals
+        """
+        start, end = self.view
+        data = self._lanes[lane]
+        positions = data.query(start, end)
+        scale = width / (end - start)
+        pixel_starts = np.clip((data.starts[positions] - start) * scale, 0., width)
+        pixel_ends = np.clip((data.ends[positions] - start) * scale, 0., width)
+
+        wide = pixel_ends - pixel_starts >= self.min_bar_width
+        bars = list(zip(pixel_starts[wide].tolist(), pixel_ends[wide].tolist(),
+                        data.colors[positions[wide]].tolist(), data.ids[positions[wide]].tolist()))
+
+        # Pixel columns covered by narrow intervals, from a difference array
+        columns = int(np.ceil(width))
+        first_columns = np.minimum(pixel_starts[~wide].astype(np.intp), columns - 1)
+        end_columns = np.maximum(np.ceil(pixel_ends[~wide]).astype(np.intp), first_columns + 1)
+        coverage = np.cumsum(np.bincount(first_columns, minlength=columns + 1)[:columns + 1]
+                             - np.bincount(end_columns, minlength=columns + 1)[:columns + 1])
+        covered = np.concatenate(([False], coverage[:columns] > 0, [False]))
+        edges = np.flatnonzero(covered[1:] != covered[:-1])
+        aggregates = list(zip(edges[0::2].tolist(), np.minimum(edges[1::2], width).tolist()))
+        return bars, aggregates
+
+    def draw(self, *args, **kwargs) -> None:
+        """Draw the timeline at the cursor position."""
+        width = self.width if self.width > 0 else imgui.get_content_region_available_width()
+        time_width = max(width - self.name_width, 1.)
+        height = len(self._lanes) * self.lane_height
+        x, y = imgui.get_cursor_screen_pos()
+        imgui.push_id(f"{id(self)}")  # Instances must not share the button state
+        imgui.invisible_button("##timeline", width, max(height, 1.))
+        time_x = x + self.name_width
+        self._handle_mouse(time_x, time_width)
+
+        draw_list = imgui.get_window_draw_list()
+        text_color = imgui.get_color_u32_rgba(1., 1., 1., 1.)
+        hovered = imgui.is_item_hovered()
+        mouse_x, mouse_y = imgui.get_io().mouse_pos
+        for lane_index, lane in enumerate(self._lanes):
+            top = y + lane_index * self.lane_height
+            bottom = top + self.lane_height - 1
+            draw_list.add_text(x + 4, top + 2, text_color, lane.name)
+
+            bars, aggregates = self.lane_bars(lane_index, time_width)
+            for start, end in aggregates:
+                draw_list.add_rect_filled(time_x + start, top + 1, time_x + end, bottom,
+                                          self._aggregate_color)
+            for start, end, color, _ in bars:
+                draw_list.add_rect_filled(time_x + start, top + 1, time_x + end, bottom, color)
+
+            if hovered and self.labels is not None and top <= mouse_y < bottom:
+                self._draw_tooltip(bars, mouse_x - time_x)
+        imgui.pop_id()
+
+    def _draw_tooltip(self, bars: List[Bar], mouse_x: float) -> None:
+        for start, end, _, index in reversed(bars):  # Last drawn is on top
+            if start <= mouse_x < end:
+                imgui.set_tooltip(self.labels[index])
+                return
+
+    def _handle_mouse(self, time_x: float, time_width: float) -> None:
+        start, end = self.view
+        io = imgui.get_io()
+        if imgui.is_item_active():
+            delta_x = io.mouse_delta[0]
+            if delta_x != 0:
+                self.pan(-delta_x * (end - start) / time_width)
+        elif imgui.is_item_hovered() and io.mouse_wheel != 0:
+            self.zoom(1.25 ** io.mouse_wheel, start + (io.mouse_pos[0] - time_x) * (end - start) / time_width)
@@ -0,0 +1,162 @@
+"""Tooltip providers
+
+Compute tooltips lazily, once an item has been hovered for a while, and
+memoize them so expensive details (stats, previews) are not computed in the
+draw path of every item nor on every hovered frame.
+"""
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Optional, Set, Tuple
+
+import imgui
+
+from pyimgui_utils.callback import CallbackDispatcher
+from pyimgui_utils.scheduler import frame_scheduler
+
+
+def _identity_key(*args) -> Tuple[int, ...]:
+    """Ids of args, as NodeTree identifies its rows."""
+    return tuple(id(arg) for arg in args)
+
+
+class TooltipProvider:
+
+    def __init__(self,
+                 provider: Callable[..., Optional[str]],
+                 delay: float = .5,
+                 max_size: int = 256,
+                 ttl: Optional[float] = None,
+                 dispatcher: Optional[CallbackDispatcher] = None,
+                 placeholder: str = "...",
+                 key: Optional[Callable[..., Hashable]] = None):
+        """Lazy and memoized tooltip
+
+        Call draw right after the item it describes, with the arguments of
+        the provider, e.g. the element of a NodeTree row. The provider is
+        called only once the item has been hovered for delay seconds, and
+        its result is memoized by key, the ids of the arguments by default,
+        with a least recently used eviction once max_size results are stored
+        and an expiration after ttl seconds. Memoized arguments are kept
+        alive, so their ids are not reused by other objects. Items drawn
+        with the same arguments, e.g. Buttons without arguments sharing a
+        provider, are told apart by the item passed to draw.
+
+        A frame is requested from the shared frame_scheduler when the hover
+        delay is spent, so the tooltip shows up while FrameRunner idles.
+
+        With a dispatcher, e.g. in DispatchMode.THREAD_POOL, the provider
+        runs out of the frame and placeholder is shown until the dispatcher
+        reports the result in flush. An expired result is shown until its
+        replacement is ready.
+
+        e.g.
+            tooltip = TooltipProvider(lambda node: f"{node.size} bytes")
+            tree = NodeTree(tooltip=tooltip)
+
+        :param provider: Function returning the tooltip text of its
+                         arguments, or None for no tooltip
+        :param delay: Hover time before the tooltip is shown, in seconds
+        :param max_size: Maximum number of memoized tooltips
+        :param ttl: Lifetime of memoized tooltips in seconds, None to keep them
+        :param dispatcher: Optional dispatcher running the provider
+        :param placeholder: Shown while the dispatcher computes the tooltip
+        :param key: Function returning the memoization key of the provider
+                    arguments, e.g. lambda node: node.path to share tooltips
+                    between equal elements
+        """
+        if max_size <= 0:
+            raise ValueError("max_size must be positive!")
+
+        self.provider = provider
+        self.delay = delay
+        self.max_size = max_size
+        self.ttl = ttl
+        self.dispatcher = dispatcher
+        self.placeholder = placeholder
+        self.key = _identity_key if key is None else key
+        self.scheduler = frame_scheduler
+        self.hits = 0
+        self.misses = 0
+        # Key -> memoization time, text and arguments, kept alive for identity keys
+        self._texts: "OrderedDict[Hashable, Tuple[float, Optional[str], Tuple[Any, ...]]]" = OrderedDict()
+        self._pending: Set[Hashable] = set()
+        self._hovered: Optional[Hashable] = None  # Key of the hovered item
+        self._hover_start = 0.
+        self._hover_seen = -1.  # Frame time when the hovered item was last seen
+        self._frame_time = -1.
+        self._previous_frame_time = -1.
+
+    def __len__(self) -> int:
+        return len(self._texts)
+
+    def invalidate(self, *args, item: Hashable = None) -> None:
+        """Forget the tooltip of args, every tooltip if no args nor item are given."""
+        if args or item is not None:
+            self._texts.pop(self._item_key(args, item), None)
+        else:
+            self._texts.clear()
+
+    def draw(self, *args, item: Hashable = None) -> None:
+        """Show the tooltip of the last item if it is hovered long enough.
+
+        :param args: Arguments of the provider, they identify the item
+        :param item: Optional object drawn, to tell apart items drawn with the
+                     same arguments
+        """
+        frame_time = imgui.get_time()
+        if frame_time != self._frame_time:
+            self._previous_frame_time = self._frame_time
+            self._frame_time = frame_time
+        if not imgui.is_item_hovered():
+            return
+
+        key = self._item_key(args, item)
+        if key != self._hovered or self._hover_seen < self._previous_frame_time:
+            self._hovered = key
+            self._hover_start = frame_time
+        self._hover_seen = frame_time
+        remaining = self.delay - (frame_time - self._hover_start)
+        if remaining > 0:
+            self.scheduler.request_frame(remaining)
+            return
+
+        text = self._get(key, args)
+        if text:
+            imgui.set_tooltip(text)
+
+    def get(self, *args, item: Hashable = None) -> Optional[str]:
+        """Memoized tooltip of args, the placeholder while it is computed."""
+        return self._get(self._item_key(args, item), args)
+
+    def _item_key(self, args: Tuple[Any, ...], item: Hashable) -> Hashable:
+        key = self.key(*args)
+        return key if item is None else (item, key)
+
+    def _get(self, key: Hashable, args: Tuple[Any, ...]) -> Optional[str]:
+        entry = self._texts.get(key)
+        expired = entry is not None and self.ttl is not None and time.monotonic() - entry[0] > self.ttl
+        if entry is not None and not expired:
+            self._texts.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+        self.misses += 1
+        if self.dispatcher is None:
+            text = self.provider(*args)
+            self._store(key, args, text)
+            return text
+
+        if key not in self._pending:
+            self._pending.add(key)
+            self.dispatcher.submit(self.provider, args, on_done=lambda text: self._on_done(key, args, text))
+        return self.placeholder if entry is None else entry[1]
+
+    def _on_done(self, key: Hashable, args: Tuple[Any, ...], text: Optional[str]) -> None:
+        self._pending.discard(key)
+        self._store(key, args, text)
+
+    def _store(self, key: Hashable, args: Tuple[Any, ...], text: Optional[str]) -> None:
+        self._texts[key] = (time.monotonic(), text, args)
+        self._texts.move_to_end(key)
+        if len(self._texts) > self.max_size:
+            self._texts.popitem(last=False)
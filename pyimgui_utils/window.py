@@ -1,12 +1,18 @@
 import logging
 from abc import abstractmethod
-from dataclasses import dataclass, field
-from typing import Union, Callable, List
+from dataclasses import dataclass, field, fields
+from typing import Union, Callable, List, Iterable, Optional, Any
 
 import imgui
 from typing_extensions import override
 
+from pyimgui_utils.callback import CallbackDispatcher, CallbackTracker
+from pyimgui_utils.clipper import ListClipper
 from pyimgui_utils.interface import DrawableIT
+from pyimgui_utils.reactive import Observable, value_of
+from pyimgui_utils.scheduler import FrameScheduler, Job, JobGenerator, frame_scheduler
+from pyimgui_utils.style import Theme, style_stack
+from pyimgui_utils.shortcut import KeyChord, ShortcutIndex, normalize_key
 
 
 class ImGuiWindowAbstract(DrawableIT):
@@ -26,26 +32,66 @@ class ImGuiWindowAbstract(DrawableIT):
         self.after_end_functions = []
         self.after_begin_functions = []
         self.before_end_functions = []
+        self.scheduler: FrameScheduler = frame_scheduler
 
     def draw(self, *args, **kwargs) -> None:
         """Draw ImGui window and execute declared function around
         begin and end statement.
-        """
-        for func in self.before_begin_functions:
-            func()
 
-        with self._begin_statement_window():
+        Jobs of the scheduler run first, so draw_content shows their latest
+        progress.
+        """
+        self.scheduler.run()
 
-            for func in self.after_begin_functions:
+        # Themes pushed by add_theme are popped even if draw_content raises
+        depth = style_stack.depth
+        try:
+            for func in self.before_begin_functions:
                 func()
 
-            self.draw_content(*args, **kwargs)
+            with self._begin_statement_window():
+
+                for func in self.after_begin_functions:
+                    func()
+
+                self.draw_content(*args, **kwargs)
 
-            for func in self.before_end_functions:
+                for func in self.before_end_functions:
+                    func()
+
+            for func in self.after_end_functions:
                 func()
+        finally:
+            style_stack.pop_to(depth)
+
+    def submit_job(self,
+                   generator: JobGenerator,
+                   name: str = "",
+                   key: Any = None,
+                   on_done: Optional[Callable[[Any], None]] = None) -> Job:
+        """Run a generator over the next frames, within the time slice of
+        the scheduler, e.g. to rebuild an index without a frame hitch.
+
+        The generator yields its progress between 0 and 1, or None, after
+        each step; draw_content can read it from the returned job and show
+        the partial results.
+
+        :param generator: Generator doing the work, its return value is the result of the job
+        :param name: Displayed name of the job
+        :param key: Optional key, the unfinished job submitted with the same key is cancelled
+        :param on_done: Called with the result of the job (None if it failed)
+        :return: The job
+        """
+        return self.scheduler.submit(generator, name, key, on_done)
 
-        for func in self.after_end_functions:
-            func()
+    def add_theme(self, theme: Theme) -> None:
+        """Push theme before the begin statement and pop it after the end
+        statement, e.g. to style the window itself.
+
+        :param theme: Theme applied around the window
+        """
+        self.before_begin_functions.append(lambda: style_stack.push(theme))
+        self.after_end_functions.insert(0, style_stack.pop)  # Pop last added themes first
 
     @abstractmethod
     def _begin_statement_window(self):
@@ -100,31 +146,227 @@ def _undefined_action():
     raise NotImplementedError("Undefined action. Have you correctly provide an action in the MenuItem?")
 
 
+def _add_slots(cls: type) -> type:
+    """Recreate a dataclass with __slots__.
+
+    dataclass(slots=True) requires python 3.10. The class is rebuilt without
+    the class attributes holding field defaults, which conflict with slots;
+    the generated __init__ already holds them.
+    """
+    cls_dict = dict(cls.__dict__)
+    field_names = tuple(class_field.name for class_field in fields(cls))
+    for name in field_names:
+        cls_dict.pop(name, None)
+    cls_dict.pop("__dict__", None)
+    cls_dict.pop("__weakref__", None)
+    cls_dict["__slots__"] = field_names
+
+    slotted_cls = type(cls)(cls.__name__, cls.__bases__, cls_dict)
+    slotted_cls.__qualname__ = cls.__qualname__
+    return slotted_cls
+
+
+@_add_slots
 @dataclass
 class MenuItem:
     name: Union[str, List[str]]  # It can be a list of names to dynamically change them.
-    action: Callable[[], None] = _undefined_action
+    action: Callable[[], Any] = _undefined_action  # Coroutine functions are scheduled
     selected_name: int = 0
     shortcut: str = ""
-    selected: bool = False
-    enabled: bool = True
+    selected: Union[bool, Observable[bool]] = False  # Observables are read on each frame
+    enabled: Union[bool, Observable[bool]] = True
 
 
+def _validate_menu_item(menu_item: MenuItem) -> None:
+    """Check menu item name type.
+
+    Run once when the menu item is registered rather than on each frame.
+    """
+    if isinstance(menu_item.name, str):
+        return
+
+    if (not isinstance(menu_item.name, list)
+            or not all(isinstance(name, str) for name in menu_item.name)):
+        raise TypeError("Invalid menu item name type!")
+
+
+def _menu_item_name(menu_item: MenuItem) -> str:
+    """Displayed name of an already validated menu item."""
+    if isinstance(menu_item.name, str):
+        return menu_item.name
+    return menu_item.name[menu_item.selected_name]
+
+
+class MenuProvider:
+
+    def __init__(self, generate: Callable[[], Iterable[MenuItem]]):
+        """Lazy menu items provider
+
+        Generate the menu items the first time the menu is opened and cache
+        them until invalidate is called. Useful for menus with many entries
+        that come from disk, e.g. "Recent files".
+
+        :param generate: Function returning the menu items
+        """
+        self._generate = generate
+        self._items: Optional[List[MenuItem]] = None
+
+    @property
+    def is_cached(self) -> bool:
+        return self._items is not None
+
+    @property
+    def cached_items(self) -> Optional[List[MenuItem]]:
+        """Generated menu items, None if they are not generated, without generating them."""
+        return self._items
+
+    @property
+    def items(self) -> List[MenuItem]:
+        """Generated menu items, validated once per generation."""
+        if self._items is None:
+            items = list(self._generate())
+            for menu_item in items:
+                _validate_menu_item(menu_item)
+            self._items = items
+        return self._items
+
+    def invalidate(self) -> None:
+        """Drop cached items, they are generated again on next access."""
+        self._items = None
+
+
+@_add_slots
 @dataclass
 class MenuBar:
     name: str
     menu_items: List[MenuItem] = field(default_factory=list)
-    enabled: bool = True
+    enabled: Union[bool, Observable[bool]] = True
+    provider: Optional[MenuProvider] = None  # Lazy items drawn after menu_items
+    submenus: List["MenuBar"] = field(default_factory=list)
 
 
 class MenuBarWindow(ImGuiWindowAbstract):
 
-    def __init__(self, menu_bars: Union[List[MenuBar], None] = None):
+    def __init__(self,
+                 menu_bars: Union[List[MenuBar], None] = None,
+                 dispatcher: Optional[CallbackDispatcher] = None):
+        """Main menu bar window
+
+        Menu item shortcuts are indexed so that they can be dispatched with
+        dispatch_shortcut even when the menu is closed. The index is rebuilt
+        lazily each time menu_bars is set or invalidate_shortcuts is called.
+
+        :param menu_bars: List of menu bars to display
+        :param dispatcher: Optional dispatcher running the actions out of the
+                           begin_menu/end_menu scope
+        """
         super().__init__()
 
         if menu_bars is None:
             menu_bars = []
+        for menu_bar in menu_bars:
+            self._validate_menu_bar(menu_bar)
+        self._menu_bars = menu_bars
+        self._shortcut_index = ShortcutIndex()
+        self._shortcut_index_dirty = True
+        self._callbacks = CallbackTracker(dispatcher)
+
+    @property
+    def menu_bars(self) -> List[MenuBar]:
+        return self._menu_bars
+
+    @menu_bars.setter
+    def menu_bars(self, menu_bars: List[MenuBar]) -> None:
+        for menu_bar in menu_bars:
+            self._validate_menu_bar(menu_bar)
         self._menu_bars = menu_bars
+        self.invalidate_shortcuts()
+
+    def is_pending(self, menu_item: MenuItem) -> bool:
+        """True if a coroutine or dispatched action of menu_item has not
+        finished yet.
+        """
+        return self._callbacks.is_pending(id(menu_item))
+
+    def add_menu_bar(self, menu_bar: MenuBar) -> None:
+        """Append a menu bar and invalidate the shortcut index."""
+        self._validate_menu_bar(menu_bar)
+        self._menu_bars.append(menu_bar)
+        self.invalidate_shortcuts()
+
+    def invalidate_shortcuts(self) -> None:
+        """Mark the shortcut index as outdated.
+
+        Call it after adding or removing menu items or changing a
+        MenuItem.shortcut. Enabled flags do not require an invalidation.
+        Items of a MenuProvider are not indexed, it would defeat laziness.
+        """
+        self._shortcut_index_dirty = True
+
+    def dispatch_shortcut(self,
+                          key: str,
+                          ctrl: bool = False,
+                          shift: bool = False,
+                          alt: bool = False,
+                          super_: bool = False) -> bool:
+        """Call the action of the menu item bound to a key event.
+
+        Feed it from the backend key down events, e.g. with
+        pygame.key.name(event.key) and the event modifiers.
+
+        :param key: Name of the pressed key, e.g. "" for an unknown key
+        :param ctrl: True if a ctrl key is down
+        :param shift: True if a shift key is down
+        :param alt: True if an alt key is down
+        :param super_: True if a super (cmd, windows) key is down
+        :return: True if an enabled menu item action has been called
+        """
+        try:
+            key = normalize_key(key)
+        except ValueError:
+            return False  # pygame.key.name returns "" for unknown keys
+
+        if self._shortcut_index_dirty:
+            self._rebuild_shortcut_index()
+
+        chord = KeyChord(key, ctrl, shift, alt, super_)
+        return self._shortcut_index.dispatch(chord)
+
+    def _rebuild_shortcut_index(self) -> None:
+        """Index every menu item shortcut by its parsed key chord."""
+        self._shortcut_index.clear()
+        for menu_bar in self._menu_bars:
+            self._index_menu_bar_shortcuts(menu_bar, lambda: True)
+        self._shortcut_index_dirty = False
+
+    def _index_menu_bar_shortcuts(self,
+                                  menu_bar: MenuBar,
+                                  is_parent_enabled: Callable[[], bool]) -> None:
+        """Recursively index menu bar and submenus shortcuts."""
+
+        def is_menu_bar_enabled() -> bool:
+            return is_parent_enabled() and value_of(menu_bar.enabled)
+
+        for menu_item in menu_bar.menu_items:
+            if menu_item.shortcut == "":
+                continue
+
+            self._shortcut_index.register(
+                menu_item.shortcut,
+                lambda item=menu_item: self._call_action(item),
+                lambda item=menu_item: is_menu_bar_enabled() and value_of(item.enabled)
+            )
+
+        for submenu in menu_bar.submenus:
+            self._index_menu_bar_shortcuts(submenu, is_menu_bar_enabled)
+
+    @staticmethod
+    def _validate_menu_bar(menu_bar: MenuBar) -> None:
+        """Validate menu items once, when the menu bar is registered."""
+        for menu_item in menu_bar.menu_items:
+            _validate_menu_item(menu_item)
+        for submenu in menu_bar.submenus:
+            MenuBarWindow._validate_menu_bar(submenu)
 
     @override
     def _begin_statement_window(self):
@@ -138,29 +380,42 @@ class MenuBarWindow(ImGuiWindowAbstract):
         For each element, display a menu_item.
         """
         for menu_bar in self._menu_bars:
-            if imgui.begin_menu(menu_bar.name, menu_bar.enabled):
-                for menu_item in menu_bar.menu_items:
+            self._draw_menu(menu_bar)
+
+    def _draw_menu(self, menu_bar: MenuBar) -> None:
+        """Draw a menu, its provided items and its submenus.
+
+        Provided items are only generated once the menu is opened and only
+        the visible ones are submitted.
+        """
+        if not imgui.begin_menu(menu_bar.name, value_of(menu_bar.enabled)):
+            return
 
-                    if isinstance(menu_item.name, str):
-                        menu_name = menu_item.name
+        for menu_item in menu_bar.menu_items:
+            self._draw_menu_item(menu_item)
 
-                    elif (isinstance(menu_item.name, list)
-                          and all(isinstance(name, str) for name in menu_item.name)):
+        if menu_bar.provider is not None:
+            provided_items = menu_bar.provider.items
+            for index in ListClipper(len(provided_items)):
+                self._draw_menu_item(provided_items[index])
 
-                        menu_name = menu_item.name[menu_item.selected_name]
+        for submenu in menu_bar.submenus:
+            self._draw_menu(submenu)
 
-                    else:
-                        raise TypeError("Invalid menu item name type!")
+        imgui.end_menu()
 
-                    clicked, _ = imgui.menu_item(menu_name,
-                                                 menu_item.shortcut,
-                                                 menu_item.selected,
-                                                 menu_item.enabled)
+    def _draw_menu_item(self, menu_item: MenuItem) -> None:
+        clicked, _ = imgui.menu_item(_menu_item_name(menu_item),
+                                     menu_item.shortcut,
+                                     value_of(menu_item.selected),
+                                     value_of(menu_item.enabled))
 
-                    if clicked:
-                        menu_item.action()
+        if clicked:
+            self._call_action(menu_item)
 
-                imgui.end_menu()
+    def _call_action(self, menu_item: MenuItem) -> None:
+        """Call menu item action, coroutine actions are scheduled."""
+        self._callbacks.call(menu_item.action, key=id(menu_item))
 
 
 @dataclass
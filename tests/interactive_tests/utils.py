@@ -7,7 +7,7 @@ from OpenGL.raw.GL.VERSION.GL_1_0 import glClear, GL_COLOR_BUFFER_BIT
 from glfw.GLFW import (glfwPollEvents, glfwSwapBuffers)
 from typing_extensions import override, Optional
 
-from pyimgui_utils import BasicWindow, Button
+from pyimgui_utils import AsyncRunner, BasicWindow, Button
 from pyimgui_utils.interface import DrawableIT
 from tests.utils import setup_imgui_context, terminate_imgui_context
 
@@ -91,19 +91,24 @@ def run_test_window(window_under_test: DrawableIT,
     )
     impl, window, ctx = setup_imgui_context()
 
+    def process_inputs() -> bool:
+        glfwPollEvents()
+        impl.process_inputs()
+        return not glfw.window_should_close(window)
+
+    def draw() -> None:
+        window_under_test.draw()
+        tw.draw(window)
+
+    def render() -> None:
+        glClear(GL_COLOR_BUFFER_BIT)
+        impl.render(imgui.get_draw_data())
+        glfwSwapBuffers(window)
+
     try:
-        while not glfw.window_should_close(window):
-            glfwPollEvents()
-            impl.process_inputs()
-            imgui.new_frame()
-
-            window_under_test.draw()
-            tw.draw(window)
-
-            glClear(GL_COLOR_BUFFER_BIT)
-            imgui.render()
-            impl.render(imgui.get_draw_data())
-            glfwSwapBuffers(window)
+        AsyncRunner(draw=draw,
+                    process_inputs=process_inputs,
+                    render=render).run()
     finally:
         terminate_imgui_context(impl, ctx)
 
@@ -0,0 +1,50 @@
+import subprocess
+import sys
+
+import imgui
+import pytest
+
+from pyimgui_utils.backends import available_backends, get_backend
+from pyimgui_utils.backends.headless_backend import HeadlessBackend
+
+
+class TestBackends:
+
+    def test_get_backend(self):
+        assert set(available_backends()) == {"pygame", "glfw", "headless"}
+        assert isinstance(get_backend("headless"), HeadlessBackend)
+
+        with pytest.raises(ValueError):
+            get_backend("invalid backend")
+
+    def test_lazy_imports(self):
+        """Importing the module and a headless backend should not import
+        any windowing or OpenGL module."""
+        code = ("import sys\n"
+                "import pyimgui_utils\n"
+                "from pyimgui_utils.backends import get_backend\n"
+                "get_backend('headless')\n"
+                "print([name for name in ('OpenGL', 'pygame', 'glfw', 'numpy')"
+                " if name in sys.modules])")
+        result = subprocess.run([sys.executable, "-c", code],
+                                capture_output=True, text=True, check=True)
+        assert result.stdout.strip() == "[]"
+
+    def test_headless_runner(self):
+        calls = []
+
+        def draw():
+            imgui.begin("Window")
+            imgui.text("Hello World!")
+            imgui.end()
+
+        with get_backend("headless", width=320, height=240) as backend:
+            runner = backend.runner(draw=draw)
+            backend.background_functions.append(lambda: calls.append("bg"))
+            backend.background_functions.append(runner.stop)
+            runner.run()
+            assert imgui.get_io().display_size == (320, 240)
+
+        assert runner.stats.frames == 1
+        assert calls == ["bg"]
+        assert backend.context is None
@@ -0,0 +1,233 @@
+import asyncio
+import threading
+
+import imgui
+import pytest
+
+from pyimgui_utils import (Button, CallbackDispatcher, DispatchMode, MenuBar,
+                           MenuBarWindow, MenuItem)
+from pyimgui_utils.callback import CallbackTracker
+from tests.utils import setup_imgui_context, terminate_imgui_context
+
+
+class TestCallbackTracker:
+
+    def test_sync_callback(self):
+        msg = []
+        tracker = CallbackTracker()
+        tracker.call(lambda x, y=0: msg.append(x + y), (1,), {"y": 2})
+
+        assert msg == [3]
+        assert not tracker.is_pending()
+
+    def test_coroutine_callback(self):
+        msg = []
+        tracker = CallbackTracker()
+
+        async def callback(value):
+            await asyncio.sleep(0)
+            msg.append(value)
+
+        async def scenario():
+            tracker.call(callback, ("a",), key="a")
+            tracker.call(callback, ("b",), key="b")
+            assert tracker.is_pending("a")
+            assert tracker.pending_count == 2
+            assert msg == [], "Coroutine should not block the caller"
+
+            await asyncio.sleep(0.01)
+            assert not tracker.is_pending("a")
+            assert tracker.pending_count == 0
+
+        asyncio.run(scenario())
+        assert msg == ["a", "b"]
+
+    def test_coroutine_callback_without_loop(self):
+        async def callback():
+            pass
+
+        with pytest.raises(RuntimeError):
+            CallbackTracker().call(callback)
+
+
+class TestCallbackDispatcher:
+
+    def test_deferred(self):
+        msg = []
+        dispatcher = CallbackDispatcher(mode=DispatchMode.DEFERRED)
+        tracker = CallbackTracker(dispatcher)
+
+        tracker.call(lambda: msg.append("called"), key="btn")
+        assert msg == [], "Deferred callback should wait for flush"
+        assert tracker.is_pending("btn")
+        assert dispatcher.pending_count == 1
+
+        assert dispatcher.flush() == 1
+        assert msg == ["called"]
+        assert not tracker.is_pending("btn")
+        assert dispatcher.stats.completed == 1
+        assert dispatcher.stats.max_latency >= dispatcher.stats.mean_latency > 0.
+
+    def test_deferred_failure(self):
+        dispatcher = CallbackDispatcher()
+        tracker = CallbackTracker(dispatcher)
+
+        tracker.call(lambda: 1 / 0)
+        dispatcher.flush()
+        assert not tracker.is_pending(), \
+            "Failed callback should not stay pending"
+        assert dispatcher.stats.failed == 1
+
+    def test_thread_pool(self):
+        release = threading.Event()
+        threads = []
+        dispatcher = CallbackDispatcher(mode=DispatchMode.THREAD_POOL,
+                                        max_workers=2)
+        tracker = CallbackTracker(dispatcher)
+
+        def callback(value):
+            release.wait(1.)
+            threads.append((value, threading.current_thread()))
+
+        try:
+            tracker.call(callback, (1,))
+            dispatcher.flush()
+            assert tracker.is_pending()
+
+            release.set()
+            dispatcher.shutdown(wait=True)
+            assert tracker.is_pending(), \
+                "Completion should only be reported by flush"
+            dispatcher.flush()
+            assert not tracker.is_pending()
+        finally:
+            dispatcher.shutdown()
+
+        assert threads[0][0] == 1
+        assert threads[0][1] is not threading.current_thread()
+
+    def test_invalid_mode(self):
+        with pytest.raises(ValueError):
+            CallbackDispatcher(mode=42)
+
+    def test_menu_bar_window(self):
+        msg = []
+        dispatcher = CallbackDispatcher()
+        item = MenuItem(name="Save", action=lambda: msg.append("saved"),
+                        shortcut="Ctrl+S")
+        menu_bar_window = MenuBarWindow(menu_bars=[MenuBar("File", [item])],
+                                        dispatcher=dispatcher)
+
+        menu_bar_window.dispatch_shortcut("s", ctrl=True)
+        assert menu_bar_window.is_pending(item)
+        dispatcher.flush()
+        assert not menu_bar_window.is_pending(item)
+        assert msg == ["saved"]
+
+
+class TestWidgetCoroutineCallbacks:
+
+    def test_button_pending(self):
+        event = None
+
+        async def callback():
+            await event.wait()
+
+        btn = Button(label="Async", btn_callback=callback)
+
+        async def scenario():
+            nonlocal event
+            event = asyncio.Event()
+            btn._callbacks.call(btn._btn_callback)
+            assert btn.pending
+            event.set()
+            await asyncio.sleep(0.01)
+            assert not btn.pending
+
+        asyncio.run(scenario())
+
+    def test_button_hold_while_pending(self):
+        impl, _, ctx = setup_imgui_context()
+        event = None
+        calls = []
+
+        async def callback():
+            calls.append("call")
+            await event.wait()
+
+        btn = Button(label="Async", btn_callback=callback, hold_while_pending=True)
+
+        def click():
+            io = imgui.get_io()
+            for mouse_down in (False, True, False):  # Hover, press, release
+                io.mouse_pos = (20., 30.)
+                io.mouse_down[0] = mouse_down
+                imgui.new_frame()
+                imgui.set_next_window_position(0., 0.)
+                imgui.set_next_window_size(400., 400.)
+                imgui.begin("Test")
+                btn.draw()
+                imgui.end()
+                imgui.render()
+
+        async def scenario():
+            nonlocal event
+            event = asyncio.Event()
+            click()
+            await asyncio.sleep(0)
+            assert btn.pending and calls == ["call"]
+            click()
+            await asyncio.sleep(0)
+            assert calls == ["call"], "a pending button must not start its callback again"
+            event.set()
+            await asyncio.sleep(0.01)
+            assert not btn.pending
+            click()
+            await asyncio.sleep(0)
+            assert calls == ["call", "call"]
+
+        try:
+            asyncio.run(scenario())
+        finally:
+            terminate_imgui_context(impl, ctx)
+
+    def test_menu_item_shortcut(self):
+        msg = []
+
+        async def save():
+            await asyncio.sleep(0)
+            msg.append("saved")
+
+        item = MenuItem(name="Save", action=save, shortcut="Ctrl+S")
+        menu_bar_window = MenuBarWindow(menu_bars=[MenuBar("File", [item])])
+
+        async def scenario():
+            assert menu_bar_window.dispatch_shortcut("s", ctrl=True)
+            assert menu_bar_window.is_pending(item)
+            await asyncio.sleep(0.01)
+            assert not menu_bar_window.is_pending(item)
+
+        asyncio.run(scenario())
+        assert msg == ["saved"]
+
+    def test_dispatched_coroutine(self):
+        msg = []
+        dispatcher = CallbackDispatcher(mode=DispatchMode.THREAD_POOL)
+
+        async def callback():
+            await asyncio.sleep(0)
+            msg.append("done")
+
+        btn = Button(label="Async", btn_callback=callback,
+                     dispatcher=dispatcher)
+
+        async def scenario():
+            btn._callbacks.call(btn._btn_callback)
+            dispatcher.shutdown(wait=True)
+            dispatcher.flush()
+            assert btn.pending, "Coroutine should be scheduled after dispatch"
+            await asyncio.sleep(0.01)
+            assert not btn.pending
+
+        asyncio.run(scenario())
+        assert msg == ["done"]
@@ -0,0 +1,139 @@
+import threading
+
+import imgui
+
+from pyimgui_utils import DragButtons, NodeTree
+from pyimgui_utils.channel import StateChannel
+from tests.utils import setup_imgui_context, terminate_imgui_context
+
+
+def _next_frame() -> None:
+    imgui.new_frame()
+    imgui.end_frame()
+
+
+class TestStateChannel:
+
+    def test_swap_once_per_frame(self):
+        impl, _, ctx = setup_imgui_context()
+
+        channel = StateChannel((1, 2, 3))
+        _next_frame()
+        assert channel.acquire() == (1, 2, 3)
+
+        channel.publish((4, 5, 6))
+        assert channel.acquire() == (1, 2, 3), "snapshot must not change within a frame"
+        assert channel.snapshot == (1, 2, 3)
+
+        _next_frame()
+        assert channel.acquire() == (4, 5, 6)
+
+        terminate_imgui_context(impl, ctx)
+
+    def test_set_and_drain(self):
+        impl, _, ctx = setup_imgui_context()
+
+        channel = StateChannel((1, 2, 3))
+        _next_frame()
+        channel.acquire()
+
+        setters = channel.setters(3)
+        assert channel.setters(3) == setters, "setters must be cached"
+        setters[1](20)
+        assert channel.acquire() == [1, 20, 3]
+        assert channel.snapshot == (1, 2, 3)
+
+        # A snapshot published before the drain does not override UI values
+        channel.publish((1, 2, 4))
+        _next_frame()
+        assert channel.acquire() == [1, 20, 4]
+
+        assert channel.drain() == [(1, 20)]
+        assert channel.drain() == []
+        channel.publish((1, 20, 4))
+        _next_frame()
+        assert channel.acquire() == (1, 20, 4)
+
+        terminate_imgui_context(impl, ctx)
+
+    def test_dict_snapshot(self):
+        impl, _, ctx = setup_imgui_context()
+
+        channel = StateChannel({"a": 1})
+        _next_frame()
+        channel.set("b", 2)
+        assert channel.acquire() == {"a": 1, "b": 2}
+        assert channel.snapshot == {"a": 1}
+
+        terminate_imgui_context(impl, ctx)
+
+    def test_threaded_producer(self):
+        impl, _, ctx = setup_imgui_context()
+
+        channel = StateChannel((0,))
+        stop = threading.Event()
+
+        def produce():
+            value = 0
+            while not stop.is_set():
+                for _, new_value in channel.drain():
+                    value = new_value
+                value += 1
+                channel.publish((value,))
+
+        producer = threading.Thread(target=produce)
+        producer.start()
+        try:
+            previous = 0
+            for _ in range(100):
+                _next_frame()
+                value, = channel.acquire()
+                assert value >= previous
+                previous = value
+            channel.set(0, -1000)
+            assert channel.acquire() == [-1000]
+        finally:
+            stop.set()
+            producer.join()
+
+        terminate_imgui_context(impl, ctx)
+
+    def test_concurrent_publish(self):
+        channel = StateChannel()
+
+        def produce():
+            for value in range(1000):
+                channel.publish((value,))
+
+        producers = [threading.Thread(target=produce) for _ in range(4)]
+        for producer in producers:
+            producer.start()
+        for producer in producers:
+            producer.join()
+        assert channel._latest[0] == 4000, "each publish must get its own version"
+
+    def test_widgets(self):
+        impl, _, ctx = setup_imgui_context()
+
+        values = StateChannel((1., 2.))
+        tree = StateChannel(("root",))
+        unpublished = StateChannel()
+        drag_buttons = DragButtons(drag_min=0., drag_max=10., btn_width=50.)
+        node_tree = NodeTree()
+
+        for _ in range(2):
+            imgui.new_frame()
+            imgui.begin("Test")
+            drag_buttons.draw(values)
+            node_tree.draw(tree,
+                           get_children=lambda el: [],
+                           get_name=lambda el: el)
+            # Channels without snapshot draw nothing
+            drag_buttons.draw(unpublished)
+            node_tree.draw(unpublished,
+                           get_children=lambda el: [],
+                           get_name=lambda el: el)
+            imgui.end()
+            imgui.render()
+
+        terminate_imgui_context(impl, ctx)
@@ -0,0 +1,27 @@
+from pyimgui_utils.clipper import visible_range
+
+
+class TestVisibleRange:
+
+    def test_visible_range(self):
+        assert visible_range(items_count=1000,
+                             items_height=10.,
+                             start_pos_y=0.,
+                             scroll_y=0.,
+                             window_height=100.) == (0, 11)
+
+        assert visible_range(items_count=1000,
+                             items_height=10.,
+                             start_pos_y=20.,
+                             scroll_y=500.,
+                             window_height=100.) == (48, 59)
+
+        assert visible_range(items_count=1000,
+                             items_height=10.,
+                             start_pos_y=0.,
+                             scroll_y=9990.,
+                             window_height=100.) == (999, 1000)
+
+    def test_empty_or_hidden_list(self):
+        assert visible_range(0, 10., 0., 0., 100.) == (0, 0)
+        assert visible_range(10, 10., 500., 0., 100.) == (0, 0)
@@ -203,3 +203,72 @@ class TestNodeTree:
             imgui.render()
         finally:
             terminate_imgui_context(impl, ctx)
+
+    def test_sort(self):
+        impl, _, ctx = setup_imgui_context()
+
+        class Element:
+
+            def __init__(self, name: str, size: int):
+                self.name = name
+                self.size = size
+                self.children = []
+
+        root = Element("root", 0)
+        root.children.extend([Element("b", 1), Element("c", 3), Element("a", 2)])
+        sorted_keys = []
+
+        def sort_key(el):
+            sorted_keys.append(el.name)
+            return el.name
+
+        elements = [root]
+        node_tree = NodeTree(sort_key=sort_key)
+
+        def draw(opened: bool = True, new_lists: bool = False) -> list:
+            """Names of the drawn children of root."""
+            drawn = []
+
+            def get_name(el):
+                drawn.append(el.name)
+                return el.name
+
+            imgui.new_frame()
+            imgui.begin("Test")
+            imgui.set_next_item_open(opened)
+            node_tree.draw(elements=elements,
+                           get_children=(lambda el: list(el.children)) if new_lists else (lambda el: el.children),
+                           get_name=get_name,
+                           is_leaf=lambda el: el is not root)
+            imgui.end()
+            imgui.render()
+            return drawn[1:]
+
+        try:
+            assert draw() == ["a", "b", "c"]
+            sorted_keys.clear()
+            assert draw() == ["a", "b", "c"]
+            assert sorted_keys == [], "the order must be cached"
+            assert draw(new_lists=True) == ["a", "b", "c"]
+            assert draw(new_lists=True) == ["a", "b", "c"]
+            assert sorted_keys == [], "the order must be cached for new lists of the same children"
+
+            root.children.append(Element("0", 4))
+            assert draw() == ["0", "a", "b", "c"], "children changed"
+
+            node_tree.set_sort(lambda el: el.size, reverse=True)
+            assert draw() == ["0", "c", "a", "b"]
+
+            # Changed in place: the cached order is kept until invalidated
+            root.children[0].size = 10
+            assert draw() == ["0", "c", "a", "b"]
+            node_tree.invalidate_order(root)
+            assert draw() == ["b", "0", "c", "a"]
+
+            draw(opened=False)
+            assert id(root) not in node_tree._orders, "orders of levels not drawn must be dropped"
+
+            node_tree.set_sort(None)
+            assert draw() == ["b", "c", "a", "0"]
+        finally:
+            terminate_imgui_context(impl, ctx)
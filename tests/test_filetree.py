@@ -0,0 +1,102 @@
+import os
+import time
+
+import imgui
+
+from pyimgui_utils import Button, FileTree
+from tests.utils import setup_imgui_context, terminate_imgui_context
+
+
+def _draw_frames(tree: FileTree, count: int = 1) -> None:
+    for _ in range(count):
+        imgui.new_frame()
+        imgui.begin("Test")
+        tree.draw()
+        imgui.end()
+        imgui.render()
+
+
+def _children(tree: FileTree, node) -> list:
+    """Children of node once the worker is done."""
+    deadline = time.monotonic() + 10.
+    while node.path in tree._tasks or tree.listing(node) is None:
+        assert time.monotonic() < deadline
+        tree.get_children(node)
+        time.sleep(.01)
+    return tree.get_children(node)
+
+
+class TestFileTree:
+
+    def test_listing(self, tmp_path):
+        (tmp_path / "b.txt").write_text("hello")
+        (tmp_path / "A.txt").write_text("")
+        (tmp_path / "sub").mkdir()
+        (tmp_path / ".hidden").write_text("")
+
+        impl, _, ctx = setup_imgui_context()
+        imgui.new_frame()
+
+        tree = FileTree(str(tmp_path), recheck_interval=0.)
+        children = _children(tree, tree.root)
+        assert [node.name for node in children] == ["sub", "A.txt", "b.txt"]
+        assert [node.is_dir for node in children] == [True, False, False]
+        assert children[2].size == 5
+        assert children[2].path == os.path.join(str(tmp_path), "b.txt")
+        assert tree.get_children(tree.root) is children, "listing must be cached"
+
+        tree.show_hidden = True
+        assert [node.name for node in tree.get_children(tree.root)][1] == ".hidden"
+
+        # A changed directory is listed again, nodes keep their identity
+        (tmp_path / "c.txt").write_text("")
+        os.utime(tmp_path, ns=(0, tree.listing(tree.root).mtime_ns + 10 ** 9))
+        imgui.end_frame()
+        imgui.new_frame()
+        tree.get_children(tree.root)
+        children_after = _children(tree, tree.root)
+        assert [node.name for node in children_after][-1] == "c.txt"
+        assert children_after[0] is children[0]
+
+        assert _children(tree, tree.get_children(tree.root)[0]) == []
+
+        imgui.end_frame()
+        tree.close()
+        terminate_imgui_context(impl, ctx)
+
+    def test_check_rate(self, tmp_path):
+        for index in range(20):
+            (tmp_path / f"dir{index}").mkdir()
+
+        impl, _, ctx = setup_imgui_context()
+        imgui.new_frame()
+
+        tree = FileTree(str(tmp_path), max_checks_per_frame=3, recheck_interval=0.)
+        directories = _children(tree, tree.root)
+        for directory in directories:
+            _children(tree, directory)
+
+        imgui.end_frame()
+        imgui.new_frame()
+        for directory in directories:
+            tree.get_children(directory)
+        assert tree._checks == 3
+
+        imgui.end_frame()
+        tree.close()
+        terminate_imgui_context(impl, ctx)
+
+    def test_draw(self, tmp_path):
+        (tmp_path / "sub").mkdir()
+        (tmp_path / "sub" / "file.txt").write_text("")
+        impl, _, ctx = setup_imgui_context()
+
+        opened = []
+        tree = FileTree(str(tmp_path), btns=[Button("Open", btn_callback=opened.append)])
+        _draw_frames(tree, 3)
+        _children(tree, tree.root)
+        _draw_frames(tree, 3)
+        assert opened == []
+
+        tree.close()
+        terminate_imgui_context(impl, ctx)
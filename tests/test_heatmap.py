@@ -0,0 +1,94 @@
+import imgui
+import numpy as np
+import pytest
+
+from pyimgui_utils.heatmap import Heatmap, colormap_lut
+from tests.utils import setup_imgui_context, terminate_imgui_context
+
+
+def _brute_force(data: np.ndarray, size: int, reduce) -> np.ndarray:
+    rows, columns = -(-data.shape[0] // size), -(-data.shape[1] // size)
+    return np.array([[reduce(data[row * size:(row + 1) * size, column * size:(column + 1) * size])
+                      for column in range(columns)] for row in range(rows)])
+
+
+class TestHeatmap:
+
+    def test_colormap_lut(self):
+        impl, _, ctx = setup_imgui_context()
+        imgui.new_frame()
+
+        lut = colormap_lut([(1, 0, 0), (0, .5, 1, .5)], size=3)
+        assert lut[0] == imgui.get_color_u32_rgba(1, 0, 0, 1)
+        assert lut[2] == imgui.get_color_u32_rgba(0, .5, 1, .5)
+
+        imgui.end_frame()
+        terminate_imgui_context(impl, ctx)
+
+        with pytest.raises(ValueError):
+            colormap_lut([(1, 0, 0)])
+
+    def test_levels(self):
+        data = np.random.rand(37, 21)
+        heatmap = Heatmap(data)
+        assert heatmap.level(0) is data
+        assert np.allclose(heatmap.level(2), _brute_force(data, 4, np.mean))
+        assert np.allclose(heatmap.level(3), _brute_force(data, 8, np.mean))
+
+        heatmap = Heatmap(data, reduce="max")
+        assert np.array_equal(heatmap.level(3), _brute_force(data, 8, np.max))
+
+        with pytest.raises(ValueError):
+            Heatmap(data, reduce="median")
+        with pytest.raises(ValueError):
+            Heatmap(np.zeros(3))
+
+    def test_dirty_regions(self):
+        data = np.random.rand(50, 40)
+        heatmap = Heatmap(data)
+        heatmap.level(1)
+        heatmap.level(4)
+
+        heatmap.set_region(13, 5, np.full((4, 30), 10.))
+        data[48:, 38:] = -1.
+        heatmap.mark_dirty(slice(48, None), slice(38, None))
+        assert len(heatmap._dirty) == 2
+
+        assert np.allclose(heatmap.level(1), _brute_force(data, 2, np.mean))
+        assert np.allclose(heatmap.level(4), _brute_force(data, 16, np.mean))
+        assert heatmap._dirty == []
+
+    def test_tile_rects(self):
+        data = np.zeros((100, 100))
+        data[:, 48:] = 1.
+        heatmap = Heatmap(data, tile_size=4.)
+
+        rects = heatmap.tile_rects(0., 0., 100., 100.)
+        assert len(rects) == 25 * 2, "tiles of a row with the same color must be merged"
+        assert rects[0][:4] == (0., 0., 48., 4.)
+        assert rects[-1][:4] == (48., 96., 100., 100.)
+        assert heatmap.tile_rects(0., 0., 100., 100.) is rects, "rects must be cached"
+
+        heatmap.zoom(10., 50., 50.)
+        assert heatmap.view == (45., 45., 55., 55.)
+        assert heatmap._tile_level(100., 100.) == 0
+        rects = heatmap.tile_rects(0., 0., 100., 100.)
+        assert len(rects) == 20
+        assert rects[0][:4] == (0., 0., 30., 10.)
+
+        heatmap.set_view(-10., 90., 10., 120.)
+        assert heatmap.view == (0., 70., 20., 100.)
+
+    def test_draw(self):
+        impl, _, ctx = setup_imgui_context()
+
+        heatmap = Heatmap(np.random.rand(2000, 2000), width=400.)
+        for frame in range(3):
+            heatmap.set_region(frame * 10, 0, np.random.rand(10, 2000))
+            imgui.new_frame()
+            imgui.begin("Test")
+            heatmap.draw()
+            imgui.end()
+            imgui.render()
+
+        terminate_imgui_context(impl, ctx)
@@ -0,0 +1,189 @@
+import logging
+import os
+
+import imgui
+import pytest
+
+from pyimgui_utils.log import FileSource, LogFilter, LogWindow, RingBufferSource, parse_level
+from tests.utils import setup_imgui_context, terminate_imgui_context
+
+
+class TestRingBufferSource:
+
+    def test_wrap(self):
+        source = RingBufferSource(capacity=3)
+        for i in range(5):
+            source.append(f"line {i}", logging.INFO if i % 2 else logging.ERROR)
+        source.append("a\nb")
+
+        assert (source.first_index, source.end_index) == (4, 7)
+        assert [source.get_line(i) for i in range(4, 7)] == [
+            (logging.ERROR, "line 4"), (logging.INFO, "a"), (logging.INFO, "b")]
+
+        with pytest.raises(ValueError):
+            RingBufferSource(capacity=0)
+
+
+class TestFileSource:
+
+    def test_incremental_index(self, tmp_path):
+        path = tmp_path / "app.log"
+        path.write_bytes(b"INFO first\nERROR second\nDEBUG partial")
+
+        source = FileSource(str(path), index_budget=8)
+        assert source.end_index == 0 and not source.is_indexed
+        while not source.is_indexed:
+            source.update()
+        assert source.end_index == 2
+        assert source.get_line(1) == (logging.ERROR, "ERROR second")
+
+        with open(path, "ab") as file:
+            file.write(b" line\r\nWARNING third\n")
+        source.index_budget = 1024
+        source.update()
+        assert source.end_index == 4
+        assert source.get_line(2) == (logging.DEBUG, "DEBUG partial line")
+
+        path.write_bytes(b"rotated\n")
+        source.update()
+        assert source.end_index == 1
+        assert source.get_line(0) == (logging.NOTSET, "rotated")
+
+    def test_truncated_file(self, tmp_path):
+        path = tmp_path / "app.log"
+        path.write_bytes(b"INFO line\n" * 10)
+        source = FileSource(str(path))
+        assert source.end_index == 10
+
+        # Truncated (copytruncate rotation) before the next update
+        os.truncate(path, 25)
+        assert source.get_line(1) == (logging.INFO, "INFO line")
+        with pytest.raises(IndexError):
+            source.get_line(2)
+        source.update()
+        assert source.end_index == 2
+
+    def test_missing_file(self, tmp_path):
+        source = FileSource(str(tmp_path / "missing.log"))
+        assert source.end_index == 0
+
+
+class TestLogFilter:
+
+    def test_filter(self):
+        assert parse_level("2024 WARNING app: x") == logging.WARNING
+        assert parse_level("WARNINGS") == logging.NOTSET
+
+        source = RingBufferSource(capacity=10_000)
+        for i in range(9000):
+            source.append(f"message {i}", logging.ERROR if i % 3 == 0 else logging.INFO)
+
+        log_filter = LogFilter(source, min_level=logging.ERROR, substring="MESSAGE 1")
+        log_filter.start()
+        log_filter._thread.join()
+        assert log_filter.done
+        assert list(log_filter.matches)[:3] == [12, 15, 18]
+
+        source.append("message 1 new", logging.ERROR)
+        log_filter.update()
+        assert log_filter.matches[-1] == 9000
+
+        # Matches of evicted lines are dropped
+        for i in range(20_000):
+            source.append("message 1", logging.ERROR)
+            log_filter.update()
+        assert len(log_filter.matches) <= 2 * source.capacity
+        assert log_filter.matches[-1] == source.end_index - 1
+
+
+    def test_evicted_lines(self):
+        source = RingBufferSource(capacity=3)
+        for i in range(5):
+            source.append(f"message {i}")
+        assert source.get_line(4) == (logging.INFO, "message 4")
+        with pytest.raises(IndexError):
+            source.get_line(1)
+
+    def test_filter_error(self):
+        class FailingSource(RingBufferSource):
+
+            def get_line(self, index):
+                if index == 5:
+                    raise ValueError("truncated")
+                return super().get_line(index)
+
+        source = FailingSource(capacity=100)
+        for i in range(10):
+            source.append(f"message {i}")
+
+        log_filter = LogFilter(source, substring="message")
+        log_filter.start()
+        log_filter._thread.join()
+        assert log_filter.done, "the filter must not stay running"
+        assert isinstance(log_filter.error, ValueError)
+        assert list(log_filter.matches) == [0, 1, 2, 3, 4]
+
+
+    def test_truncated_while_filtering(self, tmp_path):
+        path = tmp_path / "app.log"
+        path.write_bytes(b"INFO message\n" * 10_000)
+
+        class TruncatedSource(FileSource):
+
+            def get_line(self, index):
+                if index == 5000:
+                    os.truncate(path, 0)
+                return super().get_line(index)
+
+        log_filter = LogFilter(TruncatedSource(str(path)), substring="message")
+        log_filter.start()
+        log_filter._thread.join()
+        assert log_filter.done
+        assert isinstance(log_filter.error, IndexError)
+        assert list(log_filter.matches) == list(range(5000))
+
+
+class TestLogWindow:
+
+    def test_draw(self, tmp_path):
+        impl, _, ctx = setup_imgui_context()
+
+        log_window = LogWindow(capacity=100)
+        logger = logging.getLogger("test_log_window")
+        logger.addHandler(log_window.handler())
+        logger.setLevel(logging.DEBUG)
+        for i in range(200):
+            logger.warning("warning %d", i)
+            log_window.append(f"info {i}")
+        logger.handlers.clear()
+
+        path = tmp_path / "app.log"
+        path.write_text("INFO a\nERROR b\n")
+        file_window = LogWindow.tail(str(path))
+        with pytest.raises(TypeError):
+            file_window.append("x")
+
+        for _ in range(2):
+            imgui.new_frame()
+            log_window.draw()
+            file_window.draw()
+            imgui.render()
+
+        first, end, matches = log_window.visible_lines()
+        assert (first, end, matches) == (300, 400, None)
+
+        log_window.set_filter(logging.WARNING, "warning 19")
+        log_window._filter._thread.join()
+        first, end, matches = log_window.visible_lines()
+        lines = [log_window.source.get_line(matches[i]) for i in range(first, end)]
+        assert [line[1].split(": ")[-1] for line in lines] == [f"warning {i}" for i in range(190, 200)]
+        assert all(line[0] == logging.WARNING for line in lines)
+
+        imgui.new_frame()
+        log_window.draw()
+        imgui.render()
+
+        log_window.set_filter()
+        assert log_window.visible_lines()[2] is None
+
+        terminate_imgui_context(impl, ctx)
@@ -0,0 +1,104 @@
+import imgui
+import numpy as np
+import pytest
+
+from pyimgui_utils.nodegraph import NodeGraph
+from tests.utils import setup_imgui_context, terminate_imgui_context
+
+
+def _brute_force(graph: NodeGraph, rect) -> list:
+    minimums, maximums = graph.positions, graph.positions + graph.sizes
+    return np.flatnonzero((minimums[:, 0] <= rect[2]) & (maximums[:, 0] >= rect[0])
+                          & (minimums[:, 1] <= rect[3]) & (maximums[:, 1] >= rect[1])).tolist()
+
+
+class TestNodeGraph:
+
+    def test_grid_index(self):
+        rng = np.random.default_rng(0)
+        graph = NodeGraph(cell_size=100., capacity=4)
+        graph.add_nodes([f"node {index}" for index in range(2000)],
+                        rng.uniform(-5000., 5000., (2000, 2)), rng.uniform(10., 150., (2000, 2)))
+        assert graph.add_node("last", (0., 0.)) == 2000
+        assert graph.sizes[-1].tolist() == [120., 40.]
+
+        for rect in ((0., 0., 500., 300.), (-5000., -5000., 5000., 5000.), (123., 45., 124., 46.)):
+            assert graph.nodes_in_rect(rect).tolist() == _brute_force(graph, rect)
+
+        graph.move_node(5, (3000., 3000.))
+        assert graph.positions[5].tolist() == [3000., 3000.]
+        assert graph.nodes_in_rect((0., 0., 500., 300.)).tolist() == _brute_force(graph, (0., 0., 500., 300.))
+        assert 5 in graph.nodes_in_rect((3000., 3000., 3001., 3001.))
+        assert all(5 not in nodes for cell, nodes in graph._cells.items() if cell[0] < 30)
+
+        with pytest.raises(ValueError):
+            graph.positions[0] = 1.
+
+    def test_node_at(self):
+        graph = NodeGraph()
+        graph.add_node("a", (0., 0.), (100., 100.))
+        graph.add_node("b", (50., 50.), (100., 100.))
+        assert graph.node_at(10., 10.) == 0
+        assert graph.node_at(60., 60.) == 1, "topmost node must be hit"
+        assert graph.node_at(200., 10.) is None
+        assert graph.node_at(-10., -10.) is None
+
+    def test_links(self):
+        graph = NodeGraph(node_size=(10., 10.))
+        graph.add_nodes(["a", "b", "c"], [(0., 0.), (100., 0.), (1000., 1000.)])
+        graph.add_links([(0, 1), (1, 2)])
+        assert graph.links_in_rect((40., -10., 60., 10.)).tolist() == [0]
+        assert graph.links_in_rect((500., 500., 600., 600.)).tolist() == [1]
+
+        with pytest.raises(IndexError):
+            graph.add_link(0, 3)
+
+    def test_draw_and_drag(self):
+        impl, _, ctx = setup_imgui_context()
+
+        graph = NodeGraph(height=300.)
+        count = 5000
+        graph.add_nodes([str(index) for index in range(count)], np.random.uniform(0., 20_000., (count, 2)))
+        graph.add_links(np.random.randint(0, count, (count, 2)))
+        node = graph.add_node("dragged", (10., 10.))
+
+        io = imgui.get_io()
+        for frame in range(4):
+            # Mouse over the node, pressed from the second frame, then moved
+            io.mouse_pos = (40. + 10 * (frame == 3), 60.)
+            io.mouse_down[0] = frame > 0
+            imgui.new_frame()
+            imgui.set_next_window_position(0., 0.)
+            imgui.set_next_window_size(400., 400.)
+            imgui.begin("Test")
+            graph.draw()
+            imgui.end()
+            imgui.render()
+
+        assert graph.selected == node
+        assert graph.positions[node].tolist() == [20., 10.]
+
+        terminate_imgui_context(impl, ctx)
+
+    def test_instances_do_not_share_state(self):
+        impl, _, ctx = setup_imgui_context()
+
+        first, second = NodeGraph(height=100.), NodeGraph(height=100.)
+        io = imgui.get_io()
+        for frame in range(4):
+            # Pan the first graph only
+            io.mouse_pos = (40. + 10 * (frame == 3), 60.)
+            io.mouse_down[0] = frame > 0
+            imgui.new_frame()
+            imgui.set_next_window_position(0., 0.)
+            imgui.set_next_window_size(400., 400.)
+            imgui.begin("Test")
+            first.draw()
+            second.draw()
+            imgui.end()
+            imgui.render()
+
+        assert first.offset != (0., 0.)
+        assert second.offset == (0., 0.)
+
+        terminate_imgui_context(impl, ctx)
@@ -0,0 +1,109 @@
+import imgui
+
+from pyimgui_utils import (Command, CommandPalette, MenuBar, MenuBarWindow,
+                           MenuItem, MenuProvider)
+from pyimgui_utils.palette import CommandIndex
+from tests.utils import setup_imgui_context, terminate_imgui_context
+
+
+def names(index: CommandIndex, results):
+    return [index[command_id].name for command_id in results]
+
+
+class TestCommandIndex:
+
+    def test_search(self):
+        index = CommandIndex([Command(name, lambda: None)
+                              for name in ["Open file", "Save file",
+                                           "Close", "Reopen closed file",
+                                           "Preferences"]])
+
+        assert len(index.search("")) == 5
+        assert names(index, index.search("open")) == ["Open file",
+                                                      "Reopen closed file"]
+        assert names(index, index.search("ofl")) == ["Open file",
+                                                     "Reopen closed file"]
+        assert names(index, index.search("clo")) == ["Close",
+                                                     "Reopen closed file"]
+        assert index.search("xyz") == []
+
+    def test_incremental_refinement(self):
+        index = CommandIndex([Command(f"command {i}", lambda: None)
+                              for i in range(1000)], batch_size=10)
+
+        assert len(index.search("c")) == 10
+        assert index.has_more
+        assert len(index.more()) == 20
+
+        results = index.search("c99")
+        assert names(index, results)[:2] == ["command 99", "command 199"]
+
+        assert names(index, index.search("c999")) == ["command 999"]
+        assert not index.has_more
+
+        # Shortening the query restores the previous search
+        assert index.search("c99") == results
+
+
+class TestCommandPalette:
+
+    def test_commands(self):
+        msg = []
+        save = MenuItem(name="Save", action=lambda: msg.append("save"),
+                        shortcut="Ctrl+S")
+        recent = MenuProvider(
+            lambda: [MenuItem(name=f"recent_{i}.txt",
+                              action=lambda x=i: msg.append(x))
+                     for i in range(3)]
+        )
+        menu_bar_window = MenuBarWindow(menu_bars=[
+            MenuBar("File", [save],
+                    submenus=[MenuBar("Recent", provider=recent)])
+        ])
+        palette = CommandPalette(
+            menu_bar_window=menu_bar_window,
+            commands=[Command("Reload plugins", lambda: msg.append("reload"))]
+        )
+
+        palette.open()
+        assert palette.is_open
+        assert not recent.is_cached, "the palette must not generate provider items"
+        assert len(palette.results) == 2
+
+        # Generated items, e.g. when the menu is opened, are indexed on the next open
+        palette.close()
+        recent.items
+        palette.open()
+        assert len(palette.results) == 5
+
+        palette.set_query("recent_2")
+        assert palette.run_selected()
+        assert not palette.is_open
+
+        palette.open()
+        palette.set_query("reload")
+        palette.run_selected()
+
+        save.enabled = False
+        palette.open()
+        palette.set_query("file > save")
+        assert not palette.run_selected(), \
+            "Disabled menu item should not be run from the palette"
+        assert msg == [2, "reload"]
+
+    def test_draw(self):
+        impl, _, ctx = setup_imgui_context()
+
+        palette = CommandPalette(
+            commands=[Command(f"command {i}", lambda: None)
+                      for i in range(10000)]
+        )
+        palette.open()
+        palette.set_query("c1")
+
+        try:
+            imgui.new_frame()
+            palette.draw()
+            imgui.render()
+        finally:
+            terminate_imgui_context(impl, ctx)
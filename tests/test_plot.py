@@ -0,0 +1,80 @@
+import imgui
+import numpy as np
+import pytest
+
+from pyimgui_utils.plot import StreamingPlot
+from tests.utils import setup_imgui_context, terminate_imgui_context
+
+
+def _brute_force(samples: np.ndarray, columns: int):
+    """Reference decimation, over the raw samples."""
+    starts = (np.arange(columns) * len(samples)) // columns
+    return np.minimum.reduceat(samples, starts), np.maximum.reduceat(samples, starts)
+
+
+class TestStreamingPlot:
+
+    def test_ring_buffer(self):
+        plot = StreamingPlot(10, level_factor=2)
+        assert plot.capacity == 16, "capacity must be a multiple of the largest block size"
+
+        plot.extend(np.arange(10))
+        plot.append(10)
+        assert len(plot) == 11
+        assert plot.samples.tolist() == list(range(11))
+
+        plot.extend(np.arange(11, 30))
+        assert len(plot) == 16
+        assert plot.samples.tolist() == list(range(14, 30))
+
+        plot.extend(np.arange(30, 100))
+        assert plot.samples.tolist() == list(range(84, 100))
+
+        with pytest.raises(ValueError):
+            StreamingPlot(0)
+
+    def test_levels(self):
+        plot = StreamingPlot(1000)
+        rng = np.random.default_rng(0)
+        for chunk in (1, 7, 300, 64, 900, 3, 2000, 1):
+            plot.extend(rng.standard_normal(chunk))
+            plot._update_levels()
+
+            samples = plot.samples
+            offset = plot._count - len(plot)
+            for size, (mins, maxs) in zip(plot._block_sizes, plot._levels):
+                # Every complete block held in the buffer, and the last partial one
+                for block in range(-(-offset // size), -(-plot._count // size)):
+                    values = samples[max(block * size - offset, 0):(block + 1) * size - offset]
+                    assert mins[block % len(mins)] == values.min()
+                    assert maxs[block % len(maxs)] == values.max()
+
+    def test_decimate(self):
+        plot = StreamingPlot(4096)
+        samples = np.sin(np.arange(10_000) / 50.) + np.arange(10_000) % 7
+        plot.extend(samples)
+
+        mins, maxs = plot.decimate(256)
+        assert len(mins) == 256
+        expected_mins, expected_maxs = _brute_force(plot.samples, 256)
+        assert np.array_equal(mins, expected_mins)
+        assert np.array_equal(maxs, expected_maxs)
+
+        mins, maxs = plot.decimate(100_000)
+        assert np.array_equal(mins, plot.samples), "raw samples are used if fewer than columns"
+
+        assert len(StreamingPlot(10).decimate(100)[0]) == 0
+
+    def test_draw(self):
+        impl, _, ctx = setup_imgui_context()
+
+        plot = StreamingPlot(100_000, label="Test", height=50.)
+        for frame in range(3):
+            plot.extend(np.random.rand(40_000))
+            imgui.new_frame()
+            imgui.begin("Test")
+            plot.draw()
+            imgui.end()
+            imgui.render()
+
+        terminate_imgui_context(impl, ctx)
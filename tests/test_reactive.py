@@ -0,0 +1,170 @@
+import gc
+
+import imgui
+import pytest
+
+from pyimgui_utils import Button, DragButtons, MenuBar, MenuBarWindow, MenuItem
+from pyimgui_utils.reactive import Computed, Observable, value_of
+from tests.utils import setup_imgui_context, terminate_imgui_context
+
+
+class TestObservable:
+
+    def test_set_and_subscribe(self):
+        observable = Observable(1)
+        received = []
+        unsubscribe = observable.subscribe(received.append)
+
+        observable.value = 2
+        observable.set(2)  # Unchanged, not notified
+        observable.set(3)
+        assert received == [2, 3]
+
+        unsubscribe()
+        observable.set(4)
+        assert received == [2, 3]
+        assert observable.value == 4
+
+    def test_value_of(self):
+        assert value_of(Observable(True)) is True
+        assert value_of(False) is False
+
+
+class TestComputed:
+
+    def test_recompute_on_change_only(self):
+        calls = []
+        a = Observable(1)
+        b = Observable(2)
+
+        def compute():
+            calls.append(None)
+            return a.value + b.value
+
+        total = Computed(compute)
+        assert calls == [], "computed values must be lazy"
+        assert total.value == 3
+        assert total.value == 3
+        assert len(calls) == 1
+
+        a.set(10)
+        assert len(calls) == 1
+        assert total.value == 12
+        assert len(calls) == 2
+
+        with pytest.raises(TypeError):
+            total.set(0)
+
+    def test_chained_and_conditional(self):
+        flag = Observable(True)
+        a = Observable("a")
+        b = Observable("b")
+        selected = Computed(lambda: a.value if flag.value else b.value)
+        upper = Computed(lambda: selected.value.upper())
+
+        assert upper.value == "A"
+        b.set("c")  # Not a dependency while flag is True
+        assert not selected._dirty and not upper._dirty
+
+        flag.set(False)
+        assert upper.value == "C"
+        a.set("d")  # Not a dependency anymore
+        assert not upper._dirty
+
+    def test_subscribers_notified_on_change(self):
+        a = Observable(1)
+        is_positive = Computed(lambda: a.value > 0)
+        received = []
+        is_positive.subscribe(received.append)
+        assert is_positive.value
+
+        a.set(2)
+        assert received == []
+        a.set(-1)
+        assert received == [False]
+
+    def test_subscribers_of_unread_computed(self):
+        a = Observable(1)
+        doubled = Computed(lambda: a.value * 2)
+        received = []
+        doubled.subscribe(received.append)  # value is never read
+
+        a.set(2)
+        assert received == [4]
+        a.set(3)
+        assert received == [4, 6]
+
+    def test_array_values(self):
+        np = pytest.importorskip("numpy")
+        values = np.zeros(3)
+        a = Observable(values)
+        received = []
+        a.subscribe(received.append)
+        a.set(values)
+        assert received == [], "the same array is not a change"
+        a.set(np.ones(3))
+        assert len(received) == 1
+
+        b = Observable(np.zeros(3), equals=np.array_equal)
+        total = Computed(lambda: b.value.sum())
+        b.subscribe(received.append)
+        b.set(np.zeros(3))
+        assert len(received) == 1
+        b.set(np.ones(3))
+        assert len(received) == 2 and total.value == 3.
+
+    def test_dependents_are_weak(self):
+        a = Observable(1)
+        computed = Computed(lambda: a.value)
+        assert computed.value == 1
+        assert len(a._dependents) == 1
+
+        del computed
+        gc.collect()
+        assert len(a._dependents) == 0
+
+
+class TestBindings:
+
+    def test_widgets(self):
+        impl, _, ctx = setup_imgui_context()
+
+        opened = Observable(False)
+        calls = []
+
+        def is_held():
+            calls.append(None)
+            return opened.value
+
+        button = Button("Test", btn_callback=lambda: None, hold_condition=Computed(is_held))
+        drag_values = [Observable(1.), Observable(2.)]
+        drag_buttons = DragButtons(drag_min=0., drag_max=10.)
+        menu_bar_window = MenuBarWindow([MenuBar(
+            name="Menu",
+            menu_items=[MenuItem("Open", action=lambda: opened.set(True),
+                                 shortcut="Ctrl+O",
+                                 enabled=Computed(lambda: not opened.value))]
+        )])
+
+        for _ in range(3):
+            imgui.new_frame()
+            menu_bar_window.draw()
+            imgui.begin("Test")
+            button.draw()
+            drag_buttons.draw(drag_values)
+            imgui.end()
+            imgui.render()
+        assert len(calls) == 1, "hold condition must not be recomputed on each frame"
+
+        assert menu_bar_window.dispatch_shortcut("o", ctrl=True)
+        assert opened.value
+        assert not menu_bar_window.dispatch_shortcut("o", ctrl=True), "item must be disabled"
+
+        imgui.new_frame()
+        imgui.begin("Test")
+        button.draw()
+        imgui.end()
+        imgui.render()
+        assert len(calls) == 2
+
+        terminate_imgui_context(impl, ctx)
@@ -0,0 +1,150 @@
+import asyncio
+import time
+
+import imgui
+import pytest
+
+from typing_extensions import override
+
+from pyimgui_utils import AsyncRunner, BasicWindow, FrameRunner, FrameScheduler
+from tests.utils import setup_imgui_context, terminate_imgui_context
+
+
+class TestAsyncRunner:
+
+    def test_invalid_frame_rate(self):
+        with pytest.raises(ValueError):
+            AsyncRunner(draw=lambda: None,
+                        process_inputs=lambda: True,
+                        render=lambda: None,
+                        frame_rate=0)
+
+    def test_run(self):
+        impl, _, ctx = setup_imgui_context()
+        msg = []
+
+        async def background_task():
+            await asyncio.sleep(0)
+            msg.append("background")
+
+        def process_inputs() -> bool:
+            return runner.frame_count < 5
+
+        def draw() -> None:
+            if runner.frame_count == 0:
+                asyncio.ensure_future(background_task())
+            imgui.text("Hello World!")
+
+        runner = AsyncRunner(draw=draw,
+                             process_inputs=process_inputs,
+                             render=lambda: None,
+                             frame_rate=1000)
+        try:
+            runner.run()
+        finally:
+            terminate_imgui_context(impl, ctx)
+
+        assert runner.frame_count == 5
+        assert msg == ["background"], \
+            "Tasks should run between frames"
+
+
+class TestFrameRunner:
+
+    def test_idle(self):
+        impl, _, ctx = setup_imgui_context()
+        timeouts = []
+        msg = []
+
+        def wait_events(timeout) -> bool:
+            timeouts.append(timeout)
+            time.sleep(timeout)
+            return False
+
+        def on_timer():
+            msg.append("timer")
+            runner.stop()
+
+        runner = FrameRunner(draw=lambda: imgui.text("Hello World!"),
+                             process_inputs=lambda: True,
+                             render=lambda: None,
+                             wait_events=wait_events,
+                             frame_rate=1000,
+                             extra_frames=3)
+        runner.add_timer(0.05, on_timer)
+        try:
+            runner.run()
+        finally:
+            terminate_imgui_context(impl, ctx)
+
+        assert msg == ["timer"]
+        assert runner.stats.frames == 4, \
+            "Runner should only draw extra frames and the timer frame"
+        assert len(timeouts) == 1 and 0. < timeouts[0] <= 0.05
+        assert runner.stats.idle_time >= 0.04
+        assert runner.stats.frames_saved > 0
+
+    def test_mark_dirty(self):
+        impl, _, ctx = setup_imgui_context()
+        events = [False, True, False]
+
+        def wait_events(timeout) -> bool:
+            if not events:
+                runner.stop()
+                return False
+            if len(events) == 3:
+                runner.mark_dirty()
+            return events.pop(0)
+
+        runner = FrameRunner(draw=lambda: None,
+                             process_inputs=lambda: True,
+                             render=lambda: None,
+                             wait_events=wait_events,
+                             frame_rate=1000,
+                             extra_frames=2)
+        try:
+            runner.run()
+        finally:
+            terminate_imgui_context(impl, ctx)
+
+        # 2 extra frames, 1 dirty frame, 2 frames after the input event
+        assert runner.stats.frames == 5
+
+    def test_jobs(self):
+        impl, _, ctx = setup_imgui_context()
+        scheduler = FrameScheduler()
+
+        class Window(BasicWindow):
+
+            @override
+            def draw_content(self, *args, **kwargs):
+                imgui.text("Loading...")
+
+        window = Window("Test window")
+        window.scheduler = scheduler
+
+        def steps():
+            for index in range(20):
+                time.sleep(.005)  # Longer than the time slice, one step per frame
+                yield (index + 1) / 20
+
+        def wait_events(timeout) -> bool:
+            if timeout is None:
+                runner.stop()  # Idle for good
+            return False
+
+        runner = FrameRunner(draw=window.draw,
+                             process_inputs=lambda: True,
+                             render=lambda: None,
+                             wait_events=wait_events,
+                             frame_rate=1000,
+                             extra_frames=3,
+                             scheduler=scheduler)
+        job = window.submit_job(steps())
+        try:
+            runner.run()
+        finally:
+            terminate_imgui_context(impl, ctx)
+
+        assert job.done and job.progress == 1., "the runner must not idle while jobs are unfinished"
+        assert runner.stats.frames >= 20
@@ -0,0 +1,136 @@
+import time
+
+import imgui
+import pytest
+from typing_extensions import override
+
+from pyimgui_utils import FrameScheduler, ImGuiWindowAbstract
+from tests.utils import setup_imgui_context, terminate_imgui_context
+
+
+def _count(total: int, values: list, step_time: float = 0.):
+    for index in range(total):
+        values.append(index)
+        if step_time > 0:
+            time.sleep(step_time)
+        yield (index + 1) / total
+    return sum(values)
+
+
+class TestFrameScheduler:
+
+    def test_init(self):
+        with pytest.raises(ValueError):
+            FrameScheduler(frame_budget=0.)
+        with pytest.raises(ValueError):
+            FrameScheduler(share=2.)
+        assert FrameScheduler(frame_budget=.02, share=.5).time_slice == pytest.approx(.01)
+
+    def test_run_for(self):
+        scheduler = FrameScheduler()
+        values = []
+        results = []
+        job = scheduler.submit(_count(5, values), name="count", on_done=results.append)
+
+        assert scheduler.run_for(0.) == 1, "at least one step must run"
+        assert job.progress == pytest.approx(.2)
+        assert not job.done
+
+        scheduler.run_for(1.)
+        assert job.done and job.progress == 1.
+        assert job.result == 10 and results == [10]
+        assert job.steps == 6
+        assert len(scheduler) == 0
+
+    def test_round_robin(self):
+        scheduler = FrameScheduler()
+        first, second = [], []
+        scheduler.submit(_count(3, first))
+        scheduler.submit(_count(3, second))
+        for _ in range(4):
+            scheduler.run_for(0.)
+        assert first == [0, 1] and second == [0, 1], "jobs must run in turn"
+
+    def test_time_slice(self):
+        scheduler = FrameScheduler(frame_budget=.02, share=.5)
+        values = []
+        job = scheduler.submit(_count(100, values, step_time=.002))
+        scheduler.run_for(scheduler.time_slice)
+        assert 1 <= len(values) < 20
+        assert not job.done
+
+    def test_cancel_and_error(self):
+        scheduler = FrameScheduler()
+        values = []
+        job = scheduler.submit(_count(10, values), key="index")
+        scheduler.run_for(0.)
+        restarted = scheduler.submit(_count(2, values), key="index")
+        assert job.cancelled and scheduler.get("index") is restarted
+
+        def failing():
+            yield None
+            raise RuntimeError("failed")
+
+        results = []
+        failed = scheduler.submit(failing(), on_done=results.append)
+        scheduler.run_for(1.)
+        assert restarted.result == 1
+        assert isinstance(failed.error, RuntimeError) and results == [None]
+        assert len(scheduler) == 0
+
+    def test_failing_on_done(self):
+        scheduler = FrameScheduler()
+
+        def on_done(result):
+            raise RuntimeError("failed")
+
+        job = scheduler.submit(_count(1, []), on_done=on_done)
+        scheduler.run_for(1.)
+        assert job.done and job.result == 0
+        assert len(scheduler) == 0
+
+    def test_request_frame(self):
+        scheduler = FrameScheduler()
+        assert scheduler.next_frame_delay() is None
+        scheduler.request_frame(10.)
+        scheduler.request_frame(.01)
+        assert 0. < scheduler.next_frame_delay() <= .01, "the earliest request must be kept"
+        assert not scheduler.pop_frame_request()
+        time.sleep(.01)
+        assert scheduler.pop_frame_request()
+        assert scheduler.next_frame_delay() is None
+
+        scheduler.submit(_count(1, []))
+        assert scheduler.next_frame_delay() == 0., "unfinished jobs need frames"
+
+    def test_window(self):
+        impl, _, ctx = setup_imgui_context()
+
+        class Window(ImGuiWindowAbstract):
+
+            def __init__(self):
+                super().__init__()
+                self.scheduler = FrameScheduler()
+                self.values = []
+                self.job = self.submit_job(_count(3, self.values))
+                self.progress = []
+
+            @override
+            def _begin_statement_window(self):
+                return imgui.begin("Test window")
+
+            @override
+            def draw_content(self, *args, **kwargs):
+                self.progress.append(self.job.progress)
+
+        window = Window()
+        try:
+            for _ in range(2):
+                imgui.new_frame()
+                window.draw()
+                window.draw()  # Jobs run once per frame
+                imgui.render()
+            assert window.job.steps >= 1
+            assert window.progress[0] > 0., "jobs must run before draw_content"
+        finally:
+            terminate_imgui_context(impl, ctx)
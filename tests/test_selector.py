@@ -0,0 +1,96 @@
+import time
+
+import imgui
+import pytest
+
+from pyimgui_utils.selector import OptionFilter, VirtualCombo, VirtualListBox
+from tests.utils import setup_imgui_context, terminate_imgui_context
+
+_PARTS = [f"PN-{index:06d}-{'ABCD'[index % 4]}" for index in range(100_000)]
+
+
+def _results(options: OptionFilter) -> list:
+    while options.has_more:
+        options.more()
+    return [options.result(position) for position in range(options.result_count())]
+
+
+def _wait_index(options: OptionFilter) -> None:
+    deadline = time.perf_counter() + 30.
+    while not options.is_indexed and time.perf_counter() < deadline:
+        time.sleep(.01)
+    assert options.is_indexed
+
+
+class TestOptionFilter:
+
+    @pytest.mark.parametrize("background_index", [False, True])
+    def test_search(self, background_index):
+        options = OptionFilter(_PARTS, background_index=background_index)
+        if background_index:
+            _wait_index(options)
+
+        assert options.result_count() == len(_PARTS)
+        options.search("00012")
+        assert _results(options) == [index for index, part in enumerate(_PARTS) if "00012" in part]
+        options.search("0012-a")
+        assert _results(options) == list(range(12, 100_000, 10_000))
+        options.search("0001")
+        assert len(_results(options)) == sum("0001" in part for part in _PARTS)
+        options.search("")
+        assert options.result(5) == 5
+
+    def test_incremental(self):
+        options = OptionFilter(_PARTS, time_budget=0., background_index=False)
+        options.search("-b")
+        assert options.has_more, "the search must stop at the time budget"
+        assert options.result_count() < 25_000
+
+        # Narrowing an unfinished search keeps the unsearched options
+        options.search("-b")
+        options.search("9-b")
+        assert _results(options) == [index for index, part in enumerate(_PARTS) if "9-b" in part.lower()]
+
+        # Shortening restores the previous state
+        options.search("-b")
+        assert len(_results(options)) == 25_000
+
+    def test_callable_source(self):
+        calls = []
+
+        def item(index: int) -> str:
+            calls.append(index)
+            return f"item {index}"
+
+        options = OptionFilter(item, count=1000, background_index=False)
+        assert calls == [], "options must not be materialized"
+        options.search("99")
+        assert _results(options) == [99, 199, 299, 399, 499, 599, 699, 799, 899] + list(range(990, 1000))
+
+        with pytest.raises(ValueError):
+            OptionFilter(item)
+
+
+class TestVirtualSelectors:
+
+    def test_draw(self):
+        impl, _, ctx = setup_imgui_context()
+
+        selected = []
+        list_box = VirtualListBox(_PARTS, on_select=selected.append)
+        combo = VirtualCombo(_PARTS, label="Part", options=list_box.options)
+        list_box.set_query("-c")
+        for _ in range(2):
+            imgui.new_frame()
+            imgui.begin("Test")
+            list_box.draw()
+            combo.draw()
+            imgui.end()
+            imgui.render()
+
+        list_box.select(2)
+        assert selected == [2] and list_box.selected_label == "PN-000002-C"
+        combo.select(3)
+        assert combo.selected == 3
+
+        terminate_imgui_context(impl, ctx)
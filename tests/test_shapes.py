@@ -0,0 +1,65 @@
+import imgui
+import numpy as np
+import pytest
+
+from pyimgui_utils.shapes import ShapeBatch
+from tests.utils import setup_imgui_context, terminate_imgui_context
+
+
+class TestShapeBatch:
+
+    def test_add(self):
+        batch = ShapeBatch(capacity=2)
+        batch.add_square((0., 0.), .4, (1, 0, 0))
+        batch.add_squares(np.random.rand(10, 2), np.arange(10), np.random.rand(10, 4))
+        batch.add_line((0, 0), (1, 1), (0, 1, 0, .5), thickness=2.)
+        batch.add_circles([(0, 0), (1, 1)], 3., (0, 0, 1))
+        assert len(batch) == 14
+        assert batch._squares.params[0].tolist() == [0., 0., .4 * np.float32(1)]
+        assert batch._lines.colors[0].tolist() == [0, 255, 0, 128]
+
+        batch.clear()
+        assert len(batch) == 0
+        assert len(batch.vertices()[0]) == 0
+
+        with pytest.raises(ValueError):
+            batch.add_square((0., 0.), 1., (1, 0))
+        with pytest.raises(ValueError):
+            batch.add_lines(np.zeros((2, 2)), np.zeros((3, 2)), (1, 0, 0))
+
+    def test_vertices(self):
+        batch = ShapeBatch(circle_segments=8)
+        batch.add_square((1., 1.), 2., (1, 0, 0))
+        batch.add_line((0., 0.), (4., 0.), (0, 1, 0), thickness=2.)
+        batch.add_circle((0., 0.), 1., (0, 0, 1))
+
+        positions, colors = batch.vertices()
+        assert positions.shape == (6 + 6 + 8 * 3, 2) and positions.dtype == np.float32
+        assert colors.shape == (len(positions), 4) and colors.dtype == np.uint8
+        assert batch.vertices()[0] is positions, "vertices must be cached"
+
+        square = positions[:6]
+        assert square.min(axis=0).tolist() == [0., 0.] and square.max(axis=0).tolist() == [2., 2.]
+        line = positions[6:12]
+        assert line.min(axis=0).tolist() == [0., -1.] and line.max(axis=0).tolist() == [4., 1.]
+        circle = positions[12:].reshape(-1, 3, 2)
+        assert np.allclose(circle[:, 0], 0.)
+        assert np.allclose(np.linalg.norm(circle[:, 1:], axis=-1), 1.)
+        assert colors[12:].tolist() == [[0, 0, 255, 255]] * 24
+
+        batch.add_square((0., 0.), 1., (1, 1, 1))
+        assert len(batch.vertices()[0]) == len(positions) + 6
+
+    def test_render_draw_list(self):
+        impl, _, ctx = setup_imgui_context()
+
+        batch = ShapeBatch()
+        batch.add_squares(np.random.rand(20_000, 2) * 500, 4., (1, 0, 0))
+        batch.add_lines(np.random.rand(10, 2) * 500, np.random.rand(10, 2) * 500, (0, 1, 0))
+        batch.add_circles(np.random.rand(10, 2) * 500, 5., (0, 0, 1, .5))
+        for _ in range(2):
+            imgui.new_frame()
+            batch.render_draw_list()
+            imgui.render()
+
+        terminate_imgui_context(impl, ctx)
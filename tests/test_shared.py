@@ -0,0 +1,67 @@
+import multiprocessing
+
+import numpy as np
+import pytest
+
+from pyimgui_utils.shared import SharedArray
+
+
+def _simulate(params_name: str, state_name: str, steps: int) -> None:
+    params = SharedArray(2, name=params_name, create=False)
+    state = SharedArray(3, name=state_name, create=False)
+    for _ in range(steps):
+        speed, offset = params.read()
+        with state.write() as values:
+            values[:] = values + speed
+            values[0] = offset
+    params.close()
+    state.close()
+
+
+class TestSharedArray:
+
+    def test_attach(self):
+        with SharedArray((2, 3), dtype=np.int32) as array:
+            assert array.values.shape == (2, 3)
+            assert array.sequence == 0
+            assert not array.values.any()
+
+            attached = SharedArray((2, 3), dtype=np.int32, name=array.name, create=False)
+            attached.values[1, 2] = 5
+            assert array.values[1, 2] == 5, "values must share the same memory"
+            attached.close()
+
+            with pytest.raises(ValueError):
+                SharedArray(100, name=array.name, create=False)
+
+    def test_write_and_read(self):
+        with SharedArray(3) as array:
+            setters = array.setters()
+            assert array.setters() is setters
+            setters[1](2.5)
+            assert array.sequence == 2
+
+            with array.write() as values:
+                assert array.sequence % 2 == 1, "sequence must be odd during writes"
+                values[0] = 1.
+
+            out = np.empty(3)
+            assert array.read(out) is out
+            assert out.tolist() == [1., 2.5, 0.]
+            assert array.sequence == 4
+
+        with SharedArray((2, 2)) as array:
+            with pytest.raises(ValueError):
+                array.setters()
+
+    def test_other_process(self):
+        with SharedArray(2) as params, SharedArray(3) as state:
+            params.set(slice(None), (1., 10.))
+            process = multiprocessing.Process(target=_simulate,
+                                              args=(params.name, state.name, 5))
+            process.start()
+            process.join(10)
+
+            assert process.exitcode == 0
+            assert state.read().tolist() == [10., 5., 5.]
+            assert state.sequence == 10
@@ -0,0 +1,54 @@
+import pytest
+
+from pyimgui_utils.shortcut import KeyChord, ShortcutIndex, parse_chord
+
+
+class TestParseChord:
+
+    def test_parse_chord(self):
+        assert parse_chord("Ctrl+S") == KeyChord("S", ctrl=True)
+        assert parse_chord("ctrl+shift+s") == KeyChord("S", ctrl=True, shift=True)
+        assert parse_chord("Alt+F4") == KeyChord("F4", alt=True)
+        assert parse_chord("Cmd+Del") == KeyChord("DELETE", super=True)
+        assert parse_chord("Ctrl++") == KeyChord("+", ctrl=True)
+        assert parse_chord("Escape") == KeyChord("ESCAPE")
+
+    def test_parse_invalid_chord(self):
+        with pytest.raises(ValueError):
+            parse_chord("Hyper+S")
+
+        with pytest.raises(ValueError):
+            parse_chord("Ctrl+")
+
+        with pytest.raises(TypeError):
+            parse_chord(None)
+
+
+class TestShortcutIndex:
+
+    def test_dispatch(self):
+        msg = []
+        enabled = [True]
+        index = ShortcutIndex()
+        chord = index.register("Ctrl+S",
+                               lambda: msg.append("saved"),
+                               lambda: enabled[0])
+
+        assert len(index) == 1
+        assert chord in index
+        assert index.dispatch(KeyChord("S", ctrl=True))
+        assert not index.dispatch(KeyChord("S"))
+        assert msg == ["saved"]
+
+        enabled[0] = False
+        assert not index.dispatch(KeyChord("S", ctrl=True))
+        assert msg == ["saved"]
+
+    def test_first_registration_wins(self):
+        msg = []
+        index = ShortcutIndex()
+        index.register("Ctrl+S", lambda: msg.append(1))
+        index.register("ctrl+s", lambda: msg.append(2))
+
+        index.dispatch(parse_chord("Ctrl+S"))
+        assert msg == [1]
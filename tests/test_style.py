@@ -0,0 +1,133 @@
+import gc
+
+import imgui
+import pytest
+
+from pyimgui_utils import Button
+from pyimgui_utils.style import ButtonStyle, StyleStack, Theme, style_stack
+from tests.utils import DummyWindow, setup_imgui_context, terminate_imgui_context
+
+
+class TestTheme:
+
+    def test_precomputed_entries(self):
+        theme = Theme(colors={imgui.COLOR_BUTTON: (1, 0, 0)},
+                      style_vars={imgui.STYLE_ALPHA: 1, imgui.STYLE_ITEM_SPACING: [5, 0]})
+
+        assert theme.colors == ((imgui.COLOR_BUTTON, (1., 0., 0., 1.)),)
+        assert theme.style_vars == ((imgui.STYLE_ALPHA, 1.), (imgui.STYLE_ITEM_SPACING, (5., 0.)))
+        assert theme == Theme(colors={imgui.COLOR_BUTTON: (1., 0., 0., 1.)},
+                              style_vars={imgui.STYLE_ALPHA: 1., imgui.STYLE_ITEM_SPACING: (5, 0)})
+        assert len({theme, Theme(colors={imgui.COLOR_BUTTON: (1, 0, 0)},
+                                 style_vars={imgui.STYLE_ALPHA: 1,
+                                             imgui.STYLE_ITEM_SPACING: [5, 0]})}) == 1
+
+        with pytest.raises(ValueError):
+            Theme(colors={imgui.COLOR_BUTTON: (1, 0)})
+
+        with pytest.raises(ValueError):
+            Theme(style_vars={imgui.STYLE_ITEM_SPACING: (1, 0, 0)})
+
+
+class TestStyleStack:
+
+    def test_push_differences_only(self):
+        impl, _, ctx = setup_imgui_context()
+        imgui.new_frame()
+
+        stack = StyleStack()
+        red = Theme(colors={imgui.COLOR_BUTTON: (1, 0, 0)},
+                    style_vars={imgui.STYLE_ALPHA: .5})
+        red_green = Theme(colors={imgui.COLOR_BUTTON: (1, 0, 0),
+                                  imgui.COLOR_TEXT: (0, 1, 0)})
+
+        with stack.apply(red):
+            assert stack._frames[-1][:2] == (1, 1)
+            assert imgui.get_style().alpha == .5
+
+            with stack.apply(red_green):
+                assert stack._frames[-1][:2] == (1, 0), "active button color must be skipped"
+                assert tuple(imgui.get_style_color_vec_4(imgui.COLOR_TEXT)) == (0., 1., 0., 1.)
+
+            assert stack._active_colors == {imgui.COLOR_BUTTON: (1., 0., 0., 1.)}
+            assert stack.depth == 1
+
+        assert stack.depth == 0
+        assert stack._active_colors == {} and stack._active_vars == {}
+        assert imgui.get_style().alpha == 1.
+
+        with pytest.raises(RuntimeError):
+            stack.pop()
+
+        imgui.end_frame()
+        terminate_imgui_context(impl, ctx)
+
+    def test_button_and_window(self):
+        impl, _, ctx = setup_imgui_context()
+
+        window = DummyWindow()
+        window.add_theme(Theme(colors={imgui.COLOR_BUTTON: (0, 0, 1)}))
+        window.add_theme(Theme(style_vars={imgui.STYLE_FRAME_ROUNDING: 4}))
+        button = Button("Test", btn_callback=lambda: None,
+                        btn_color=(0, 0, 1), hold_condition=lambda: True)
+        window.draw_content = lambda *args, **kwargs: button.draw()
+
+        for _ in range(2):
+            imgui.new_frame()
+            window.draw()
+            imgui.render()
+
+        terminate_imgui_context(impl, ctx)
+
+
+    def test_exception_restores_stack(self):
+        impl, _, ctx = setup_imgui_context()
+
+        def fail(*args, **kwargs):
+            raise RuntimeError("failed")
+
+        window = DummyWindow()
+        window.add_theme(Theme(colors={imgui.COLOR_BUTTON: (0, 0, 1)}))
+        button = Button("Test", btn_callback=lambda: None, btn_color=(0, 1, 0), hold_condition=fail)
+        window.draw_content = lambda *args, **kwargs: button.draw()
+
+        imgui.new_frame()
+        with pytest.raises(RuntimeError):
+            window.draw()
+        assert style_stack.depth == 0, "pushed themes must be popped"
+        imgui.render()
+
+        terminate_imgui_context(impl, ctx)
+
+
+class TestButtonStyle:
+
+    def test_interned(self):
+        style = ButtonStyle(color=(1, 0, 0), hold_color=[0, 1, 0])
+        assert ButtonStyle(color=(1, 0, 0), color_hovered=(1, 0, 0),
+                           hold_color=(0, 1, 0)) is style
+        assert ButtonStyle(color=(0, 0, 1)) is not style
+        assert style.color_active == (1, 0, 0)
+        assert style.hold_color_hovered == (0, 1, 0)
+        assert style.theme.colors[0] == (imgui.COLOR_BUTTON, (1., 0., 0., 1.))
+        assert ButtonStyle().theme is None
+
+        with pytest.raises(AttributeError):
+            style.color = (0, 0, 0)
+
+    def test_unused_styles_are_dropped(self):
+        style = ButtonStyle(color=(.1, .2, .3), width=123)
+        key = (style.color, style.color_hovered, style.color_active, style.hold_color,
+               style.hold_color_hovered, style.hold_color_active, 123, 0)
+        assert ButtonStyle._interned[key] is style
+
+        del style
+        gc.collect()
+        assert key not in ButtonStyle._interned
+
+    def test_buttons_share_style(self):
+        buttons = [Button("", btn_callback=lambda: None, btn_color=(.5, 0., 0.), width=12)
+                   for _ in range(3)]
+        assert buttons[0]._style is buttons[1]._style is buttons[2]._style
+        assert buttons[0]._width == 12
+        assert not hasattr(buttons[0], "__dict__")
@@ -0,0 +1,75 @@
+import imgui
+import numpy as np
+import pytest
+
+from pyimgui_utils.table import DataTable
+from tests.utils import setup_imgui_context, terminate_imgui_context
+
+
+def _data() -> np.ndarray:
+    data = np.zeros(6, dtype=[("name", "U8"), ("group", "i4"), ("price", "f8")])
+    data["name"] = ["f", "e", "d", "c", "b", "a"]
+    data["group"] = [1, 0, 1, 0, 1, 0]
+    data["price"] = [3., 1., 2., 5., 4., 0.]
+    return data
+
+
+class TestDataTable:
+
+    def test_init(self):
+        data = _data()
+        table = DataTable(data, columns=["name", "price"])
+        assert table.row_count == 6
+        assert np.shares_memory(table._columns[0], data), "columns must be views"
+
+        table = DataTable({"a": np.arange(3), "b": np.arange(3) * 2.})
+        assert table._column_names == ["a", "b"]
+
+        with pytest.raises(TypeError):
+            DataTable(np.arange(3))
+        with pytest.raises(ValueError):
+            DataTable({"a": np.arange(3), "b": np.arange(4)})
+
+    def test_sort_and_filter(self):
+        table = DataTable(_data())
+
+        table.sort(((2, False),))
+        assert table.rows.tolist() == [5, 1, 2, 0, 4, 3]
+        table.sort(((2, True),))
+        assert table.rows.tolist() == [3, 4, 0, 2, 1, 5]
+        assert sorted(table._column_orders) == [(2, False), (2, True)], "sort indexes must be cached"
+
+        # Descending sorts are stable too
+        table.sort(((1, True),))
+        assert table.rows.tolist() == [0, 2, 4, 1, 3, 5]
+
+        table.sort(((1, True), (0, False)))
+        assert table.rows.tolist() == [4, 2, 0, 5, 3, 1]
+
+        table.set_filter(table._columns[2] > 1.)
+        assert table.rows.tolist() == [4, 2, 0, 3]
+        table.sort(())
+        assert table.rows.tolist() == [0, 2, 3, 4]
+        table.set_filter(None)
+        assert table.rows.tolist() == list(range(6))
+
+        with pytest.raises(ValueError):
+            table.set_filter(np.ones(3, dtype=bool))
+
+    def test_draw(self):
+        impl, _, ctx = setup_imgui_context()
+
+        size = 100_000
+        table = DataTable({"index": np.arange(size), "value": np.random.rand(size)},
+                          formats={"value": ".3f"}, height=200.)
+        table.sort(((1, False),))
+
+        for _ in range(2):
+            imgui.new_frame()
+            imgui.begin("Test")
+            table.draw()
+            imgui.end()
+            imgui.render()
+        assert table.sort_key == ((1, False),), "the default specs of the table must not replace sort"
+
+        terminate_imgui_context(impl, ctx)
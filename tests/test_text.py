@@ -0,0 +1,75 @@
+import imgui
+import pytest
+
+from pyimgui_utils import Button, DragButtons, NodeTree
+from pyimgui_utils.text import TextMetrics, text_metrics
+from tests.utils import setup_imgui_context, terminate_imgui_context
+
+
+class TestTextMetrics:
+
+    def test_cache(self):
+        impl, _, ctx = setup_imgui_context()
+        imgui.new_frame()
+
+        metrics = TextMetrics(max_size=2)
+        size = metrics.calc_text_size("Label")
+        assert size == tuple(imgui.calc_text_size("Label"))
+        assert metrics.calc_text_size("Label") == size
+        assert (metrics.hits, metrics.misses) == (1, 1)
+
+        assert metrics.text_width("Label##id") == size[0]
+        assert metrics.calc_text_size("Label", wrap_width=10.)[1] > size[1]
+        assert len(metrics) == 2, "least recently used size must be evicted"
+
+        metrics.calc_text_size("Label")
+        assert metrics.misses == 4, "wrap width must be part of the key"
+
+        with pytest.raises(ValueError):
+            TextMetrics(max_size=0)
+
+        imgui.end_frame()
+        terminate_imgui_context(impl, ctx)
+
+    def test_fonts_change(self):
+        impl, _, ctx = setup_imgui_context()
+        metrics = TextMetrics()
+
+        imgui.new_frame()
+        metrics.text_width("Label")
+        imgui.end_frame()
+
+        imgui.get_io().font_global_scale = 2.
+        imgui.new_frame()
+        assert metrics.text_width("Label") > 0
+        assert metrics.misses == 2, "cache must be cleared when fonts change"
+        imgui.end_frame()
+
+        terminate_imgui_context(impl, ctx)
+
+    def test_widgets_auto_width(self):
+        impl, _, ctx = setup_imgui_context()
+
+        button = Button("A long label", btn_callback=lambda: None, width=20, auto_width=True)
+        small_button = Button("A", btn_callback=lambda: None, width=50, auto_width=True)
+        drag_buttons = DragButtons(drag_min=0., drag_max=1., title="Title", auto_width=True)
+        node_tree = NodeTree(btns=[Button("D", btn_callback=lambda el: None)], auto_width=True)
+
+        try:
+            misses = [text_metrics.misses]
+            for _ in range(2):
+                imgui.new_frame()
+                imgui.begin("Test")
+                button.draw()
+                assert button.calc_width() > 20
+                small_button.draw()
+                assert small_button.calc_width() == 50
+                drag_buttons.draw([0., 1.], [lambda value: None] * 2)
+                node_tree.draw(["root"], get_children=lambda el: [], get_name=lambda el: el)
+                imgui.end()
+                imgui.render()
+                misses.append(text_metrics.misses)
+            assert misses[1] > misses[0], "widths must be measured on the first frame"
+            assert misses[2] == misses[1], "widths must not be measured again in steady state"
+        finally:
+            terminate_imgui_context(impl, ctx)
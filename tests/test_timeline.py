@@ -0,0 +1,89 @@
+import imgui
+import numpy as np
+import pytest
+
+from pyimgui_utils.timeline import Timeline, pack_color
+from tests.utils import setup_imgui_context, terminate_imgui_context
+
+
+class TestTimeline:
+
+    def test_query(self):
+        rng = np.random.default_rng(0)
+        starts = rng.uniform(0., 1000., 5000)
+        ends = starts + rng.exponential(5., 5000)
+        timeline = Timeline(["a", "b"])
+        timeline.add_intervals(0, starts[:3000], ends[:3000])
+        timeline.add_intervals(0, starts[3000:], ends[3000:])
+        timeline.add_interval(1, 10., 20.)
+        assert len(timeline) == 5001
+
+        lane = timeline._lanes[0]
+        for start, end in ((0., 1000.), (500., 510.), (-10., 0.), (999., 2000.), (3., 3.5)):
+            positions = lane.query(start, end)
+            expected = np.flatnonzero((starts < end) & (ends > start))
+            assert sorted(lane.ids[positions].tolist()) == expected.tolist()
+
+        assert timeline.view == (float(starts.min()), float(ends.max()))
+        assert timeline._lanes[1].ids.tolist() == [5000], "interval index must be global"
+
+        with pytest.raises(ValueError):
+            timeline.add_interval(0, 2., 1.)
+
+    def test_lane_bars(self):
+        timeline = Timeline(["a"], min_bar_width=2.)
+        # 1000 intervals of 0.01 in [0, 10), and one wide interval
+        timeline.add_intervals(0, np.arange(1000) / 100., np.arange(1000) / 100. + .01)
+        timeline.add_interval(0, 50., 80., color=pack_color((1., 0., 0., 1.)))
+        timeline.set_view(0., 100.)
+
+        bars, aggregates = timeline.lane_bars(0, 100.)
+        assert bars == [(50., 80., 0xFF0000FF, 1000)]
+        assert aggregates == [(0, 10)], "narrow intervals must be merged"
+
+        timeline.zoom(10., 0.)
+        assert timeline.view == (0., 10.)
+        bars, aggregates = timeline.lane_bars(0, 100.)
+        assert len(bars) == 0 and aggregates == [(0, 100)]
+
+        timeline.pan(75.)
+        bars, aggregates = timeline.lane_bars(0, 100.)
+        assert bars == [(0., 50., 0xFF0000FF, 1000)] and aggregates == []
+
+    def test_zoom_bounds(self):
+        timeline = Timeline(["a"], max_zoom_out=10.)
+        timeline.add_interval(0, 0., 100.)
+        for _ in range(5000):
+            timeline.zoom(.5)
+        start, end = timeline.view
+        assert end - start == pytest.approx(1000.)
+        timeline.lane_bars(0, 100.)
+
+        for _ in range(5000):
+            timeline.zoom(2.)
+        start, end = timeline.view
+        assert end > start
+        timeline.lane_bars(0, 100.)
+
+        with pytest.raises(ValueError):
+            timeline.set_view(-np.inf, np.inf)
+
+    def test_draw(self):
+        impl, _, ctx = setup_imgui_context()
+
+        count = 100_000
+        timeline = Timeline([f"lane {lane}" for lane in range(4)],
+                            labels=[f"job {index}" for index in range(count)])
+        starts = np.random.uniform(0., 10_000., count)
+        for lane in range(4):
+            timeline.add_intervals(lane, starts[lane::4], starts[lane::4] + np.random.rand(count // 4) * 50)
+
+        for frame in range(3):
+            imgui.new_frame()
+            imgui.begin("Test")
+            timeline.draw()
+            imgui.end()
+            imgui.render()
+            timeline.zoom(4.)
+
+        terminate_imgui_context(impl, ctx)
@@ -0,0 +1,193 @@
+import time
+
+import imgui
+import pytest
+
+from pyimgui_utils import (Button, CallbackDispatcher, FrameRunner, FrameScheduler, NodeTree,
+                           TooltipProvider)
+from tests.utils import setup_imgui_context, terminate_imgui_context
+
+
+class TestTooltipProvider:
+
+    def test_init(self):
+        with pytest.raises(ValueError):
+            TooltipProvider(str, max_size=0)
+
+    def test_memoize(self):
+        calls = []
+
+        def provider(value):
+            calls.append(value)
+            return f"value {value}"
+
+        tooltip = TooltipProvider(provider, max_size=2)
+        assert tooltip.get(1) == "value 1"
+        assert tooltip.get(1) == "value 1"
+        assert calls == [1], "tooltips must be memoized"
+
+        tooltip.get(2)
+        tooltip.get(1)
+        tooltip.get(3)  # Evicts 2, the least recently used
+        assert len(tooltip) == 2
+        tooltip.get(1)
+        tooltip.get(2)
+        assert calls == [1, 2, 3, 2]
+        assert (tooltip.hits, tooltip.misses) == (3, 4)
+
+        tooltip.invalidate(2)
+        tooltip.get(2)
+        assert calls[-1] == 2 and len(calls) == 5
+
+    def test_unhashable_arguments(self):
+        calls = []
+        tooltip = TooltipProvider(lambda values: calls.append(values) or str(len(values)))
+        values = [1, 2]
+        assert tooltip.get(values) == "2"
+        assert tooltip.get(values) == "2"
+        assert tooltip.get([1, 2]) == "2"
+        assert len(calls) == 2, "arguments are identified by id by default"
+
+        by_value = TooltipProvider(lambda values: calls.append(values) or "text", key=tuple)
+        by_value.get([3])
+        by_value.get([3])
+        assert len(calls) == 3
+
+    def test_ttl(self):
+        calls = []
+        tooltip = TooltipProvider(lambda value: calls.append(value) or "text", ttl=.05)
+        tooltip.get("a")
+        tooltip.get("a")
+        assert calls == ["a"]
+        time.sleep(.06)
+        tooltip.get("a")
+        assert calls == ["a", "a"], "expired tooltips must be computed again"
+
+    def test_dispatcher(self):
+        dispatcher = CallbackDispatcher()
+        tooltip = TooltipProvider(lambda value: f"value {value}", dispatcher=dispatcher, placeholder="wait")
+        assert tooltip.get(1) == "wait"
+        assert tooltip.get(1) == "wait"
+        assert dispatcher.flush() == 1, "the provider must be submitted once"
+        assert tooltip.get(1) == "value 1"
+
+    def test_delay(self):
+        impl, _, ctx = setup_imgui_context()
+        calls = []
+        tooltip = TooltipProvider(lambda value: calls.append(value) or "text", delay=.1)
+        button = Button("Details", btn_callback=lambda value: None, tooltip=tooltip)
+        node_tree = NodeTree(tooltip=TooltipProvider(lambda el: calls.append(el) or el, delay=0.))
+
+        try:
+            io = imgui.get_io()
+            for frame in range(12):
+                io.delta_time = 1. / 60
+                io.mouse_pos = (20., 30.) if frame < 10 else (300., 300.)
+                imgui.new_frame()
+                imgui.set_next_window_position(0., 0.)
+                imgui.set_next_window_size(400., 400.)
+                imgui.begin("Test")
+                button.draw("row")
+                node_tree.draw(elements=["leaf"], get_children=lambda el: [], get_name=str,
+                               is_leaf=lambda el: True)
+                imgui.end()
+                imgui.render()
+                if frame < 5:
+                    assert calls == [], "the provider must wait for the delay"
+            assert calls == ["row"], "the provider must be called once"
+        finally:
+            terminate_imgui_context(impl, ctx)
+
+    def test_node_tree_dict_elements(self):
+        impl, _, ctx = setup_imgui_context()
+        calls = []
+        node_tree = NodeTree(tooltip=TooltipProvider(lambda el: calls.append(el) or el["name"], delay=0.))
+        elements = [{"name": "row"}]
+
+        try:
+            io = imgui.get_io()
+            for _ in range(3):
+                io.mouse_pos = (20., 30.)
+                imgui.new_frame()
+                imgui.set_next_window_position(0., 0.)
+                imgui.set_next_window_size(400., 400.)
+                imgui.begin("Test")
+                node_tree.draw(elements=elements, get_children=lambda el: [], get_name=lambda el: el["name"],
+                               is_leaf=lambda el: True)
+                imgui.end()
+                imgui.render()
+            assert calls == elements
+        finally:
+            terminate_imgui_context(impl, ctx)
+
+    def test_buttons_without_arguments(self):
+        impl, _, ctx = setup_imgui_context()
+        texts = iter(["first", "second"])
+        tooltip = TooltipProvider(lambda: next(texts), delay=0.)
+        buttons = [Button("First", btn_callback=lambda: None, tooltip=tooltip),
+                   Button("Second", btn_callback=lambda: None, tooltip=tooltip)]
+
+        try:
+            io = imgui.get_io()
+            for frame in range(4):
+                io.mouse_pos = (20., 30.) if frame < 2 else (20., 30. + imgui.get_frame_height_with_spacing())
+                imgui.new_frame()
+                imgui.set_next_window_position(0., 0.)
+                imgui.set_next_window_size(400., 400.)
+                imgui.begin("Test")
+                for button in buttons:
+                    button.draw()
+                imgui.end()
+                imgui.render()
+            assert tooltip.get(item=buttons[0]) == "first"
+            assert tooltip.get(item=buttons[1]) == "second", "each button must have its own tooltip"
+        finally:
+            terminate_imgui_context(impl, ctx)
+
+    def test_idle_runner(self):
+        impl, _, ctx = setup_imgui_context()
+        scheduler = FrameScheduler()
+        calls = []
+        tooltip = TooltipProvider(lambda: calls.append("text") or "text", delay=.05)
+        tooltip.scheduler = scheduler
+        button = Button("Details", btn_callback=lambda: None, tooltip=tooltip)
+        last_time = time.perf_counter()
+
+        def process_inputs() -> bool:
+            # The mouse rests on the button, imgui time follows the wall clock
+            nonlocal last_time
+            io = imgui.get_io()
+            now = time.perf_counter()
+            io.delta_time = max(now - last_time, 1e-3)
+            last_time = now
+            io.mouse_pos = (20., 30.)
+            return True
+
+        def wait_events(timeout) -> bool:
+            if timeout is None:
+                runner.stop()  # Idle for good
+            else:
+                time.sleep(timeout)
+            return False
+
+        def draw():
+            imgui.set_next_window_position(0., 0.)
+            imgui.set_next_window_size(400., 400.)
+            imgui.begin("Test")
+            button.draw()
+            imgui.end()
+
+        runner = FrameRunner(draw=draw,
+                             process_inputs=process_inputs,
+                             render=lambda: None,
+                             wait_events=wait_events,
+                             frame_rate=1000,
+                             extra_frames=3,
+                             scheduler=scheduler)
+        try:
+            runner.run()
+        finally:
+            terminate_imgui_context(impl, ctx)
+
+        assert calls == ["text"], "the runner must wake up when the hover delay is spent"
+        assert runner.stats.frames < 10
@@ -3,7 +3,8 @@ import imgui
 import pytest
 from typing_extensions import override
 
-from pyimgui_utils import ImGuiWindowAbstract
+from pyimgui_utils import (ImGuiWindowAbstract, MenuBar, MenuBarWindow,
+                           MenuItem, MenuProvider)
 from pyimgui_utils.window import WindowStack, WindowStackOrientation
 from tests.utils import (setup_imgui_context, FixedSizeWindow,
                          terminate_imgui_context)
@@ -115,3 +116,121 @@ class TestWindowStack:
         expected_size = (expected_width, expected_height)
         assert vertical_stack.size == expected_size, \
             "Expected vertical stack size do not match with actual one."
+
+
+class TestMenuBarWindow:
+
+    def test_dispatch_shortcut(self):
+        msg = []
+        save = MenuItem(name="Save",
+                        action=lambda: msg.append("save"),
+                        shortcut="Ctrl+S")
+        close = MenuItem(name="Close",
+                         action=lambda: msg.append("close"),
+                         shortcut="Ctrl+W",
+                         enabled=False)
+        file_menu = MenuBar(name="File", menu_items=[save, close])
+        menu_bar_window = MenuBarWindow(menu_bars=[file_menu])
+
+        assert menu_bar_window.dispatch_shortcut("s", ctrl=True)
+        assert not menu_bar_window.dispatch_shortcut("s")
+        assert not menu_bar_window.dispatch_shortcut("", ctrl=True), "Unknown keys should be ignored"
+        assert not menu_bar_window.dispatch_shortcut("w", ctrl=True), \
+            "Disabled menu item action should not be called"
+
+        close.enabled = True
+        assert menu_bar_window.dispatch_shortcut("w", ctrl=True)
+
+        file_menu.enabled = False
+        assert not menu_bar_window.dispatch_shortcut("s", ctrl=True), \
+            "Menu item action of a disabled menu bar should not be called"
+        assert msg == ["save", "close"]
+
+    def test_invalidate_shortcuts(self):
+        msg = []
+        item = MenuItem(name="Quit", action=lambda: msg.append("quit"))
+        menu_bar_window = MenuBarWindow(menu_bars=[MenuBar("File", [item])])
+
+        assert not menu_bar_window.dispatch_shortcut("q", ctrl=True)
+
+        item.shortcut = "Ctrl+Q"
+        menu_bar_window.invalidate_shortcuts()
+        assert menu_bar_window.dispatch_shortcut("q", ctrl=True)
+
+        menu_bar_window.add_menu_bar(
+            MenuBar("Edit", [MenuItem(name="Undo",
+                                      action=lambda: msg.append("undo"),
+                                      shortcut="Ctrl+Z")])
+        )
+        assert menu_bar_window.dispatch_shortcut("z", ctrl=True)
+        assert msg == ["quit", "undo"]
+
+    def test_validate_on_registration(self):
+        with pytest.raises(TypeError):
+            MenuBarWindow(menu_bars=[MenuBar("File", [MenuItem(name=1)])])
+
+        menu_bar_window = MenuBarWindow()
+        with pytest.raises(TypeError):
+            menu_bar_window.add_menu_bar(
+                MenuBar("Edit", submenus=[MenuBar("Sub", [MenuItem(name=[1])])])
+            )
+
+    def test_menu_provider(self):
+        calls = []
+
+        def generate():
+            calls.append(1)
+            return (MenuItem(name=f"file_{i}.txt") for i in range(1000))
+
+        provider = MenuProvider(generate)
+        MenuBarWindow(menu_bars=[MenuBar("Recent files", provider=provider)])
+        assert not provider.is_cached, "Items should only be generated lazily"
+
+        assert len(provider.items) == 1000
+        assert len(provider.items) == 1000
+        assert calls == [1], "Generated items should be cached"
+
+        provider.invalidate()
+        assert not provider.is_cached
+        assert provider.items[0].name == "file_0.txt"
+        assert calls == [1, 1]
+
+        with pytest.raises(TypeError):
+            MenuProvider(lambda: [MenuItem(name=None)]).items
+
+    def test_draw(self):
+        impl, _, ctx = setup_imgui_context()
+
+        provider = MenuProvider(
+            lambda: [MenuItem(name=f"plugin {i}") for i in range(5000)]
+        )
+        menu_bar_window = MenuBarWindow(menu_bars=[
+            MenuBar("File",
+                    menu_items=[MenuItem(name=["Show", "Hide"])],
+                    submenus=[MenuBar("Plugins", provider=provider)])
+        ])
+
+        try:
+            imgui.new_frame()
+            menu_bar_window.draw()
+            imgui.render()
+        finally:
+            terminate_imgui_context(impl, ctx)
+
+        assert not provider.is_cached, \
+            "Closed menu should not generate its items"
+
+
+class TestMenuSlots:
+
+    def test_slots(self):
+        menu_item = MenuItem(name="Item", shortcut="Ctrl+O")
+        menu_bar = MenuBar(name="Menu", menu_items=[menu_item])
+
+        assert not hasattr(menu_item, "__dict__")
+        assert not hasattr(menu_bar, "__dict__")
+        assert menu_item.enabled and menu_bar.submenus == []
+        assert menu_bar == MenuBar(name="Menu", menu_items=[MenuItem(name="Item", shortcut="Ctrl+O")])
+
+        with pytest.raises(AttributeError):
+            menu_item.unknown = True
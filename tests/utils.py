@@ -1,12 +1,11 @@
 from typing import Any
 
-import glfw
 from glfw.GLFW import glfwTerminate
-from OpenGL.GL import GL_TRUE
 import imgui
 from imgui.integrations.glfw import GlfwRenderer
 
 from pyimgui_utils import BasicWindow
+from pyimgui_utils.backends.glfw_backend import GlfwBackend
 
 
 def setup_imgui_context() -> [GlfwRenderer, Any, Any]:
@@ -15,37 +14,16 @@ def setup_imgui_context() -> [GlfwRenderer, Any, Any]:
     Strongly inspired from the tests in pyimgui repo.
     Repo link: https://github.com/pyimgui/pyimgui/
     """
-
-    width, height = 800, 400
-    window_name = "TestImGuiWindowAbstract"
-
-    if not glfw.init():
-        print("Could not initialize OpenGL context")
-        exit(1)
-
-    # OS X supports only forward-compatible core profiles from 3.2
-    glfw.window_hint(glfw.CONTEXT_VERSION_MAJOR, 3)
-    glfw.window_hint(glfw.CONTEXT_VERSION_MINOR, 3)
-    glfw.window_hint(glfw.OPENGL_PROFILE, glfw.OPENGL_CORE_PROFILE)
-
-    glfw.window_hint(glfw.OPENGL_FORWARD_COMPAT, GL_TRUE)
-
-    # Create a windowed mode window and its OpenGL context
-    window = glfw.create_window(
-        width, height, window_name, None, None
-    )
-
-    if not window:
-        glfw.terminate()
-        print("Could not initialize Window")
+    backend = GlfwBackend(width=800,
+                          height=400,
+                          title="TestImGuiWindowAbstract")
+    try:
+        backend.setup()
+    except RuntimeError as error:
+        print(error)
         exit(1)
 
-    glfw.make_context_current(window)
-
-    ctx = imgui.create_context()
-    impl = GlfwRenderer(window)
-    impl.io.ini_file_name = None
-    return impl, window, ctx
+    return backend.impl, backend.window, backend.context
 
 
 def terminate_imgui_context(impl, ctx) -> None: